@@ -0,0 +1,320 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from random import choice, sample, seed
+from string import ascii_lowercase
+from time import perf_counter
+from timeit import repeat
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.game_context import create_game_context, use_game_context, get_teams_data
+from lingo.lingo_engine import new_game, submit_guess, get_current_team_ID
+from lingo.lingo_simulator import play_simulated_game
+from lingo.settings_snapshot import get_bingo_settings_snapshot
+from lingo.bingo.bingo_settings.bingo_settings_utils import get_bingo_settings, get_maximum_grabs_per_round
+from lingo.bingo.bingo_utils import get_bingo_board_for_team, get_initial_bingo_ball_pit, get_stringified_bingo_board_for_team, mark_number_on_bingo_board_for_team, get_bingo_board_total_filled_lines_amount_for_team, get_completed_bingo_lines_through_position_for_team, get_bingo_board_number_position_for_team, get_bingo_grab_result_for_team
+from lingo.wordle.wordle_feedback import get_numpy
+from lingo.wordle.wordle_utils import get_guess_letters_color_based_on_word_to_guess, is_valid_wordle_guess, get_stringified_current_wordle_round_board_for_team, get_current_wordle_round_word_to_guess_for_team
+from lingo.wordle.words.words_utils import get_words_of_length, set_words_of_length, draw_unused_word_of_length, get_remaining_words_amount_of_length
+
+# The root of the repository, where the results are written to by default
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DEFAULT_OUTPUT_PATH = os.path.join(REPOSITORY_DIRECTORY, "bench_output.txt")
+
+WORDS_LIST_SIZES = [500, 5_000, 50_000]
+BOARD_SIZES = [4, 8, 16]
+WORD_LENGTH = 5
+TEAM_ID = 0
+
+# Each benchmark is timed this many times, and the fastest time is kept, since slower times are caused by other processes and not by the game
+REPEATS_AMOUNT = 5
+CALLS_AMOUNT = 2_000
+GAMES_AMOUNT = 20
+
+# The share of the word deck which has been drawn before the late word draws are timed
+LATE_GAME_DRAWN_SHARE = 0.9
+
+
+###
+### GETTERS
+###
+
+
+def get_random_words_list(size: int) -> list[str]:
+    """
+        Returns a list of unique random words of the benchmark word length.
+    """
+
+    words = set()
+    while len(words) < size:
+        word = ''.join(choice(ascii_lowercase) for _ in range(WORD_LENGTH))
+        words.add(word)
+    return list(words)
+
+def get_time_per_call(operation: callable, calls_amount: int) -> float:
+    """
+        Returns the fastest time in microseconds of a single call of the operation, which is called the provided amount of times per repeat.
+    """
+
+    def call_operation() -> None:
+        for _ in range(calls_amount):
+            operation()
+
+    fastest_time = min(repeat(call_operation, number=1, repeat=REPEATS_AMOUNT))
+    return fastest_time / calls_amount * 1_000_000
+
+def get_git_commit() -> str | None:
+    """
+        Returns the short hash of the checked out commit, so results can be compared across commits.
+        If the repository or git isn't available, we return None.
+    """
+
+    try:
+        completed_process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed_process.stdout.strip()
+
+def get_result(benchmark: str, parameter: str, size: int, value: float, unit: str = "us") -> dict:
+    """
+        Returns a single benchmark result, which is written as one line of the output file.
+    """
+
+    result = {
+        "type": "result",
+        "benchmark": benchmark,
+        "parameter": parameter,
+        "size": size,
+        "unit": unit,
+        "value": round(value, 3)
+    }
+    return result
+
+
+###
+### BENCHMARKS
+###
+
+
+def benchmark_words_list(words_list_size: int) -> list[dict]:
+    """
+        Measure guess scoring, guess validation, late word draws, Wordle board stringification and whole headless games with a words list of the provided size.
+    """
+
+    words = get_random_words_list(words_list_size)
+    original_words = get_words_of_length(WORD_LENGTH)
+    set_words_of_length(WORD_LENGTH, words)
+
+    try:
+        with use_game_context(create_game_context()):
+            new_game()
+            team_ID = get_current_team_ID()
+            word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+
+            guesses = sample(words, CALLS_AMOUNT) if words_list_size >= CALLS_AMOUNT else [choice(words) for _ in range(CALLS_AMOUNT)]
+            guesses_iterator = iter(guesses * (REPEATS_AMOUNT + 1))
+            scoring_time = get_time_per_call(lambda: get_guess_letters_color_based_on_word_to_guess(next(guesses_iterator), word_to_guess), CALLS_AMOUNT)
+
+            # Half of the guesses are known words, and half of them can never be within the words list since they hold a digit
+            validated_guesses = []
+            for index, guess in enumerate(guesses):
+                validated_guesses.append(guess if index % 2 == 0 else guess[:-1] + "0")
+            validated_guesses_iterator = iter(validated_guesses * (REPEATS_AMOUNT + 1))
+            validation_time = get_time_per_call(lambda: is_valid_wordle_guess(next(validated_guesses_iterator), team_ID), CALLS_AMOUNT)
+
+            # Fill every row but the last one, so most of the board is shown with colors
+            for guess in guesses[:3]:
+                submit_guess(guess if guess != word_to_guess else guesses[3])
+            stringify_time = get_time_per_call(lambda: get_stringified_current_wordle_round_board_for_team(team_ID), CALLS_AMOUNT)
+
+        late_draw_time = time_late_word_draws()
+        game_time = time_headless_games()
+    finally:
+        set_words_of_length(WORD_LENGTH, original_words)
+
+    words_list_results = [
+        get_result("guess_scoring", "words", words_list_size, scoring_time),
+        get_result("guess_validation", "words", words_list_size, validation_time),
+        get_result("late_word_draw", "words", words_list_size, late_draw_time),
+        get_result("wordle_board_stringify", "words", words_list_size, stringify_time),
+        get_result("headless_game", "words", words_list_size, game_time, "ms")
+    ]
+    return words_list_results
+
+def time_late_word_draws() -> float:
+    """
+        Returns the fastest time in microseconds of drawing a word, after most words of the words list have been drawn within the game.
+    """
+
+    fastest_time = None
+    for _ in range(REPEATS_AMOUNT):
+        with use_game_context(create_game_context()):
+            new_game()
+            remaining_words_amount = get_remaining_words_amount_of_length(WORD_LENGTH)
+            late_draws_amount = max(1, int(remaining_words_amount * (1 - LATE_GAME_DRAWN_SHARE)))
+            for _ in range(remaining_words_amount - late_draws_amount):
+                draw_unused_word_of_length(WORD_LENGTH)
+
+            # Every word can only be drawn once, so each repeat times the draws of the remaining words of a new game
+            start_time = perf_counter()
+            for _ in range(late_draws_amount):
+                draw_unused_word_of_length(WORD_LENGTH)
+            draw_time = (perf_counter() - start_time) / late_draws_amount * 1_000_000
+
+        fastest_time = draw_time if fastest_time is None else min(fastest_time, draw_time)
+
+    return fastest_time
+
+def time_headless_games() -> float:
+    """
+        Returns the average time in milliseconds of a whole Lingo game which is played by the filtering bot with the headless engine.
+    """
+
+    total_game_time = 0
+    for _ in range(GAMES_AMOUNT):
+        with use_game_context(create_game_context()):
+            total_game_time += play_simulated_game(["filtering"])["durationMs"]
+
+    return total_game_time / GAMES_AMOUNT
+
+def benchmark_board_size(board_size: int) -> list[dict]:
+    """
+        Measure ball pit construction, line detection, the result of a grab and Bingo board stringification on a bingo board of the provided size.
+        Half of the numbers on the bingo board of the first team are marked before the line detection and stringification are timed.
+    """
+
+    bingo_settings = get_bingo_settings()
+    original_board_size = bingo_settings["board_size"]
+    bingo_settings["board_size"] = board_size
+
+    try:
+        with use_game_context(create_game_context()):
+            new_game()
+            bingo_board_data = get_teams_data()[TEAM_ID]["bingoBoard"]
+            ball_pit_time = get_time_per_call(lambda: get_initial_bingo_ball_pit(bingo_board_data), CALLS_AMOUNT)
+
+            numbers = [number for row in get_bingo_board_for_team(TEAM_ID) for number in row]
+            marked_numbers = sample(numbers, len(numbers) // 2)
+            for number in marked_numbers:
+                mark_number_on_bingo_board_for_team(TEAM_ID, number)
+
+            line_detection_time = get_time_per_call(lambda: get_bingo_board_total_filled_lines_amount_for_team(TEAM_ID), CALLS_AMOUNT)
+
+            marked_positions = [get_bingo_board_number_position_for_team(TEAM_ID, number) for number in marked_numbers]
+            marked_positions_iterator = iter(marked_positions * (CALLS_AMOUNT * (REPEATS_AMOUNT + 1) // len(marked_positions) + 1))
+            position_line_detection_time = get_time_per_call(lambda: get_completed_bingo_lines_through_position_for_team(TEAM_ID, next(marked_positions_iterator)), CALLS_AMOUNT)
+
+            grab_result_time = get_time_per_call(lambda: get_bingo_grab_result_for_team(TEAM_ID, "green", 1), CALLS_AMOUNT)
+            stringify_time = get_time_per_call(lambda: get_stringified_bingo_board_for_team(TEAM_ID), CALLS_AMOUNT)
+    finally:
+        bingo_settings["board_size"] = original_board_size
+
+    board_size_results = [
+        get_result("ball_pit_construction", "board", board_size, ball_pit_time),
+        get_result("line_detection_full_board", "board", board_size, line_detection_time),
+        get_result("line_detection_through_position", "board", board_size, position_line_detection_time),
+        get_result("bingo_grab_result", "board", board_size, grab_result_time),
+        get_result("bingo_board_stringify", "board", board_size, stringify_time)
+    ]
+    return board_size_results
+
+def benchmark_settings_reads() -> list[dict]:
+    """
+        Measure reading a single setting through its settings getter, and through the settings snapshot of the game context which the hot paths read instead.
+    """
+
+    with use_game_context(create_game_context()):
+        new_game()
+        settings_getter_time = get_time_per_call(lambda: get_maximum_grabs_per_round(), CALLS_AMOUNT)
+        settings_snapshot_time = get_time_per_call(lambda: get_bingo_settings_snapshot()["maximumGrabsPerRound"], CALLS_AMOUNT)
+
+    settings_reads_results = [
+        get_result("settings_read_getter", "settings", 1, settings_getter_time),
+        get_result("settings_read_snapshot", "settings", 1, settings_snapshot_time)
+    ]
+    return settings_reads_results
+
+
+###
+### UTILITIES
+###
+
+
+def read_results(results_path: str) -> dict:
+    """
+        Read the results of a previous run, keyed by the benchmark, the parameter and the size of each result.
+    """
+
+    results = {}
+    with open(results_path, encoding="utf-8") as results_file:
+        for line in results_file:
+            result = json.loads(line)
+            if result["type"] == "result":
+                results[(result["benchmark"], result["parameter"], result["size"])] = result
+    return results
+
+def write_results(results_path: str, run_info: dict, results: list[dict]) -> None:
+    """
+        Write the run information and every result as JSON lines, so results of different commits can be compared by tools as well as by `--compare`.
+    """
+
+    with open(results_path, "w", encoding="utf-8") as results_file:
+        results_file.write(json.dumps(run_info) + "\n")
+        for result in results:
+            results_file.write(json.dumps(result) + "\n")
+
+def run_benchmark() -> None:
+    """
+        Run every benchmark of the suite, print the results and write them to the output file.
+        When the results of a previous run are provided, we also show how much slower or faster each benchmark has become.
+        E.g. `python benchmarks/benchmark_suite.py --compare previous_bench_output.txt`
+    """
+
+    parser = ArgumentParser(description="Run the Lingo benchmark suite.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="The file to which the results are written as JSON lines.")
+    parser.add_argument("--compare", default=None, help="The output file of a previous run to compare the results with.")
+    arguments = parser.parse_args()
+
+    previous_results = read_results(arguments.compare) if arguments.compare is not None else {}
+
+    seed(0)
+    run_info = {
+        "type": "run",
+        "commit": get_git_commit(),
+        "python": platform.python_version(),
+        "numpy": get_numpy() is not None,
+        "startedAt": datetime.now(timezone.utc).isoformat(timespec="seconds")
+    }
+    print(f"Python {run_info['python']}, commit {run_info['commit']}, NumPy {'enabled' if run_info['numpy'] else 'disabled'}.")
+    print(f"{'benchmark':>32} {'size':>12} {'time':>12} {'previous':>12} {'change':>8}")
+
+    results = []
+    for words_list_size in WORDS_LIST_SIZES:
+        results.extend(benchmark_words_list(words_list_size))
+    for board_size in BOARD_SIZES:
+        results.extend(benchmark_board_size(board_size))
+    results.extend(benchmark_settings_reads())
+
+    for result in sorted(results, key=lambda result: (result["benchmark"], result["size"])):
+        time_text = f"{result['value']:.2f} {result['unit']}"
+        previous_result = previous_results.get((result["benchmark"], result["parameter"], result["size"]))
+        previous_text = ""
+        change_text = ""
+        if previous_result is not None and previous_result["value"] > 0:
+            previous_text = f"{previous_result['value']:.2f} {previous_result['unit']}"
+            change_text = f"{(result['value'] / previous_result['value'] - 1) * 100:+.0f}%"
+        size_text = f"{result['parameter']}={result['size']}"
+        print(f"{result['benchmark']:>32} {size_text:>12} {time_text:>12} {previous_text:>12} {change_text:>8}")
+
+    write_results(arguments.output, run_info, results)
+    print(f"\nThe results have been written to {arguments.output}.")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,65 @@
+import os
+import sys
+from random import seed, shuffle
+from time import perf_counter
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.bingo.bingo_settings.bingo_settings_utils import get_bingo_settings
+from lingo.bingo.bingo_utils import get_bingo_board_for_team, get_stringified_bingo_board_for_team, mark_number_on_bingo_board_for_team
+from lingo.game_context import create_game_context, get_teams_data, use_game_context
+from lingo.lingo_utils import initialize_teams_data
+
+BOARD_SIZES = [4, 5, 10, 15, 20, 25]
+TEAM_ID = 0
+
+def time_prints_after_grabs(keep_rendered_board: bool) -> float:
+    """
+        Returns the mean time in microseconds to print the bingo board after each grabbed number, until every number has been marked.
+        When the rendered board isn't kept, every print renders the whole board again, like before the render cache.
+    """
+
+    with use_game_context(create_game_context()):
+        initialize_teams_data()
+        bingo_board_data = get_teams_data()[TEAM_ID]["bingoBoard"]
+
+        numbers = []
+        for row in get_bingo_board_for_team(TEAM_ID):
+            numbers.extend(row)
+        shuffle(numbers)
+
+        get_stringified_bingo_board_for_team(TEAM_ID)
+        elapsed_time = 0
+        for number in numbers:
+            mark_number_on_bingo_board_for_team(TEAM_ID, number)
+            if not keep_rendered_board:
+                bingo_board_data["renderedBoard"] = None
+
+            start_time = perf_counter()
+            get_stringified_bingo_board_for_team(TEAM_ID)
+            elapsed_time += perf_counter() - start_time
+
+    return elapsed_time / len(numbers) * 1_000_000
+
+def run_benchmark() -> None:
+    """
+        Measure how long printing the bingo board takes after each grab, with and without reusing the rendered board.
+    """
+
+    seed(0)
+    bingo_settings = get_bingo_settings()
+    original_board_size = bingo_settings["board_size"]
+
+    print(f"{'board':>7} {'full render (us)':>17} {'cached (us)':>12} {'speedup':>8}")
+    try:
+        for board_size in BOARD_SIZES:
+            bingo_settings["board_size"] = board_size
+            full_render_time = time_prints_after_grabs(False)
+            cached_time = time_prints_after_grabs(True)
+            print(f"{f'{board_size}x{board_size}':>7} {full_render_time:>17.1f} {cached_time:>12.1f} {full_render_time / cached_time:>7.1f}x")
+    finally:
+        bingo_settings["board_size"] = original_board_size
+
+if __name__ == "__main__":
+    run_benchmark()
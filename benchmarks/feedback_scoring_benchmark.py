@@ -0,0 +1,67 @@
+import os
+import sys
+from random import choice, seed
+from string import ascii_lowercase
+from time import perf_counter
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.wordle.wordle_feedback import get_numpy, get_feedback_pattern, get_feedback_patterns_for_guesses, get_feedback_patterns_for_pairs
+
+WORDS_LIST_SIZES = [100, 500, 2_000]
+PAIRS_AMOUNT = 100_000
+WORD_LENGTH = 5
+
+def get_random_words_list(size: int) -> list[str]:
+    """
+        Returns a sorted list of unique random words of the benchmark word length.
+    """
+
+    words = set()
+    while len(words) < size:
+        word = ''.join(choice(ascii_lowercase) for _ in range(WORD_LENGTH))
+        words.add(word)
+    return sorted(words)
+
+def run_benchmark() -> None:
+    """
+        Measure how much faster the batch scoring is than scoring each guess and word separately.
+    """
+
+    seed(0)
+    print(f"Batch scoring with {'NumPy' if get_numpy() is not None else 'pure Python'}.")
+    print(f"{'words':>8} {'patterns':>12} {'one by one (ms)':>16} {'batch (ms)':>11}")
+    for words_list_size in WORDS_LIST_SIZES:
+        words = get_random_words_list(words_list_size)
+
+        start_time = perf_counter()
+        for guess in words:
+            for word_to_guess in words:
+                get_feedback_pattern(guess, word_to_guess)
+        one_by_one_time = (perf_counter() - start_time) * 1000
+
+        start_time = perf_counter()
+        get_feedback_patterns_for_guesses(words, words)
+        batch_time = (perf_counter() - start_time) * 1000
+
+        print(f"{words_list_size:>8} {words_list_size * words_list_size:>12} {one_by_one_time:>16.1f} {batch_time:>11.1f}")
+
+    # Score random pairs, like the guesses of many played rounds against their word to guess
+    words = get_random_words_list(WORDS_LIST_SIZES[-1])
+    guesses = [choice(words) for _ in range(PAIRS_AMOUNT)]
+    words_to_guess = [choice(words) for _ in range(PAIRS_AMOUNT)]
+
+    start_time = perf_counter()
+    for guess, word_to_guess in zip(guesses, words_to_guess):
+        get_feedback_pattern(guess, word_to_guess)
+    one_by_one_time = (perf_counter() - start_time) * 1000
+
+    start_time = perf_counter()
+    get_feedback_patterns_for_pairs(guesses, words_to_guess)
+    batch_time = (perf_counter() - start_time) * 1000
+
+    print(f"{'pairs':>8} {PAIRS_AMOUNT:>12} {one_by_one_time:>16.1f} {batch_time:>11.1f}")
+
+if __name__ == "__main__":
+    run_benchmark()
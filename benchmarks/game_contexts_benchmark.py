@@ -0,0 +1,51 @@
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.game_context import create_game_context, use_game_context
+from lingo.lingo_engine import new_game, submit_guess, get_current_team_ID
+from lingo.wordle.wordle_utils import get_current_wordle_round_word_to_guess_for_team
+
+GAME_CONTEXTS_AMOUNTS = [1, 10, 100, 1000]
+
+def start_games(game_contexts_amount: int) -> list[dict]:
+    """
+        Returns the provided amount of game contexts, each holding a started game where the first team has guessed their first word.
+    """
+
+    game_contexts = []
+    for _ in range(game_contexts_amount):
+        game_context = create_game_context()
+        with use_game_context(game_context):
+            new_game()
+            word_to_guess = get_current_wordle_round_word_to_guess_for_team(get_current_team_ID())
+            submit_guess(word_to_guess)
+        game_contexts.append(game_context)
+    return game_contexts
+
+def run_benchmark() -> None:
+    """
+        Measure the memory used by many concurrent game contexts, to show that it grows linearly with the amount of games.
+    """
+
+    # Start a single game first, so memory which is only allocated once (e.g. the words index) isn't counted
+    start_games(1)
+
+    print(f"{'games':>8} {'memory (KiB)':>14} {'per game (KiB)':>16} {'start time (ms)':>17}")
+    for game_contexts_amount in GAME_CONTEXTS_AMOUNTS:
+        tracemalloc.start()
+        start_time = perf_counter()
+        game_contexts = start_games(game_contexts_amount)
+        elapsed_time = (perf_counter() - start_time) * 1000
+        used_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        used_memory_kib = used_memory / 1024
+        print(f"{len(game_contexts):>8} {used_memory_kib:>14.1f} {used_memory_kib / game_contexts_amount:>16.2f} {elapsed_time:>17.1f}")
+
+if __name__ == "__main__":
+    run_benchmark()
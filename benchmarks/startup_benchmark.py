@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+from statistics import median
+
+# The root of the repository, from which the lingo package is imported
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# The modules whose cold import time is measured, which are the entry points of the game and of the command line tools
+MODULES = ["lingo.lingo", "lingo.lingo_engine", "lingo.lingo_simulator"]
+RUNS_AMOUNT = 15
+SLOWEST_IMPORTS_AMOUNT = 8
+
+def get_import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+        Returns the self and cumulative import time in microseconds of every module imported by a fresh interpreter which imports the specified module.
+        The times are read from the `-X importtime` output of the interpreter.
+    """
+
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPOSITORY_DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    # Each line looks like "import time:       412 |      13391 | lingo.lingo", after a single header line
+    import_times = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_time, cumulative_time, imported_module = line[len("import time:"):].split("|")
+        import_times[imported_module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+def run_benchmark() -> None:
+    """
+        Measure the cold import time of each entry point, and show which imports take the longest.
+        Every run starts a fresh interpreter, so nothing is imported yet.
+    """
+
+    print(f"Python {sys.version.split()[0]}, median of {RUNS_AMOUNT} runs.")
+    print(f"{'module':>24} {'import (ms)':>12} {'modules':>8}")
+
+    slowest_imports = {}
+    for module in MODULES:
+        cumulative_times = []
+        for _ in range(RUNS_AMOUNT):
+            import_times = get_import_times(module)
+            cumulative_times.append(import_times[module][1])
+
+            for imported_module, (self_time, _) in import_times.items():
+                slowest_imports.setdefault(imported_module, []).append(self_time)
+
+        print(f"{module:>24} {median(cumulative_times) / 1000:>12.1f} {len(import_times):>8}")
+
+    print(f"\nSlowest imports by median self time (ms):")
+    median_self_times = sorted(((median(self_times), imported_module) for imported_module, self_times in slowest_imports.items()), reverse=True)
+    for self_time, imported_module in median_self_times[:SLOWEST_IMPORTS_AMOUNT]:
+        print(f"{imported_module:>40} {self_time / 1000:>8.2f}")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,59 @@
+import os
+import sys
+from random import choice, seed
+from string import ascii_lowercase
+from time import perf_counter
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.wordle.wordle_feedback import get_numpy, get_feedback_pattern, decode_feedback_pattern
+from lingo.wordle.wordle_solver import create_solver_state, apply_guess_to_solver_state, get_suggested_guess
+
+WORDS_LIST_SIZES = [500, 2_000, 10_000]
+WORD_LENGTH = 5
+ROUNDS_AMOUNT = 20
+
+def get_random_words_list(size: int) -> list[str]:
+    """
+        Returns a sorted list of unique random words of the benchmark word length.
+    """
+
+    words = set()
+    while len(words) < size:
+        word = ''.join(choice(ascii_lowercase) for _ in range(WORD_LENGTH))
+        words.add(word)
+    return sorted(words)
+
+def run_benchmark() -> None:
+    """
+        Measure how long the solver takes to suggest a guess, by solving Wordle rounds on random words lists of different sizes.
+    """
+
+    seed(0)
+    print(f"Scoring with {'NumPy' if get_numpy() is not None else 'pure Python'}.")
+    print(f"{'words':>8} {'suggestions':>12} {'mean (ms)':>10} {'max (ms)':>10} {'mean guesses':>13}")
+    for words_list_size in WORDS_LIST_SIZES:
+        words = get_random_words_list(words_list_size)
+
+        suggestion_times = []
+        guesses_amount = 0
+        for _ in range(ROUNDS_AMOUNT):
+            word_to_guess = choice(words)
+            solver_state = create_solver_state(WORD_LENGTH, word_to_guess[0], words)
+
+            guess = None
+            while guess != word_to_guess:
+                start_time = perf_counter()
+                guess = get_suggested_guess(solver_state)
+                suggestion_times.append((perf_counter() - start_time) * 1000)
+
+                guess_colors = decode_feedback_pattern(get_feedback_pattern(guess, word_to_guess), WORD_LENGTH)
+                apply_guess_to_solver_state(solver_state, guess, guess_colors)
+                guesses_amount += 1
+
+        mean_time = sum(suggestion_times) / len(suggestion_times)
+        print(f"{words_list_size:>8} {len(suggestion_times):>12} {mean_time:>10.2f} {max(suggestion_times):>10.2f} {guesses_amount / ROUNDS_AMOUNT:>13.2f}")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,79 @@
+import os
+import sys
+from random import choice, seed
+from string import ascii_lowercase
+from time import perf_counter
+
+# Make sure the lingo package can be imported when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from lingo.wordle.words.words_utils import set_words_of_length
+from lingo.wordle.words.words_index import get_words_index_of_length, reset_words_index
+
+WORDS_LIST_SIZES = [500, 50_000, 500_000]
+LOOKUPS_AMOUNT = 200
+WORD_LENGTH = 5
+
+def get_random_words_list(size: int) -> list[str]:
+    """
+        Returns a list of unique random words of the benchmark word length.
+    """
+
+    words = set()
+    while len(words) < size:
+        word = ''.join(choice(ascii_lowercase) for _ in range(WORD_LENGTH))
+        words.add(word)
+    return list(words)
+
+def get_lookup_words(words: list[str]) -> list[str]:
+    """
+        Returns the words to look up, where half of them are within the words list and half of them are not.
+    """
+
+    lookup_words = []
+    for index in range(LOOKUPS_AMOUNT):
+        if index % 2 == 0:
+            lookup_words.append(choice(words))
+        else:
+            # Words with a digit can never be within the words list
+            lookup_words.append(choice(words)[:-1] + "0")
+    return lookup_words
+
+def time_lookups(lookup_words: list[str], is_known_word: callable) -> float:
+    """
+        Returns the average time in microseconds it takes to look up a single word.
+    """
+
+    start_time = perf_counter()
+    for word in lookup_words:
+        is_known_word(word)
+    elapsed_time = perf_counter() - start_time
+    return elapsed_time / len(lookup_words) * 1_000_000
+
+def run_benchmark() -> None:
+    """
+        Compare the linear list scan with the hashed words index lookup for multiple words list sizes.
+    """
+
+    seed(0)
+    print(f"{'words':>10} {'list scan (us)':>16} {'index (us)':>12} {'index build (ms)':>18} {'speedup':>10}")
+    for size in WORDS_LIST_SIZES:
+        words = get_random_words_list(size)
+        lookup_words = get_lookup_words(words)
+
+        list_scan_time = time_lookups(lookup_words, lambda word: word in words)
+
+        # The random words list replaces the words list of its length, so the words index is built from it just like during the game
+        set_words_of_length(WORD_LENGTH, words)
+        reset_words_index()
+        build_start_time = perf_counter()
+        words_index = get_words_index_of_length(WORD_LENGTH)
+        build_time = (perf_counter() - build_start_time) * 1000
+
+        index_time = time_lookups(lookup_words, lambda word: word in words_index)
+
+        speedup = list_scan_time / index_time
+        print(f"{size:>10} {list_scan_time:>16.2f} {index_time:>12.2f} {build_time:>18.2f} {speedup:>9.0f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,9 +1,9 @@
 from lingo.bingo.bingo_settings.bingo_settings_utils import get_bingo_lose_conditions, get_bingo_win_conditions, get_maximum_grabs_per_round
 from ..lingo_utils import print_message, set_losing_team, set_winning_team
+from ..lingo_pacing import pause
 from .bingo_utils import *
-from time import sleep
-from typing import Union
-from random import choice
+from ..lingo_profiling import profiled
+from ..lingo_metrics import timed_round
 
 def print_bingo_board_for_team(team_ID: int) -> None:
     """
@@ -13,33 +13,33 @@ def print_bingo_board_for_team(team_ID: int) -> None:
     stringified_bingo_board = get_stringified_bingo_board_for_team(team_ID)
     print_message(stringified_bingo_board)
 
-def grab_bingo_ball_for_team(team_ID: int) -> Union[str, int]:
+def grab_bingo_ball_for_team(team_ID: int) -> str | int:
     """
         Grab a single ball for the specified team.
         The ball can either be a colored ball (red or green) or a number from the specified team's Bingo board.
         This function also updates the teams_data structure accordingly based on the grabbed ball.
     """
 
-    available_balls = get_available_bingo_board_pit_balls_for_team(team_ID)
-    grabbed_ball = choice(available_balls)
+    grabbed_ball = draw_bingo_ball_from_pit_for_team(team_ID)
     
     print_message(f"Team {team_ID + 1} is grabbing a ball...")
-    sleep(1)  # Simulate time taken to grab a ball
+    pause(1)  # Simulate time taken to grab a ball, based on the pacing set within the Lingo settings
 
     # If the parameter is a string, it means the team grabbed a colored ball (red or green).
     # In that case, we print the grabbed color, update the teams_data structure for the grabbed and remaining balls, and return the grabbed color
     if type(grabbed_ball) is str:
         print_message(f"Team {team_ID + 1} grabbed a {grabbed_ball} colored ball! (Current {grabbed_ball} balls grabbed: {get_amount_of_color_balls_grabbed_by_team(team_ID, grabbed_ball) + 1})")
-        decrease_remaining_color_balls_for_team(team_ID, grabbed_ball)
-        increase_grabbed_color_balls_for_team(team_ID, grabbed_ball)
+        apply_grabbed_bingo_ball_for_team(team_ID, grabbed_ball)
         return grabbed_ball
 
     # If not, it means the team grabbed a number within their Bingo board.
     # In that case, we print the grabbed number, mark the number on the Bingo board, and return the grabbed number
     print_message(f"Team {team_ID + 1} grabbed ball number {grabbed_ball}!")
-    mark_number_on_bingo_board_for_team(team_ID, grabbed_ball)
+    apply_grabbed_bingo_ball_for_team(team_ID, grabbed_ball)
     return grabbed_ball
 
+@profiled()
+@timed_round("bingo")
 def play_bingo_round_for_team(team_ID: int) -> bool:
     """
         Play a Bingo round for the specified team.
@@ -0,0 +1,68 @@
+class FilledPositions(set):
+    """
+        The set of filled positions on a bingo board, which counts every change made to it within its `version`.
+        The values which are derived from the filled positions (the bitmask, the remaining numbers, the bingo ball pit and the rendered board)
+        remember the version they were built from, so they are rebuilt as soon as the set has been changed in any way, even directly (e.g. within the tests).
+        !Do note that the version of a new set starts at 0, so the set must be changed in place instead of being replaced by a new set.
+    """
+
+    def __init__(self, positions=()):
+        super().__init__(positions)
+        self.version = 0
+
+    def add(self, position: tuple[int, int]) -> None:
+        # Adding a position which is already filled doesn't change the set, so the derived values stay up to date
+        if position in self:
+            return
+
+        super().add(position)
+        self.version += 1
+
+    def discard(self, position: tuple[int, int]) -> None:
+        super().discard(position)
+        self.version += 1
+
+    def remove(self, position: tuple[int, int]) -> None:
+        super().remove(position)
+        self.version += 1
+
+    def pop(self) -> tuple[int, int]:
+        position = super().pop()
+        self.version += 1
+        return position
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def update(self, *positions) -> None:
+        super().update(*positions)
+        self.version += 1
+
+    def difference_update(self, *positions) -> None:
+        super().difference_update(*positions)
+        self.version += 1
+
+    def intersection_update(self, *positions) -> None:
+        super().intersection_update(*positions)
+        self.version += 1
+
+    def symmetric_difference_update(self, positions) -> None:
+        super().symmetric_difference_update(positions)
+        self.version += 1
+
+    def __ior__(self, positions):
+        self.update(positions)
+        return self
+
+    def __iand__(self, positions):
+        self.intersection_update(positions)
+        return self
+
+    def __isub__(self, positions):
+        self.difference_update(positions)
+        return self
+
+    def __ixor__(self, positions):
+        self.symmetric_difference_update(positions)
+        return self
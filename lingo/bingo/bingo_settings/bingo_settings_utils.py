@@ -1,10 +1,10 @@
 import os
-from json import load
 
-# Let us read and use the Bingo settings
+# The Bingo settings, which are only read from the settings file the first time they are used (see `get_bingo_settings`).
+#! Do note that the settings can be reloaded between games when the settings file changes (see `reload_changed_settings`), which replaces this dictionary as a whole
 currentDir = os.path.dirname(os.path.realpath(__file__))
-with open(os.path.join(currentDir, 'bingo_settings.json'), 'r') as bingo_settings_file:
-    bingo_settings = load(bingo_settings_file)
+BINGO_SETTINGS_FILE_PATH = os.path.join(currentDir, 'bingo_settings.json')
+bingo_settings = None
 
 
 ###
@@ -12,12 +12,24 @@ with open(os.path.join(currentDir, 'bingo_settings.json'), 'r') as bingo_setting
 ###
 
 
+def get_bingo_settings() -> dict:
+    """
+        Returns the Bingo settings, which are read from the settings file the first time they are used.
+    """
+
+    if bingo_settings is None:
+        # Imported here, since the settings loader imports this module itself
+        from ...settings_loader import load_settings
+        load_settings("bingo")
+
+    return bingo_settings
+
 def get_bingo_board_size() -> int:
     """
         Returns the size of the Bingo board (amount of rows and columns).
     """
 
-    board_size = bingo_settings['board_size']
+    board_size = get_bingo_settings()['board_size']
     return board_size
 
 def get_bingo_number_colors() -> dict:
@@ -25,7 +37,7 @@ def get_bingo_number_colors() -> dict:
         Returns the colors used for the Bingo numbers based on their state (marked/unmarked).
     """
 
-    number_colors = bingo_settings['number_colors']
+    number_colors = get_bingo_settings()['number_colors']
     return number_colors
 
 def get_maximum_grabs_per_round() -> int:
@@ -33,15 +45,23 @@ def get_maximum_grabs_per_round() -> int:
         Returns the maximum amount of grabs a team can make during their Bingo round.
     """
 
-    max_grabs_per_round = bingo_settings['maximum_grabs_per_round']
+    max_grabs_per_round = get_bingo_settings()['maximum_grabs_per_round']
     return max_grabs_per_round
 
+def get_bingo_ball_amounts() -> dict:
+    """
+        Returns the amount of green and red balls within the Bingo ball pit at the start of the game.
+    """
+
+    ball_amounts = get_bingo_settings()['balls']
+    return ball_amounts
+
 def get_bingo_lose_conditions() -> dict:
     """
         Returns the lose conditions for the Bingo game.
     """
 
-    lose_conditions = bingo_settings['lose_conditions']
+    lose_conditions = get_bingo_settings()['lose_conditions']
     return lose_conditions
 
 def get_bingo_win_conditions() -> dict:
@@ -49,5 +69,5 @@ def get_bingo_win_conditions() -> dict:
         Returns the win conditions for the Bingo game.
     """
 
-    win_conditions = bingo_settings['win_conditions']
+    win_conditions = get_bingo_settings()['win_conditions']
     return win_conditions
\ No newline at end of file
@@ -0,0 +1,251 @@
+import os
+import random
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from itertools import product
+from time import perf_counter
+from collections.abc import Iterator
+from .bingo_settings import bingo_settings_utils
+from .bingo_utils import draw_bingo_ball_from_pit_for_team, apply_grabbed_bingo_ball_for_team, get_bingo_grab_result_for_team
+from ..game_context import create_game_context, use_game_context, get_teams_data
+from ..lingo_utils import get_initial_team_data_for_team
+from ..settings_snapshot import refresh_settings_snapshot
+from ..lingo_exceptions import GameExhaustedError
+
+# The amount of games which is simulated within a single task of a worker process.
+# Smaller chunks spread the work more evenly over the workers, while bigger chunks have less overhead
+GAMES_PER_CHUNK = 20_000
+
+# The team whose bingo game is simulated.
+# Only the data of this team is built, so it must be the first team, whose data is the first entry of the teams data
+SIMULATED_TEAM_ID = 0
+
+
+###
+### GETTERS
+###
+
+
+def get_bingo_configuration(board_size: int, maximum_grabs_per_round: int, green_balls: int, red_balls: int, lines_needed: int, green_balls_needed: int, red_balls_needed: int) -> dict:
+    """
+        Returns a bingo configuration, which has the same structure as the Bingo settings.
+    """
+
+    bingo_configuration = deepcopy(bingo_settings_utils.get_bingo_settings())
+    bingo_configuration["board_size"] = board_size
+    bingo_configuration["maximum_grabs_per_round"] = maximum_grabs_per_round
+    bingo_configuration["balls"] = {
+        "green": green_balls,
+        "red": red_balls
+    }
+    bingo_configuration["win_conditions"] = {
+        "lines_needed": lines_needed,
+        "green_balls_grabbed": green_balls_needed
+    }
+    bingo_configuration["lose_conditions"] = {
+        "red_balls_grabbed": red_balls_needed
+    }
+    return bingo_configuration
+
+def get_empty_simulation_results() -> dict:
+    """
+        Returns the simulation results before any game has been simulated.
+    """
+
+    simulation_results = {
+        "games": 0,
+        "won": 0,
+        "lost": 0,
+        "undecided": 0,
+        "turns": 0,
+        "grabs": 0
+    }
+    return simulation_results
+
+def get_simulation_summary(simulation_results: dict) -> dict:
+    """
+        Returns the win and lose probabilities, and the expected amount of turns and grabs per game for the provided simulation results.
+    """
+
+    games_amount = max(simulation_results["games"], 1)
+    simulation_summary = {
+        "games": simulation_results["games"],
+        "winProbability": simulation_results["won"] / games_amount,
+        "loseProbability": simulation_results["lost"] / games_amount,
+        "undecidedProbability": simulation_results["undecided"] / games_amount,
+        "expectedTurns": simulation_results["turns"] / games_amount,
+        "expectedGrabs": simulation_results["grabs"] / games_amount
+    }
+    return simulation_summary
+
+
+###
+### SIMULATION
+###
+
+
+@contextmanager
+def use_bingo_configuration(bingo_configuration: dict) -> Iterator[None]:
+    """
+        Use the provided bingo configuration as the Bingo settings within the `with` block, after which the previous Bingo settings are restored.
+    """
+
+    # The Bingo settings are replaced as a whole, just like when the settings are reloaded (see `reload_changed_settings`)
+    previous_bingo_settings = bingo_settings_utils.get_bingo_settings()
+    bingo_settings_utils.bingo_settings = deepcopy(bingo_configuration)
+    try:
+        yield
+    finally:
+        bingo_settings_utils.bingo_settings = previous_bingo_settings
+
+def simulate_bingo_game() -> dict:
+    """
+        Simulate a single bingo game for the simulated team, by playing bingo turns until the team has won or lost.
+        Each bingo turn follows the same rules as `play_bingo_round_for_team`.
+        We return the result of the game ("won", "lost" or "undecided" when the ball pit ran empty), and the amount of turns and grabs it took.
+        !Do note that this must be called while a game context is used, since it replaces the teams data with the data of the simulated team only.
+    """
+
+    # The other teams never play, so their bingo boards and ball pits aren't built
+    teams_data = get_teams_data()
+    teams_data.clear()
+    teams_data.append(get_initial_team_data_for_team(SIMULATED_TEAM_ID))
+
+    turns_amount = 0
+    grabs_amount = 0
+    while True:
+        turns_amount += 1
+        grab_number = 0
+        grab_result = "continue"
+        while grab_result == "continue":
+            try:
+                grabbed_ball = draw_bingo_ball_from_pit_for_team(SIMULATED_TEAM_ID)
+            except GameExhaustedError:
+                return {"result": "undecided", "turns": turns_amount, "grabs": grabs_amount}
+
+            apply_grabbed_bingo_ball_for_team(SIMULATED_TEAM_ID, grabbed_ball)
+            grab_number += 1
+            grabs_amount += 1
+            grab_result = get_bingo_grab_result_for_team(SIMULATED_TEAM_ID, grabbed_ball, grab_number)
+
+        if grab_result != "turnEnded":
+            return {"result": grab_result, "turns": turns_amount, "grabs": grabs_amount}
+
+def simulate_bingo_games(bingo_configuration: dict, games_amount: int, seed: int) -> dict:
+    """
+        Simulate the provided amount of bingo games with the provided bingo configuration, and return the combined simulation results.
+        The random number generator is seeded with the provided seed, so the results can be reproduced.
+        !Do note that this is the task which is run within each worker process.
+    """
+
+    random.seed(seed)
+    simulation_results = get_empty_simulation_results()
+
+    with use_game_context(create_game_context()), use_bingo_configuration(bingo_configuration):
+        # The bingo configuration is the same for every game, so the settings snapshot is only built once
+        refresh_settings_snapshot()
+        for _ in range(games_amount):
+            game_result = simulate_bingo_game()
+            simulation_results["games"] += 1
+            simulation_results[game_result["result"]] += 1
+            simulation_results["turns"] += game_result["turns"]
+            simulation_results["grabs"] += game_result["grabs"]
+
+    return simulation_results
+
+def simulate_bingo_configurations(bingo_configurations: list[dict], games_amount: int, workers_amount: int = None, seed: int = 0) -> list[dict]:
+    """
+        Simulate the provided amount of bingo games for each bingo configuration, spread over a pool of worker processes.
+        We return the simulation summary of each bingo configuration, in the same order as the bingo configurations.
+    """
+
+    # Split the games of each configuration into chunks, and give every chunk its own seed
+    tasks = []
+    for configuration_index, bingo_configuration in enumerate(bingo_configurations):
+        simulated_games_amount = 0
+        while simulated_games_amount < games_amount:
+            chunk_games_amount = min(GAMES_PER_CHUNK, games_amount - simulated_games_amount)
+            chunk_seed = seed * 1_000_003 + len(tasks)
+            tasks.append((configuration_index, bingo_configuration, chunk_games_amount, chunk_seed))
+            simulated_games_amount += chunk_games_amount
+
+    configurations_results = []
+    for _ in bingo_configurations:
+        configurations_results.append(get_empty_simulation_results())
+
+    with ProcessPoolExecutor(max_workers=workers_amount) as executor:
+        futures = []
+        for configuration_index, bingo_configuration, chunk_games_amount, chunk_seed in tasks:
+            future = executor.submit(simulate_bingo_games, bingo_configuration, chunk_games_amount, chunk_seed)
+            futures.append((configuration_index, future))
+
+        for configuration_index, future in futures:
+            chunk_results = future.result()
+            configuration_results = configurations_results[configuration_index]
+            for key, value in chunk_results.items():
+                configuration_results[key] += value
+
+    simulation_summaries = []
+    for configuration_results in configurations_results:
+        simulation_summaries.append(get_simulation_summary(configuration_results))
+    return simulation_summaries
+
+
+###
+### COMMAND LINE
+###
+
+
+def main() -> None:
+    """
+        Simulate bingo games for every combination of the provided settings, and print the win and lose probabilities of each combination.
+        E.g. `python -m lingo.bingo.bingo_simulator --games 1000000 --board-size 4 5 --maximum-grabs 2 3`
+    """
+
+    bingo_settings = bingo_settings_utils.get_bingo_settings()
+    win_conditions = bingo_settings["win_conditions"]
+    lose_conditions = bingo_settings["lose_conditions"]
+
+    parser = ArgumentParser(description="Simulate bingo games to find the win and lose probabilities of the Bingo settings.")
+    parser.add_argument("--games", type=int, default=100_000, help="The amount of games to simulate for each combination of settings.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="The amount of worker processes.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random number generators.")
+    parser.add_argument("--board-size", type=int, nargs="+", default=[bingo_settings["board_size"]])
+    parser.add_argument("--maximum-grabs", type=int, nargs="+", default=[bingo_settings["maximum_grabs_per_round"]])
+    parser.add_argument("--green-balls", type=int, nargs="+", default=[bingo_settings["balls"]["green"]])
+    parser.add_argument("--red-balls", type=int, nargs="+", default=[bingo_settings["balls"]["red"]])
+    parser.add_argument("--lines-needed", type=int, nargs="+", default=[win_conditions["lines_needed"]])
+    parser.add_argument("--green-balls-needed", type=int, nargs="+", default=[win_conditions["green_balls_grabbed"]])
+    parser.add_argument("--red-balls-needed", type=int, nargs="+", default=[lose_conditions["red_balls_grabbed"]])
+    arguments = parser.parse_args()
+
+    settings_combinations = list(product(
+        arguments.board_size,
+        arguments.maximum_grabs,
+        arguments.green_balls,
+        arguments.red_balls,
+        arguments.lines_needed,
+        arguments.green_balls_needed,
+        arguments.red_balls_needed
+    ))
+
+    bingo_configurations = []
+    for settings_combination in settings_combinations:
+        bingo_configurations.append(get_bingo_configuration(*settings_combination))
+
+    start_time = perf_counter()
+    simulation_summaries = simulate_bingo_configurations(bingo_configurations, arguments.games, arguments.workers, arguments.seed)
+    elapsed_time = perf_counter() - start_time
+
+    print(f"{'size':>4} {'grabs':>5} {'green':>5} {'red':>4} {'lines':>5} {'green needed':>12} {'red needed':>10} {'P(win)':>8} {'P(lose)':>8} {'E[turns]':>9} {'E[grabs]':>9}")
+    for settings_combination, simulation_summary in zip(settings_combinations, simulation_summaries):
+        board_size, maximum_grabs, green_balls, red_balls, lines_needed, green_balls_needed, red_balls_needed = settings_combination
+        print(f"{board_size:>4} {maximum_grabs:>5} {green_balls:>5} {red_balls:>4} {lines_needed:>5} {green_balls_needed:>12} {red_balls_needed:>10} {simulation_summary['winProbability']:>8.4f} {simulation_summary['loseProbability']:>8.4f} {simulation_summary['expectedTurns']:>9.2f} {simulation_summary['expectedGrabs']:>9.2f}")
+
+    simulated_games_amount = arguments.games * len(bingo_configurations)
+    print(f"\nSimulated {simulated_games_amount} games in {elapsed_time:.1f} seconds ({simulated_games_amount / elapsed_time:.0f} games/sec).")
+
+if __name__ == "__main__":
+    main()
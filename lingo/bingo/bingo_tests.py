@@ -1,4 +1,5 @@
 from test_lib import test
+from ..teams_data import teams_data
 from ..lingo_utils import get_amount_of_teams, initialize_teams_data, remove_teams_data, get_next_team_ID
 from ..lingo_settings.lingo_settings_utils import get_starting_team_ID
 from .bingo_settings.bingo_settings_utils import *
@@ -565,4 +566,413 @@ def test_get_bingo_board_filled_diagonal_lines_amount_for_team() -> None:
 
     # Remove the teams data after the test to reset the state for other tests
     remove_teams_data()
-test_get_bingo_board_filled_diagonal_lines_amount_for_team()
\ No newline at end of file
+test_get_bingo_board_filled_diagonal_lines_amount_for_team()
+
+def test_get_bingo_line_masks() -> None:
+    """
+        Test whether the bitmasks of the lines on the bingo board are calculated correctly.
+    """
+
+    bingo_board_size = 3
+    bingo_line_masks = get_bingo_line_masks(bingo_board_size)
+
+    # On a 3x3 board, the bits of the first row are 0, 1 and 2, and the bits of the first column are 0, 3 and 6
+    test(
+        f"The first horizontal line mask on a {bingo_board_size}x{bingo_board_size} bingo board should hold bits 0, 1 and 2.",
+        0b000000111,
+        bingo_line_masks["horizontal"][0],
+    )
+    test(
+        f"The first vertical line mask on a {bingo_board_size}x{bingo_board_size} bingo board should hold bits 0, 3 and 6.",
+        0b001001001,
+        bingo_line_masks["vertical"][0],
+    )
+    test(
+        f"The diagonal line masks on a {bingo_board_size}x{bingo_board_size} bingo board should hold bits 0, 4 and 8, and bits 2, 4 and 6.",
+        [0b100010001, 0b001010100],
+        bingo_line_masks["diagonal"],
+    )
+
+    # Test whether the amount of line masks grows with the bingo board size
+    bingo_board_size = 10
+    bingo_line_masks = get_bingo_line_masks(bingo_board_size)
+    test(
+        f"A {bingo_board_size}x{bingo_board_size} bingo board should have {bingo_board_size * 2 + 2} lines.",
+        bingo_board_size * 2 + 2,
+        len(bingo_line_masks["horizontal"]) + len(bingo_line_masks["vertical"]) + len(bingo_line_masks["diagonal"]),
+    )
+test_get_bingo_line_masks()
+
+def test_mark_number_on_bingo_board_reports_completed_lines() -> None:
+    """
+        Test whether marking a number on the bingo board reports the lines it has just completed.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_bingo_board_for_team(team_ID)
+    bingo_board_size = get_bingo_board_size()
+
+    # Mark every number of the first row, except the last number
+    for col in range(bingo_board_size - 1):
+        completed_lines = mark_number_on_bingo_board_for_team(team_ID, bingo_board[0][col])
+    test(
+        "Marking numbers which do not complete a line should not report any completed lines.",
+        [],
+        completed_lines,
+    )
+
+    # Marking the last number of the first row completes both the first row and the top-right to bottom-left diagonal line when the other diagonal positions are filled
+    for row in range(1, bingo_board_size):
+        mark_number_on_bingo_board_for_team(team_ID, bingo_board[row][bingo_board_size - 1 - row])
+    completed_lines = mark_number_on_bingo_board_for_team(team_ID, bingo_board[0][bingo_board_size - 1])
+    test(
+        "Marking the last number of the first row should report both the first row and the top-right to bottom-left diagonal line as completed.",
+        [("horizontal", 0), ("diagonal", 1)],
+        completed_lines,
+    )
+    test(
+        "After completing the first row and the top-right to bottom-left diagonal line, the total amount of filled lines should be 2.",
+        2,
+        get_bingo_board_total_filled_lines_amount_for_team(team_ID),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_mark_number_on_bingo_board_reports_completed_lines()
+
+def test_get_randomized_bingo_board_for_big_boards() -> None:
+    """
+        Test whether a randomized bingo board can be created when the board holds more numbers than the default number range.
+    """
+
+    bingo_settings = get_bingo_settings()
+    default_bingo_board_size = bingo_settings["board_size"]
+    bingo_board_size = 10
+    bingo_settings["board_size"] = bingo_board_size
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_randomized_bingo_board_for_team(team_ID)
+    board_numbers = set()
+    for row in bingo_board:
+        for number in row:
+            board_numbers.add(number)
+    test(
+        f"A {bingo_board_size}x{bingo_board_size} bingo board should hold {bingo_board_size * bingo_board_size} unique numbers.",
+        bingo_board_size * bingo_board_size,
+        len(board_numbers),
+    )
+
+    # Reset the bingo board size to reset the state for other tests
+    bingo_settings["board_size"] = default_bingo_board_size
+test_get_randomized_bingo_board_for_big_boards()
+
+def test_get_bingo_board_number_position_for_team() -> None:
+    """
+        Test whether the position of each number on the bingo board can be looked up for a team.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_bingo_board_for_team(team_ID)
+
+    positions_match = True
+    for row_index, row in enumerate(bingo_board):
+        for col_index, number in enumerate(row):
+            if get_bingo_board_number_position_for_team(team_ID, number) != (row_index, col_index):
+                positions_match = False
+    test(
+        f"The position of each number on the bingo board for team {team_ID + 1} should match where the number is on the board.",
+        True,
+        positions_match,
+    )
+
+    # Numbers of the other team are never on the bingo board of this team, since they have a different parity
+    number_not_on_board = bingo_board[0][0] + 1
+    test(
+        f"Looking up the position of the number {number_not_on_board}, which is not on the bingo board for team {team_ID + 1}, should return None.",
+        None,
+        get_bingo_board_number_position_for_team(team_ID, number_not_on_board),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_get_bingo_board_number_position_for_team()
+
+def test_get_remaining_bingo_board_numbers_for_team() -> None:
+    """
+        Test whether the remaining numbers on the bingo board stay in sync with the marked numbers.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_bingo_board_for_team(team_ID)
+    expected_remaining_numbers = []
+    for row in bingo_board:
+        for number in row:
+            expected_remaining_numbers.append(number)
+
+    # Mark a number by using the setter
+    number_to_mark = bingo_board[1][1]
+    mark_number_on_bingo_board_for_team(team_ID, number_to_mark)
+    expected_remaining_numbers.remove(number_to_mark)
+    test(
+        f"After marking the number {number_to_mark}, it should not be within the remaining numbers on the bingo board for team {team_ID + 1}.",
+        expected_remaining_numbers,
+        get_remaining_bingo_board_numbers_for_team(team_ID),
+    )
+
+    # Fill a position directly within the filled positions set, without using the setter
+    teams_data[team_ID]["bingoBoard"]["filledPositions"].add((0, 0))
+    expected_remaining_numbers.remove(bingo_board[0][0])
+    test(
+        f"After filling a position directly within the filled positions set, the remaining numbers on the bingo board for team {team_ID + 1} should be rebuilt.",
+        expected_remaining_numbers,
+        get_remaining_bingo_board_numbers_for_team(team_ID),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_get_remaining_bingo_board_numbers_for_team()
+
+def test_draw_bingo_ball_from_pit_for_team() -> None:
+    """
+        Test whether drawing a ball from the bingo ball pit only returns balls which are within the pit.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    available_balls = get_available_bingo_board_pit_balls_for_team(team_ID)
+
+    drawn_balls_are_available = True
+    for _ in range(100):
+        if draw_bingo_ball_from_pit_for_team(team_ID) not in available_balls:
+            drawn_balls_are_available = False
+    test(
+        f"Every ball drawn from the bingo ball pit for team {team_ID + 1} should be one of the available pit balls.",
+        True,
+        drawn_balls_are_available,
+    )
+
+    # When all colored balls are gone, only the remaining numbers can be drawn
+    for color in ["green", "red"]:
+        for _ in range(get_remaining_color_balls_for_team(team_ID, color)):
+            decrease_remaining_color_balls_for_team(team_ID, color)
+    test(
+        f"When there are no colored balls left in the bingo ball pit for team {team_ID + 1}, the drawn ball should be a number.",
+        int,
+        type(draw_bingo_ball_from_pit_for_team(team_ID)),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_draw_bingo_ball_from_pit_for_team()
+
+def test_remove_number_from_bingo_ball_pit_for_team() -> None:
+    """
+        Test whether marking numbers on the bingo board removes them from the bingo ball pit.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_bingo_board_for_team(team_ID)
+
+    # Mark the numbers on the first diagonal line, so numbers are removed from the start, middle and end of the pit
+    for index in range(get_bingo_board_size()):
+        mark_number_on_bingo_board_for_team(team_ID, bingo_board[index][index])
+
+    bingo_ball_pit = get_bingo_ball_pit_for_team(team_ID)
+    test(
+        f"After marking numbers on the bingo board for team {team_ID + 1}, the bingo ball pit should hold exactly the remaining numbers.",
+        sorted(get_remaining_bingo_board_numbers_for_team(team_ID)),
+        sorted(bingo_ball_pit["numbers"]),
+    )
+
+    indexes_match = True
+    for number, index in bingo_ball_pit["numberIndexes"].items():
+        if bingo_ball_pit["numbers"][index] != number:
+            indexes_match = False
+    test(
+        f"After marking numbers on the bingo board for team {team_ID + 1}, the index of each number within the bingo ball pit should still be correct.",
+        True,
+        indexes_match,
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_remove_number_from_bingo_ball_pit_for_team()
+
+def test_simulate_bingo_games() -> None:
+    """
+        Test whether the Monte Carlo bingo simulator works correctly.
+    """
+
+    from .bingo_simulator import get_bingo_configuration, simulate_bingo_games
+
+    bingo_configuration = get_bingo_configuration(4, 2, 3, 3, 1, 3, 3)
+    simulation_results = simulate_bingo_games(bingo_configuration, 200, 42)
+    repeated_simulation_results = simulate_bingo_games(bingo_configuration, 200, 42)
+
+    test(
+        "Every simulated bingo game should either be won, lost or undecided.",
+        simulation_results["games"],
+        simulation_results["won"] + simulation_results["lost"] + simulation_results["undecided"],
+    )
+    test(
+        "Simulating bingo games with the same seed should give the same results.",
+        [simulation_results["won"], simulation_results["lost"], simulation_results["turns"]],
+        [repeated_simulation_results["won"], repeated_simulation_results["lost"], repeated_simulation_results["turns"]],
+    )
+    test(
+        "After simulating bingo games, the Bingo settings should be restored.",
+        2,
+        get_maximum_grabs_per_round(),
+    )
+    test(
+        "Simulating bingo games should not change the teams data of the default game context.",
+        0,
+        len(teams_data),
+    )
+test_simulate_bingo_games()
+
+def test_get_stringified_bingo_board_for_team() -> None:
+    """
+        Test whether the stringified bingo board only recolors the cell of a marked number, and stays the same as a board rendered from scratch.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board = get_bingo_board_for_team(team_ID)
+    bingo_board_data = teams_data[team_ID]["bingoBoard"]
+    get_stringified_bingo_board_for_team(team_ID)
+    rendered_rows_before_marking = list(bingo_board_data["renderedBoard"]["rows"])
+
+    marked_number = bingo_board[1][2]
+    mark_number_on_bingo_board_for_team(team_ID, marked_number)
+    test(
+        f"After marking the number {marked_number}, only its row should have to be rendered again.",
+        [1],
+        sorted(bingo_board_data["renderedBoard"]["staleRows"]),
+    )
+
+    stringified_board = get_stringified_bingo_board_for_team(team_ID)
+    rendered_rows_after_marking = bingo_board_data["renderedBoard"]["rows"]
+    unchanged_rows_reused = True
+    for row_index in (0, 2, 3):
+        if rendered_rows_after_marking[row_index] is not rendered_rows_before_marking[row_index]:
+            unchanged_rows_reused = False
+    test(
+        f"After marking the number {marked_number}, the rows without the number should be reused.",
+        True,
+        unchanged_rows_reused,
+    )
+
+    test(
+        f"After marking the number {marked_number}, its cell should be colored with the marked color.",
+        True,
+        get_rendered_bingo_cell(marked_number, get_bingo_number_colors()["marked"]) in stringified_board,
+    )
+
+    # Render the board again from scratch, which should result in the exact same board
+    bingo_board_data["renderedBoard"] = None
+    test(
+        f"After marking the number {marked_number}, the stringified board should be the same as the board rendered from scratch.",
+        get_stringified_bingo_board_for_team(team_ID),
+        stringified_board,
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_get_stringified_bingo_board_for_team()
+
+def test_replace_filled_positions_with_same_amount() -> None:
+    """
+        Test whether the values derived from the filled positions are rebuilt when the filled positions are replaced by the same amount of other positions.
+    """
+
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board_size = get_bingo_board_size()
+    bingo_board = get_bingo_board_for_team(team_ID)
+
+    # Fill the first row, and use every value which is derived from the filled positions
+    set_filled_positions_for_team(team_ID, {(0, col) for col in range(bingo_board_size)})
+    get_bingo_board_total_filled_lines_amount_for_team(team_ID)
+    get_bingo_ball_pit_for_team(team_ID)
+    get_stringified_bingo_board_for_team(team_ID)
+
+    # Replace the first row by the first column, which holds the same amount of positions
+    set_filled_positions_for_team(team_ID, {(row, 0) for row in range(bingo_board_size)})
+    test(
+        f"After replacing the first row by the first column, team {team_ID + 1} should have 0 filled horizontal lines and 1 filled vertical line.",
+        [0, 1],
+        [get_bingo_board_filled_horizontal_lines_amount_for_team(team_ID), get_bingo_board_filled_vertical_lines_amount_for_team(team_ID)],
+    )
+
+    first_column_numbers = [bingo_board[row][0] for row in range(bingo_board_size)]
+    test(
+        f"After replacing the first row by the first column, the numbers of the first column should not be remaining numbers for team {team_ID + 1}.",
+        [],
+        [number for number in first_column_numbers if number in get_remaining_bingo_board_numbers_for_team(team_ID)],
+    )
+    test(
+        f"After replacing the first row by the first column, the numbers of the first column should not be within the bingo ball pit of team {team_ID + 1}.",
+        [],
+        [number for number in first_column_numbers if number in get_bingo_ball_pit_for_team(team_ID)["numbers"]],
+    )
+    test(
+        f"After replacing the first row by the first column, the stringified bingo board of team {team_ID + 1} should be rendered again.",
+        "".join(build_rendered_bingo_board_for_team(team_ID)["rows"]),
+        "".join(get_rendered_bingo_board_for_team(team_ID)["rows"]),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_replace_filled_positions_with_same_amount()
+
+def test_change_filled_positions_through_getter() -> None:
+    """
+        Test whether the values derived from the filled positions are rebuilt when the set returned by `get_filled_positions_for_team` is changed directly.
+    """
+
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    bingo_board_size = get_bingo_board_size()
+
+    # Use the bitmask before the set is changed, so it has to be rebuilt afterwards
+    get_bingo_board_total_filled_lines_amount_for_team(team_ID)
+    filled_positions = get_filled_positions_for_team(team_ID)
+    for col in range(bingo_board_size):
+        filled_positions.add((0, col))
+    test(
+        f"After filling the first row through the filled positions set, team {team_ID + 1} should have 1 filled horizontal line and 1 filled line in total.",
+        [1, 1],
+        [get_bingo_board_filled_horizontal_lines_amount_for_team(team_ID), get_bingo_board_total_filled_lines_amount_for_team(team_ID)],
+    )
+
+    # Replace the first row by the second row, which holds the same amount of positions
+    filled_positions.clear()
+    filled_positions |= {(1, col) for col in range(bingo_board_size)}
+    test(
+        f"After replacing the first row by the second row through the filled positions set, team {team_ID + 1} should still have 1 filled line, and the first row shouldn't be filled.",
+        [1, []],
+        [get_bingo_board_total_filled_lines_amount_for_team(team_ID), [line for line in get_completed_bingo_lines_through_position_for_team(team_ID, (0, 0)) if line[0] == "horizontal"]],
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_change_filled_positions_through_getter()
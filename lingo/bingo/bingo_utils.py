@@ -1,17 +1,25 @@
-from termcolor import colored
-from random import choice
-from typing import List
-from .bingo_settings.bingo_settings_utils import get_bingo_board_size, get_bingo_lose_conditions, get_bingo_number_colors, get_bingo_win_conditions
+from random import randrange, sample
+from types import MappingProxyType
+from .bingo_settings.bingo_settings_utils import get_bingo_board_size
 from ..lingo_constants import GAP_BETWEEN_BOARD_COLUMNS
-from ..teams_data import teams_data
-
+from ..lingo_output import get_colored_text
+from ..game_context import get_teams_data
+from ..settings_snapshot import get_bingo_settings_snapshot
+from ..lingo_profiling import profiled
+from ..lingo_metrics import increase_counter
+from ..lingo_exceptions import GameExhaustedError
+from .bingo_filled_positions import FilledPositions
+
+# A dictionary which holds the bitmasks of every line on the bingo board, keyed by the size of the bingo board.
+# Each filled position on the bingo board is represented by a single bit, where the bit index is `row index * board size + column index`
+_bingo_line_masks = {}
 
 ###
 ### GETTERS
 ###
 
 
-def get_even_numbers_list_from_range(start: int, end: int) -> List[int]:
+def get_even_numbers_list_from_range(start: int, end: int) -> list[int]:
     """
     Returns a list of even numbers within the given range
     """
@@ -25,7 +33,7 @@ def get_even_numbers_list_from_range(start: int, end: int) -> List[int]:
         even_numbers.append(number)
     return even_numbers
 
-def get_odd_numbers_list_from_range(start: int, end: int) -> List[int]:
+def get_odd_numbers_list_from_range(start: int, end: int) -> list[int]:
     """
         Returns a list of odd numbers within the given range
     """
@@ -39,14 +47,17 @@ def get_odd_numbers_list_from_range(start: int, end: int) -> List[int]:
         odd_numbers.append(number)
     return odd_numbers
 
-def get_randomized_bingo_board_for_team(team_ID: int) -> List[List[int]]:
+def get_randomized_bingo_board_for_team(team_ID: int) -> list[list[int]]:
     """
         Returns a randomized bingo board for the specified team.
+        !Do note that the board size is read from the Bingo settings instead of the settings snapshot, since bingo boards are also created outside of a game (e.g. within the tests).
     """
 
-    # Hardcoded range for bingo numbers
+    # Hardcoded range for bingo numbers.
+    # If the bingo board is too big to fill with the numbers within this range, we increase the end of the range
+    bingo_board_size = get_bingo_board_size()
     start = 1
-    end = 99
+    end = max(99, bingo_board_size * bingo_board_size * 2)
 
     # If the ID of the team is even, we use even numbers for the bingo board.
     # Otherwise, we use uneven numbers.
@@ -56,24 +67,120 @@ def get_randomized_bingo_board_for_team(team_ID: int) -> List[List[int]]:
         available_numbers = get_odd_numbers_list_from_range(start, end)
 
     # Create the bingo board with randomized numbers.
+    board_numbers = sample(available_numbers, bingo_board_size * bingo_board_size)
     bingo_board = []
-    bingo_board_size = get_bingo_board_size()
-    for _ in range(bingo_board_size):
-        bingo_board_row = []
-        for _ in range(bingo_board_size):
-            number = choice(available_numbers)
-            available_numbers.remove(number)
-            bingo_board_row.append(number)
+    for row_index in range(bingo_board_size):
+        row_start = row_index * bingo_board_size
+        bingo_board_row = board_numbers[row_start:row_start + bingo_board_size]
         bingo_board.append(bingo_board_row)
 
     return bingo_board
 
+def get_initial_bingo_board_data_for_team(team_ID: int) -> dict:
+    """
+        Returns the initial bingo board data for the specified team.
+        Besides the randomized bingo board itself, it holds the position of each number on the board,
+        and the remaining (unmarked) numbers with their position in the order they appear on the board.
+        The filled positions count every change made to them within their version (see `FilledPositions`),
+        so the values which are derived from the filled positions are rebuilt as soon as they are out of date.
+    """
+
+    bingo_board = get_randomized_bingo_board_for_team(team_ID)
+    number_positions = get_bingo_board_number_positions(bingo_board)
+
+    bingo_board_data = {
+        "board": bingo_board,
+        "numberPositions": number_positions,
+        "remainingNumbers": dict(number_positions),
+        "filledPositions": FilledPositions(),
+        "filledMask": 0,
+        "filledMaskVersion": 0,
+        "remainingNumbersVersion": 0,
+        "renderedBoard": None
+    }
+    return bingo_board_data
+
+def get_initial_bingo_ball_pit(bingo_board_data: dict) -> dict:
+    """
+        Returns the initial bingo ball pit numbers for the provided bingo board data.
+        The numbers are kept within a list, so a random number can be picked with a single random index,
+        together with the index of each number within that list, so a grabbed number can be removed by swapping it with the last number.
+        !Do note that the colored balls are not part of this list, since their amounts are kept within the "remaining" balls of the team.
+    """
+
+    pit_numbers = list(bingo_board_data["remainingNumbers"])
+    pit_number_indexes = {}
+    for index, number in enumerate(pit_numbers):
+        pit_number_indexes[number] = index
+
+    bingo_ball_pit = {
+        "numbers": pit_numbers,
+        "numberIndexes": pit_number_indexes,
+        "filledPositionsVersion": bingo_board_data["remainingNumbersVersion"]
+    }
+    return bingo_ball_pit
+
+def get_bingo_board_number_positions(bingo_board: list[list[int]]) -> dict:
+    """
+        Returns a dictionary which holds the position of each number on the provided bingo board, in the order they appear on the board.
+    """
+
+    number_positions = {}
+    for row_index, row in enumerate(bingo_board):
+        for col_index, number in enumerate(row):
+            number_positions[number] = (row_index, col_index)
+    return number_positions
+
+def get_bingo_line_masks(bingo_board_size: int) -> dict:
+    """
+        Returns the bitmasks of every horizontal, vertical and diagonal line on a bingo board of the specified size.
+        !Do note that the masks are only calculated once per bingo board size.
+    """
+
+    if bingo_board_size in _bingo_line_masks:
+        return _bingo_line_masks[bingo_board_size]
+
+    horizontal_line_masks = []
+    vertical_line_masks = []
+    for line_index in range(bingo_board_size):
+        horizontal_line_mask = 0
+        vertical_line_mask = 0
+        for index in range(bingo_board_size):
+            horizontal_line_mask |= get_bingo_position_bit((line_index, index), bingo_board_size)
+            vertical_line_mask |= get_bingo_position_bit((index, line_index), bingo_board_size)
+        horizontal_line_masks.append(horizontal_line_mask)
+        vertical_line_masks.append(vertical_line_mask)
+
+    # The first diagonal line goes from top-left to bottom-right, and the second from top-right to bottom-left
+    top_left_diagonal_line_mask = 0
+    top_right_diagonal_line_mask = 0
+    for index in range(bingo_board_size):
+        top_left_diagonal_line_mask |= get_bingo_position_bit((index, index), bingo_board_size)
+        top_right_diagonal_line_mask |= get_bingo_position_bit((index, bingo_board_size - 1 - index), bingo_board_size)
+
+    bingo_line_masks = {
+        "horizontal": horizontal_line_masks,
+        "vertical": vertical_line_masks,
+        "diagonal": [top_left_diagonal_line_mask, top_right_diagonal_line_mask]
+    }
+    _bingo_line_masks[bingo_board_size] = bingo_line_masks
+    return bingo_line_masks
+
+def get_bingo_position_bit(position: tuple[int, int], bingo_board_size: int) -> int:
+    """
+        Returns the bit which represents the specified position on a bingo board of the specified size.
+    """
+
+    row_index, col_index = position
+    position_bit = 1 << (row_index * bingo_board_size + col_index)
+    return position_bit
+
 def get_balls_grabbed_by_team(team_ID: int) -> dict:
     """
         Returns a dictionary which holds the grabbed balls information for the specified team.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     balls_grabbed = team_data["balls"]["grabbed"]
     return balls_grabbed
 
@@ -91,88 +198,171 @@ def get_filled_positions_for_team(team_ID: int) -> set:
         Returns the set of filled positions on the bingo board for the specified team.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     bingo_board_data = team_data["bingoBoard"]
     filled_positions = bingo_board_data["filledPositions"]
     return filled_positions
 
-def get_bingo_board_for_team(team_ID: int) -> List[List[int]]:
+def get_filled_positions_mask_for_team(team_ID: int) -> int:
+    """
+        Returns the bitmask of the filled positions on the bingo board for the specified team.
+        !Do note that if the filled positions have been changed since the bitmask was built (e.g. within the tests), we rebuild the bitmask from the filled positions.
+    """
+
+    bingo_board_data = get_teams_data()[team_ID]["bingoBoard"]
+    filled_positions = bingo_board_data["filledPositions"]
+    if bingo_board_data["filledMaskVersion"] == filled_positions.version:
+        return bingo_board_data["filledMask"]
+
+    bingo_board_size = get_bingo_settings_snapshot()["boardSize"]
+    filled_positions_mask = 0
+    for position in filled_positions:
+        filled_positions_mask |= get_bingo_position_bit(position, bingo_board_size)
+
+    bingo_board_data["filledMask"] = filled_positions_mask
+    bingo_board_data["filledMaskVersion"] = filled_positions.version
+    return filled_positions_mask
+
+def get_bingo_board_for_team(team_ID: int) -> list[list[int]]:
     """
         Returns the bingo board for the specified team.
         !Do note that this is a 2D list representing the bingo board.
         !This is not a stringified version of the bingo board for display purposes.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     bingo_board = team_data["bingoBoard"]["board"]
     return bingo_board
 
-def get_stringified_bingo_board_for_team(team_ID: int) -> str:
+def get_rendered_bingo_cell(number: int, number_color: str) -> str:
     """
-        Returns a stringified version of the bingo board for the specified team.
+        Returns a single cell of the bingo board, which is the colored number with the gap between the columns on both sides.
     """
 
-    bingo_board = get_bingo_board_for_team(team_ID)
-    filled_positions = get_filled_positions_for_team(team_ID)
-    bingo_board_size = get_bingo_board_size()
+    # Center the number within the defined gap
+    # E.g. if the GAP_BETWEEN_BOARD_COLUMNS is 2, 
+    # * The number 7 would be formatted as " 7 "
+    # * The 23, it would be "23 "
+    # * And 100 would be "100"
+    # What we see here is that it first centers the number in a field of width GAP_BETWEEN_BOARD_COLUMNS,
+    # and if it increases the length of the number, it first adds spaces to the left until it reaches the width,
+    # and then adds spaces to the right until it reaches the width.
+    number_str = f"{number:^{GAP_BETWEEN_BOARD_COLUMNS}}"
+    number_str = get_colored_text(number_str, number_color)
 
-    stringified_board = ""
+    column_gap = " " * GAP_BETWEEN_BOARD_COLUMNS
+    return f"{column_gap}{number_str}{column_gap}"
+
+def get_rendered_bingo_board_for_team(team_ID: int) -> dict:
+    """
+        Returns the rendered cells and rows of the bingo board for the specified team.
+        When a number is marked, `mark_number_on_bingo_board_for_team` only recolors its cell and marks its row as stale, so the other rows are reused.
+        !Do note that the whole board is rendered again when the filled positions, board size or number colors have changed in any other way (e.g. within the tests)
+    """
+
+    bingo_board_data = get_teams_data()[team_ID]["bingoBoard"]
+    rendered_board = bingo_board_data.get("renderedBoard")
+
+    bingo_settings_snapshot = get_bingo_settings_snapshot()
+    if (rendered_board is None
+            or rendered_board["size"] != bingo_settings_snapshot["boardSize"]
+            or rendered_board["numberColors"] != bingo_settings_snapshot["numberColors"]
+            or rendered_board["filledPositionsVersion"] != bingo_board_data["filledPositions"].version):
+        rendered_board = build_rendered_bingo_board_for_team(team_ID)
+        bingo_board_data["renderedBoard"] = rendered_board
+
+    # Join the cells of the rows which have changed since the last time the board was stringified
+    rendered_cells = rendered_board["cells"]
+    rendered_rows = rendered_board["rows"]
+    for row_index in rendered_board["staleRows"]:
+        rendered_rows[row_index] = "".join(rendered_cells[row_index]) + "\n\n"
+    rendered_board["staleRows"].clear()
+
+    return rendered_board
+
+def build_rendered_bingo_board_for_team(team_ID: int) -> dict:
+    """
+        Renders every cell and row of the bingo board for the specified team.
+    """
+
+    bingo_board_data = get_teams_data()[team_ID]["bingoBoard"]
+    bingo_board = bingo_board_data["board"]
+    filled_positions = bingo_board_data["filledPositions"]
+    bingo_settings_snapshot = get_bingo_settings_snapshot()
+    bingo_board_size = bingo_settings_snapshot["boardSize"]
+    marked_color, unmarked_color = bingo_settings_snapshot["numberColors"]
+
+    rendered_cells = []
+    rendered_rows = []
     for row_index in range(bingo_board_size):
+        rendered_row_cells = []
         for col_index in range(bingo_board_size):
             number = bingo_board[row_index][col_index]
 
-            # Center the number within the defined gap
-            # E.g. if the GAP_BETWEEN_BOARD_COLUMNS is 2, 
-            # * The number 7 would be formatted as " 7 "
-            # * The 23, it would be "23 "
-            # * And 100 would be "100"
-            # What we see here is that it first centers the number in a field of width GAP_BETWEEN_BOARD_COLUMNS,
-            # and if it increases the length of the number, it first adds spaces to the left until it reaches the width,
-            # and then adds spaces to the right until it reaches the width.
-            number_str = f"{number:^{GAP_BETWEEN_BOARD_COLUMNS}}"
-            
             position = (row_index, col_index)
             if position in filled_positions:
-                number_color = get_bingo_number_colors().get("marked")
+                number_color = marked_color
             else:
-                number_color = get_bingo_number_colors().get("unmarked")
-            number_str = colored(number_str, number_color)
-            
-            stringified_board += f"{" " * GAP_BETWEEN_BOARD_COLUMNS}{number_str}{" " * GAP_BETWEEN_BOARD_COLUMNS}"
-
-        stringified_board += "\n\n"
+                number_color = unmarked_color
+            rendered_row_cells.append(get_rendered_bingo_cell(number, number_color))
+
+        rendered_cells.append(rendered_row_cells)
+        rendered_rows.append("".join(rendered_row_cells) + "\n\n")
+
+    rendered_board = {
+        "size": bingo_board_size,
+        "numberColors": (marked_color, unmarked_color),
+        "filledPositionsVersion": bingo_board_data["filledPositions"].version,
+        "cells": rendered_cells,
+        "rows": rendered_rows,
+        "staleRows": set()
+    }
+    return rendered_board
+
+@profiled()
+def get_stringified_bingo_board_for_team(team_ID: int) -> str:
+    """
+        Returns a stringified version of the bingo board for the specified team.
+        !Do note that the rendered rows are reused, so after marking a number only its cell is recolored (see `get_rendered_bingo_board_for_team`).
+    """
 
+    rendered_board = get_rendered_bingo_board_for_team(team_ID)
+    stringified_board = "".join(rendered_board["rows"])
     return stringified_board
 
-def has_team_won_bingo_game(team_ID: int) -> bool:
+def has_team_won_bingo_game(team_ID: int, bingo_settings_snapshot: MappingProxyType | None = None) -> bool:
     """
         Returns whether the specified team has won the bingo game.
+        When no Bingo settings snapshot is provided, the snapshot of the active game context is used.
     """
 
-    win_conditions = get_bingo_win_conditions()
+    if bingo_settings_snapshot is None:
+        bingo_settings_snapshot = get_bingo_settings_snapshot()
 
     # If the team has grabbed the required amount of green balls, they win the game.
-    green_balls_needed_to_win = win_conditions["green_balls_grabbed"]
+    green_balls_needed_to_win = bingo_settings_snapshot["greenBallsToWin"]
     green_balls_grabbed = get_amount_of_color_balls_grabbed_by_team(team_ID, "green")
     if green_balls_grabbed >= green_balls_needed_to_win:
         return True
     
     # If the team has filled enough lines on their bingo board, they win the game.
-    amount_of_lines_filled_on_board = get_bingo_board_total_filled_lines_amount_for_team(team_ID)
-    if amount_of_lines_filled_on_board >= win_conditions["lines_needed"]:
+    amount_of_lines_filled_on_board = get_bingo_board_total_filled_lines_amount_for_team(team_ID, bingo_settings_snapshot)
+    if amount_of_lines_filled_on_board >= bingo_settings_snapshot["linesToWin"]:
         return True
     
     return False
 
-def has_team_lost_bingo_game(team_ID: int) -> bool:
+def has_team_lost_bingo_game(team_ID: int, bingo_settings_snapshot: MappingProxyType | None = None) -> bool:
     """
         Returns whether the specified team has lost the bingo game.
+        When no Bingo settings snapshot is provided, the snapshot of the active game context is used.
     """
 
-    lose_conditions = get_bingo_lose_conditions()
+    if bingo_settings_snapshot is None:
+        bingo_settings_snapshot = get_bingo_settings_snapshot()
 
     # If the team has grabbed the required amount of red balls, they lose the game.
-    red_balls_needed_to_lose = lose_conditions["red_balls_grabbed"]
+    red_balls_needed_to_lose = bingo_settings_snapshot["redBallsToLose"]
     red_balls_grabbed = get_amount_of_color_balls_grabbed_by_team(team_ID, "red")
     if red_balls_grabbed >= red_balls_needed_to_lose:
         return True
@@ -198,7 +388,7 @@ def get_remaining_balls_for_team(team_ID: int) -> dict:
         Returns a dictionary which holds the remaining balls information for the specified team.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     balls_remaining = team_data["balls"]["remaining"]
     return balls_remaining
 
@@ -211,26 +401,46 @@ def get_remaining_color_balls_for_team(team_ID: int, color: str) -> int:
     remaining_color_balls = balls_remaining[color]
     return remaining_color_balls
 
-def get_remaining_bingo_board_numbers_for_team(team_ID: int) -> List[int]:
+def get_remaining_bingo_board_number_positions_for_team(team_ID: int) -> dict:
+    """
+        Returns a dictionary which holds the position of each remaining number on the bingo board for the specified team, in the order they appear on the board.
+        !Do note that if the filled positions have been changed since the remaining numbers were built (e.g. within the tests), we rebuild the remaining numbers from the filled positions.
+    """
+
+    bingo_board_data = get_teams_data()[team_ID]["bingoBoard"]
+    if bingo_board_data["remainingNumbersVersion"] == bingo_board_data["filledPositions"].version:
+        return bingo_board_data["remainingNumbers"]
+
+    filled_positions = bingo_board_data["filledPositions"]
+    remaining_numbers = {}
+    for number, position in bingo_board_data["numberPositions"].items():
+        if position not in filled_positions:
+            remaining_numbers[number] = position
+
+    bingo_board_data["remainingNumbers"] = remaining_numbers
+    bingo_board_data["remainingNumbersVersion"] = bingo_board_data["filledPositions"].version
+    return remaining_numbers
+
+def get_remaining_bingo_board_numbers_for_team(team_ID: int) -> list[int]:
     """
         Returns a list of the remaining numbers on the bingo board for the specified team.
     """
 
-    bingo_board = get_bingo_board_for_team(team_ID)
-    filled_positions = get_filled_positions_for_team(team_ID)
-    bingo_board_size = get_bingo_board_size()
-    
-    remaining_numbers = []
-    for row_index in range(bingo_board_size):
-        for col_index in range(bingo_board_size):
-            position = (row_index, col_index)
-            if position not in filled_positions:
-                number = bingo_board[row_index][col_index]
-                remaining_numbers.append(number)
-    
+    remaining_number_positions = get_remaining_bingo_board_number_positions_for_team(team_ID)
+    remaining_numbers = list(remaining_number_positions)
     return remaining_numbers
 
-def get_available_bingo_board_pit_balls_for_team(team_ID: int) -> List:
+def get_bingo_board_number_position_for_team(team_ID: int, number: int) -> tuple[int, int] | None:
+    """
+        Returns the position of the number on the bingo board for the specified team.
+        If the number isn't on the bingo board, we return None.
+    """
+
+    number_positions = get_teams_data()[team_ID]["bingoBoard"]["numberPositions"]
+    position = number_positions.get(number)
+    return position
+
+def get_available_bingo_board_pit_balls_for_team(team_ID: int) -> list:
     """
         Return a list which represents the bingo board pit for the specified team.
         It contains the remaining colored balls (red and green), as well as the remaining numbers on the specified team's bingo board.
@@ -256,27 +466,101 @@ def get_available_bingo_board_pit_balls_for_team(team_ID: int) -> List:
 
     return bingo_board_pit_balls
 
-def get_bingo_board_filled_horizontal_lines_amount_for_team(team_ID: int) -> int:
+def get_bingo_ball_pit_for_team(team_ID: int) -> dict:
     """
-        Returns the amount of filled horizontal lines on the bingo board for the specified team.
+        Returns the bingo ball pit numbers for the specified team.
+        !Do note that if the filled positions have been changed since the pit was built (e.g. within the tests), we rebuild the pit from the remaining numbers.
     """
 
-    filled_positions = get_filled_positions_for_team(team_ID)
+    team_data = get_teams_data()[team_ID]
+    bingo_ball_pit = team_data["ballPit"]
+    if bingo_ball_pit["filledPositionsVersion"] == team_data["bingoBoard"]["filledPositions"].version:
+        return bingo_ball_pit
 
-    bingo_board_size = get_bingo_board_size()
-    filled_horizontal_lines_amount = 0
-    for row_index in range(bingo_board_size):
-        horizontal_line_is_marked = True
-        for col_index in range(bingo_board_size):
-            position = (row_index, col_index)
+    # Make sure the remaining numbers are up to date, since the pit is built from them
+    get_remaining_bingo_board_number_positions_for_team(team_ID)
 
-            if position not in filled_positions:
-                horizontal_line_is_marked = False
-                break
-        
-        if horizontal_line_is_marked:
-            filled_horizontal_lines_amount += 1
-    
+    bingo_ball_pit = get_initial_bingo_ball_pit(team_data["bingoBoard"])
+    team_data["ballPit"] = bingo_ball_pit
+    return bingo_ball_pit
+
+def draw_bingo_ball_from_pit_for_team(team_ID: int) -> str | int:
+    """
+        Returns a random ball from the bingo ball pit for the specified team, without removing it from the pit.
+        The ball can either be a colored ball (red or green) or a remaining number on the team's bingo board,
+        where every single ball has the same chance to be drawn.
+        If the pit is empty, we raise a GameExhaustedError.
+        !Do note that we only pick a single random index, instead of building a list of all balls within the pit.
+    """
+
+    pit_numbers = get_bingo_ball_pit_for_team(team_ID)["numbers"]
+    remaining_green_balls = get_remaining_color_balls_for_team(team_ID, "green")
+    remaining_red_balls = get_remaining_color_balls_for_team(team_ID, "red")
+
+    total_balls_amount = remaining_green_balls + remaining_red_balls + len(pit_numbers)
+    if total_balls_amount == 0:
+        raise GameExhaustedError(f"The bingo ball pit of team {team_ID + 1} is empty.")
+
+    random_index = randrange(total_balls_amount)
+    if random_index < remaining_green_balls:
+        increase_counter("lingo_bingo_balls_drawn_total", ("green",))
+        return "green"
+
+    random_index -= remaining_green_balls
+    if random_index < remaining_red_balls:
+        increase_counter("lingo_bingo_balls_drawn_total", ("red",))
+        return "red"
+
+    random_index -= remaining_red_balls
+    increase_counter("lingo_bingo_balls_drawn_total", ("number",))
+    return pit_numbers[random_index]
+
+def get_bingo_grab_result_for_team(team_ID: int, grabbed_ball: str | int, grab_number: int) -> str:
+    """
+        Returns the result of the grabbed ball for the specified team, after the ball has been applied to the team's data.
+        The result is one of the following:
+        * "won" when the team has won the bingo game.
+        * "lost" when the team has lost the bingo game.
+        * "turnEnded" when the team grabbed a red ball, or has used all grabs of their bingo turn.
+        * "continue" when the team can grab another ball.
+        !Do note that the grab number starts at 1 for the first grab of the bingo turn.
+    """
+
+    # This is called after every grab, so the settings snapshot is only read once and passed on
+    bingo_settings_snapshot = get_bingo_settings_snapshot()
+    if has_team_won_bingo_game(team_ID, bingo_settings_snapshot):
+        return "won"
+
+    if has_team_lost_bingo_game(team_ID, bingo_settings_snapshot):
+        return "lost"
+
+    # If the team grabbed a red ball, their bingo turn ends early
+    if grabbed_ball == "red" or grab_number >= bingo_settings_snapshot["maximumGrabsPerRound"]:
+        return "turnEnded"
+
+    return "continue"
+
+def get_bingo_board_filled_lines_amount_for_team(team_ID: int, direction: str) -> int:
+    """
+        Returns the amount of filled lines in the specified direction (horizontal, vertical or diagonal) on the bingo board for the specified team.
+    """
+
+    filled_positions_mask = get_filled_positions_mask_for_team(team_ID)
+    bingo_line_masks = get_bingo_settings_snapshot()["lineMasks"]
+
+    filled_lines_amount = 0
+    for line_mask in bingo_line_masks[direction]:
+        if filled_positions_mask & line_mask == line_mask:
+            filled_lines_amount += 1
+
+    return filled_lines_amount
+
+def get_bingo_board_filled_horizontal_lines_amount_for_team(team_ID: int) -> int:
+    """
+        Returns the amount of filled horizontal lines on the bingo board for the specified team.
+    """
+
+    filled_horizontal_lines_amount = get_bingo_board_filled_lines_amount_for_team(team_ID, "horizontal")
     return filled_horizontal_lines_amount
 
 def get_bingo_board_filled_vertical_lines_amount_for_team(team_ID: int) -> int:
@@ -284,22 +568,7 @@ def get_bingo_board_filled_vertical_lines_amount_for_team(team_ID: int) -> int:
         Returns the amount of filled vertical lines on the bingo board for the specified team.
     """
 
-    filled_positions = get_filled_positions_for_team(team_ID)
-
-    bingo_board_size = get_bingo_board_size()
-    filled_vertical_lines_amount = 0
-    for col_index in range(bingo_board_size):
-        vertical_line_is_marked = True
-        for row_index in range(bingo_board_size):
-            position = (row_index, col_index)
-
-            if position not in filled_positions:
-                vertical_line_is_marked = False
-                break
-        
-        if vertical_line_is_marked:
-            filled_vertical_lines_amount += 1
-    
+    filled_vertical_lines_amount = get_bingo_board_filled_lines_amount_for_team(team_ID, "vertical")
     return filled_vertical_lines_amount
 
 def get_bingo_board_filled_diagonal_lines_amount_for_team(team_ID: int) -> int:
@@ -307,45 +576,56 @@ def get_bingo_board_filled_diagonal_lines_amount_for_team(team_ID: int) -> int:
         Returns the amount of filled diagonal lines on the bingo board for the specified team.
     """
 
-    filled_positions = get_filled_positions_for_team(team_ID)
-    bingo_board_size = get_bingo_board_size()
+    filled_diagonal_lines_amount = get_bingo_board_filled_lines_amount_for_team(team_ID, "diagonal")
+    return filled_diagonal_lines_amount
 
-    filled_diagonal_lines_amount = 0
+def get_completed_bingo_lines_through_position_for_team(team_ID: int, position: tuple[int, int]) -> list[tuple[str, int]]:
+    """
+        Returns the filled lines which go through the specified position on the bingo board for the specified team.
+        Each line is returned as a tuple of its direction and its index (e.g. ("horizontal", 2) for the third row).
+        !Do note that the first diagonal line goes from top-left to bottom-right, and the second from top-right to bottom-left.
+    """
 
-    # Check top-left to bottom-right diagonal line
-    diagonal_line_is_marked = True
-    for index in range(bingo_board_size):
-        position = (index, index)
-        if position not in filled_positions:
-            diagonal_line_is_marked = False
-            break
-    if diagonal_line_is_marked:
-        filled_diagonal_lines_amount += 1
+    filled_positions_mask = get_filled_positions_mask_for_team(team_ID)
+    bingo_settings_snapshot = get_bingo_settings_snapshot()
+    bingo_board_size = bingo_settings_snapshot["boardSize"]
+    bingo_line_masks = bingo_settings_snapshot["lineMasks"]
+    row_index, col_index = position
 
-    # Check top-right to bottom-left diagonal line
-    diagonal_line_is_marked = True
-    for index in range(bingo_board_size):
-        column_index = bingo_board_size - 1 - index
-        position = (index, column_index)
-        if position not in filled_positions:
-            diagonal_line_is_marked = False
-            break
-    
-    if diagonal_line_is_marked:
-        filled_diagonal_lines_amount += 1
+    lines_through_position = [
+        ("horizontal", row_index),
+        ("vertical", col_index)
+    ]
+    if row_index == col_index:
+        lines_through_position.append(("diagonal", 0))
+    if row_index + col_index == bingo_board_size - 1:
+        lines_through_position.append(("diagonal", 1))
 
-    return filled_diagonal_lines_amount
+    completed_lines = []
+    for direction, line_index in lines_through_position:
+        line_mask = bingo_line_masks[direction][line_index]
+        if filled_positions_mask & line_mask == line_mask:
+            completed_lines.append((direction, line_index))
+
+    return completed_lines
 
-def get_bingo_board_total_filled_lines_amount_for_team(team_ID: int) -> int:
+def get_bingo_board_total_filled_lines_amount_for_team(team_ID: int, bingo_settings_snapshot: MappingProxyType | None = None) -> int:
     """
         Returns the total amount of filled lines on the bingo board for the specified team.
+        When no Bingo settings snapshot is provided, the snapshot of the active game context is used.
     """
 
-    filled_horizontal_lines_amount = get_bingo_board_filled_horizontal_lines_amount_for_team(team_ID)
-    filled_vertical_lines_amount = get_bingo_board_filled_vertical_lines_amount_for_team(team_ID)
-    filled_diagonal_lines_amount = get_bingo_board_filled_diagonal_lines_amount_for_team(team_ID)
+    if bingo_settings_snapshot is None:
+        bingo_settings_snapshot = get_bingo_settings_snapshot()
+
+    # The bitmask and the line masks are only read once for the lines of every direction
+    filled_positions_mask = get_filled_positions_mask_for_team(team_ID)
+    total_filled_lines_amount = 0
+    for direction_line_masks in bingo_settings_snapshot["lineMasks"].values():
+        for line_mask in direction_line_masks:
+            if filled_positions_mask & line_mask == line_mask:
+                total_filled_lines_amount += 1
 
-    total_filled_lines_amount = filled_horizontal_lines_amount + filled_vertical_lines_amount + filled_diagonal_lines_amount
     return total_filled_lines_amount
 
 
@@ -370,19 +650,118 @@ def decrease_remaining_color_balls_for_team(team_ID: int, color: str) -> None:
     balls_remaining = get_remaining_balls_for_team(team_ID)
     balls_remaining[color] -= 1
 
-def mark_number_on_bingo_board_for_team(team_ID: int, grabbed_number: int) -> None:
+def mark_number_on_bingo_board_for_team(team_ID: int, grabbed_number: int) -> list[tuple[str, int]]:
     """
         Marks the grabbled number on the bingo board for the specified team.
+        We return the lines which have been completed by marking the number (see `get_completed_bingo_lines_through_position_for_team`).
     """
-    
-    bingo_board = get_bingo_board_for_team(team_ID)
-    filled_positions = get_filled_positions_for_team(team_ID)
 
-    bingo_board_size = get_bingo_board_size()
-    for row_index in range(bingo_board_size):
-        for col_index in range(bingo_board_size):
-            number = bingo_board[row_index][col_index]
-            if number == grabbed_number:
-                position = (row_index, col_index)
-                filled_positions.add(position)
-                return
\ No newline at end of file
+    position = get_bingo_board_number_position_for_team(team_ID, grabbed_number)
+    if position is None:
+        return []
+
+    was_filled = position in get_filled_positions_for_team(team_ID)
+    add_filled_position_for_team(team_ID, position)
+    if not was_filled:
+        rerender_marked_bingo_cell_for_team(team_ID, position)
+
+    completed_lines = get_completed_bingo_lines_through_position_for_team(team_ID, position)
+    return completed_lines
+
+def apply_grabbed_bingo_ball_for_team(team_ID: int, grabbed_ball: str | int) -> list[tuple[str, int]]:
+    """
+        Updates the teams_data structure for the specified team based on the grabbed ball.
+        If the ball is a colored ball (red or green), we move it from the remaining balls to the grabbed balls.
+        Else, it is a number, which we mark on the team's bingo board.
+        We return the lines which have been completed by the grabbed ball, which is always empty for colored balls.
+    """
+
+    if type(grabbed_ball) is str:
+        decrease_remaining_color_balls_for_team(team_ID, grabbed_ball)
+        increase_grabbed_color_balls_for_team(team_ID, grabbed_ball)
+        return []
+
+    completed_lines = mark_number_on_bingo_board_for_team(team_ID, grabbed_ball)
+    return completed_lines
+
+def add_filled_position_for_team(team_ID: int, position: tuple[int, int]) -> None:
+    """
+        Adds the position to the filled positions on the bingo board for the specified team,
+        and updates the filled positions bitmask, remaining numbers and bingo ball pit accordingly.
+    """
+
+    team_data = get_teams_data()[team_ID]
+    bingo_board_data = team_data["bingoBoard"]
+    filled_positions = bingo_board_data["filledPositions"]
+    if position in filled_positions:
+        return
+
+    # Make sure the bitmask, remaining numbers and bingo ball pit are up to date before we add the position to them
+    filled_positions_mask = get_filled_positions_mask_for_team(team_ID)
+    remaining_numbers = get_remaining_bingo_board_number_positions_for_team(team_ID)
+    get_bingo_ball_pit_for_team(team_ID)
+
+    row_index, col_index = position
+    number = bingo_board_data["board"][row_index][col_index]
+    remaining_numbers.pop(number, None)
+    remove_number_from_bingo_ball_pit_for_team(team_ID, number)
+
+    filled_positions.add(position)
+    bingo_board_data["filledMask"] = filled_positions_mask | get_bingo_position_bit(position, get_bingo_settings_snapshot()["boardSize"])
+
+    # The bitmask, remaining numbers and bingo ball pit have been updated together with the filled positions, so they stay up to date
+    filled_positions_version = filled_positions.version
+    bingo_board_data["filledMaskVersion"] = filled_positions_version
+    bingo_board_data["remainingNumbersVersion"] = filled_positions_version
+    team_data["ballPit"]["filledPositionsVersion"] = filled_positions_version
+
+def set_filled_positions_for_team(team_ID: int, positions: set) -> None:
+    """
+        Replaces the filled positions on the bingo board for the specified team, e.g. to set up a bingo board within the tests.
+        The bitmask, remaining numbers, bingo ball pit and rendered board are rebuilt the next time they are used.
+        !Do note that the filled positions are replaced within the same set, so its version keeps counting up.
+    """
+
+    filled_positions = get_teams_data()[team_ID]["bingoBoard"]["filledPositions"]
+    filled_positions.clear()
+    filled_positions.update(positions)
+
+def rerender_marked_bingo_cell_for_team(team_ID: int, position: tuple[int, int]) -> None:
+    """
+        Recolors the cell of the newly marked position within the rendered bingo board of the specified team, and marks its row as stale.
+        If the board hasn't been rendered yet, or the rendered board was already out of date, we leave it to be rendered again as a whole.
+    """
+
+    bingo_board_data = get_teams_data()[team_ID]["bingoBoard"]
+    rendered_board = bingo_board_data.get("renderedBoard")
+    if rendered_board is None:
+        return
+
+    # The position has just been added, so the rendered board is only up to date when it was built from the previous version of the filled positions
+    if rendered_board["filledPositionsVersion"] != bingo_board_data["filledPositions"].version - 1:
+        bingo_board_data["renderedBoard"] = None
+        return
+
+    row_index, col_index = position
+    number = bingo_board_data["board"][row_index][col_index]
+    rendered_board["cells"][row_index][col_index] = get_rendered_bingo_cell(number, rendered_board["numberColors"][0])
+    rendered_board["staleRows"].add(row_index)
+    rendered_board["filledPositionsVersion"] = bingo_board_data["filledPositions"].version
+
+def remove_number_from_bingo_ball_pit_for_team(team_ID: int, number: int) -> None:
+    """
+        Removes the number from the bingo ball pit for the specified team,
+        by swapping it with the last number within the pit and removing the last number.
+    """
+
+    bingo_ball_pit = get_teams_data()[team_ID]["ballPit"]
+    pit_numbers = bingo_ball_pit["numbers"]
+    pit_number_indexes = bingo_ball_pit["numberIndexes"]
+    if number not in pit_number_indexes:
+        return
+
+    number_index = pit_number_indexes.pop(number)
+    last_number = pit_numbers.pop()
+    if last_number != number:
+        pit_numbers[number_index] = last_number
+        pit_number_indexes[last_number] = number_index
\ No newline at end of file
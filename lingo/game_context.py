@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Iterator
+from .teams_data import teams_data
+
+# A game context holds all the state of a single Lingo game:
+# * "teamsData" holds the data of each team, which includes their Wordle rounds, Bingo board and balls.
+# * "wordDecks" holds the word decks which hand out the unused Wordle words of the game.
+# * "engineState" holds the state of the headless game engine, which is only added when the engine is used.
+# * "wordleBoardRenders" holds the last rendered rows of each team's Wordle board, which is only added when a board is stringified.
+# * "settingsSnapshot" holds the read-only settings of the game (see `get_settings_snapshot`), which is only added when the settings are first read.
+# * "wordleSettingsSnapshot" and "bingoSettingsSnapshot" hold the Wordle and Bingo parts of the settings snapshot, so the hot paths can read them with a single lookup.
+#! Do note that the default game context uses the global teams_data list, so code which still uses that list keeps working
+_default_game_context = {
+    "teamsData": teams_data,
+    "wordDecks": {}
+}
+
+# The game context which is used by all utility functions.
+# Since this is a ContextVar, each thread (or asyncio task) can use its own game context, so many games can be hosted within one process
+_active_game_context = ContextVar("active_game_context", default=_default_game_context)
+
+
+###
+### GETTERS
+###
+
+
+def create_game_context() -> dict:
+    """
+        Returns a new, empty game context.
+        !Do note that the teams data of the game context must still be initialized with `initialize_teams_data` while the game context is used.
+    """
+
+    game_context = {
+        "teamsData": [],
+        "wordDecks": {}
+    }
+    return game_context
+
+def get_default_game_context() -> dict:
+    """
+        Returns the default game context, which uses the global teams_data list.
+    """
+
+    return _default_game_context
+
+def get_active_game_context() -> dict:
+    """
+        Returns the game context which is currently used.
+    """
+
+    active_game_context = _active_game_context.get()
+    return active_game_context
+
+def get_teams_data() -> list:
+    """
+        Returns the teams data of the game context which is currently used.
+    """
+
+    teams_data_of_game = _active_game_context.get()["teamsData"]
+    return teams_data_of_game
+
+
+###
+### UTILITIES
+###
+
+
+@contextmanager
+def use_game_context(game_context: dict) -> Iterator[dict]:
+    """
+        Use the provided game context within the `with` block, after which the previously used game context is used again.
+        E.g.:
+            game_context = create_game_context()
+            with use_game_context(game_context):
+                initialize_teams_data()
+    """
+
+    token = _active_game_context.set(game_context)
+    try:
+        yield game_context
+    finally:
+        _active_game_context.reset(token)
@@ -1,5 +1,9 @@
 from .lingo_utils import get_next_team_ID, print_message, has_team_won_lingo_game, initialize_teams_data
+from .lingo_output import ask_input, flush_output
+from .lingo_profiling import dump_profile
+from .lingo_metrics import increase_gauge
 from .lingo_settings.lingo_settings_utils import get_starting_team_ID
+from .settings_loader import reload_changed_settings
 from .wordle.wordle import play_wordle_round_for_team
 from .wordle.wordle_utils import has_team_guessed_word_correctly_in_current_wordle_round
 from .bingo.bingo import play_bingo_round_for_team
@@ -27,6 +31,27 @@ def start_game() -> None:
         Start the Lingo game.
     """
 
+    # Use the latest settings when a settings file has changed since the previous game.
+    # If the changed settings are invalid, we tell the players and keep playing with the previous settings
+    try:
+        reload_changed_settings()
+    except ValueError as error:
+        print_message(f"{error} The previous settings are used instead.", "red")
+
+    increase_gauge("lingo_games_in_progress")
+    try:
+        play_game()
+    finally:
+        increase_gauge("lingo_games_in_progress", amount=-1)
+
+    # Show where the time of the game went, when profiling is enabled
+    dump_profile()
+
+def play_game() -> None:
+    """
+        Play a single Lingo game, from the first Wordle round until a team has won or lost.
+    """
+
     # Initialize the teams data.
     # This must be done at the start of the Lingo game
     initialize_teams_data()
@@ -49,6 +74,9 @@ def start_game() -> None:
             if won_or_lost_bingo_game:
                 break
         
+        # Write the output of the turn at once, before the next team gets their turn
+        flush_output()
+
         # Switch to the next team to let them play the next Lingo round
         current_team_ID = get_next_team_ID(current_team_ID)
 
@@ -58,6 +86,8 @@ def start_game() -> None:
     else:
         print_losing_team_message(current_team_ID)
 
+    flush_output()
+
 def ask_to_play_again() -> bool:
     """
         Ask both teams if they want to play another game of Lingo.
@@ -70,7 +100,7 @@ def ask_to_play_again() -> bool:
     }
 
     while True:
-        user_input = input("Do you want to play another game of Lingo? (yes/no): ").strip().lower()
+        user_input = ask_input("Do you want to play another game of Lingo? (yes/no): ").strip().lower()
         
         if user_input in ask_to_play_again_options['yes']:
             return True
@@ -0,0 +1,117 @@
+from random import choice
+from .wordle.words.words_utils import get_words_of_length
+from .wordle.wordle_feedback import get_feedback_pattern, encode_feedback_colors
+from .wordle.wordle_solver import create_solver_state, apply_guess_to_solver_state, get_suggested_guess
+
+# A bot is a function which returns a Wordle guess, based on what a player can see of the current Wordle round:
+# * "wordLength" is the length of the word to guess.
+# * "firstLetter" is the first letter of the word to guess, which is always shown to the player.
+# * "guesses" holds the previous guesses of the round, and "guessesColor" holds the colors of each of those guesses.
+#! Do note that a bot never gets to see the word to guess itself
+
+# The words of each length which start with a certain letter, so bots do not have to go through the whole words list for every guess.
+# Each entry holds the words list it was built from, so it is built again when the words list of that length has been replaced
+_words_by_first_letter = {}
+
+
+###
+### GETTERS
+###
+
+
+def get_words_of_length_starting_with(length: int, first_letter: str) -> list[str]:
+    """
+        Returns all words of the specified length which start with the specified letter.
+    """
+
+    words_of_length = get_words_of_length(length)
+    cached_words_by_first_letter = _words_by_first_letter.get(length)
+    if cached_words_by_first_letter is None or cached_words_by_first_letter["words"] is not words_of_length:
+        words_by_first_letter = {}
+        for word in words_of_length:
+            words_by_first_letter.setdefault(word[0], []).append(word)
+        cached_words_by_first_letter = {
+            "words": words_of_length,
+            "byFirstLetter": words_by_first_letter
+        }
+        _words_by_first_letter[length] = cached_words_by_first_letter
+
+    words_starting_with_letter = cached_words_by_first_letter["byFirstLetter"].get(first_letter, [])
+    return words_starting_with_letter
+
+def get_candidate_words(bot_view: dict) -> list[str]:
+    """
+        Returns all words which could still be the word to guess, based on the colors of the previous guesses.
+    """
+
+    candidate_words = get_words_of_length_starting_with(bot_view["wordLength"], bot_view["firstLetter"])
+    for guess, guess_colors in zip(bot_view["guesses"], bot_view["guessesColor"]):
+        feedback_pattern = encode_feedback_colors(guess_colors)
+
+        matching_words = []
+        for word in candidate_words:
+            if get_feedback_pattern(guess, word) == feedback_pattern:
+                matching_words.append(word)
+        candidate_words = matching_words
+
+    return candidate_words
+
+def get_bot(bot_name: str):
+    """
+        Returns the bot function with the specified name.
+        If there is no bot with that name, we raise a ValueError.
+    """
+
+    if bot_name not in BOTS:
+        raise ValueError(f"Invalid bot '{bot_name}'. Please use one of the following bots: {', '.join(BOTS)}.")
+
+    return BOTS[bot_name]
+
+
+###
+### BOTS
+###
+
+
+def random_bot(bot_view: dict) -> str:
+    """
+        Guess a random word which starts with the shown first letter, without looking at the colors of the previous guesses.
+    """
+
+    candidate_words = get_words_of_length_starting_with(bot_view["wordLength"], bot_view["firstLetter"])
+    return choice(candidate_words)
+
+def filtering_bot(bot_view: dict) -> str:
+    """
+        Guess a random word which matches the colors of all previous guesses, like a careful player would.
+        If no word matches (e.g. when the word to guess isn't within the words list), we fall back to a random guess.
+    """
+
+    candidate_words = get_candidate_words(bot_view)
+    if len(candidate_words) == 0:
+        return random_bot(bot_view)
+
+    return choice(candidate_words)
+
+def solver_bot(bot_view: dict) -> str:
+    """
+        Guess the word which is expected to tell the most about the word to guess, based on the colors of all previous guesses.
+        If no word matches (e.g. when the word to guess isn't within the words list), we fall back to a random guess.
+    """
+
+    solver_state = create_solver_state(bot_view["wordLength"], bot_view["firstLetter"])
+    for guess, guess_colors in zip(bot_view["guesses"], bot_view["guessesColor"]):
+        apply_guess_to_solver_state(solver_state, guess, guess_colors)
+
+    suggested_guess = get_suggested_guess(solver_state)
+    if suggested_guess is None:
+        return random_bot(bot_view)
+
+    return suggested_guess
+
+# The available bots, by their name
+BOTS = {
+    "random": random_bot,
+    "filtering": filtering_bot,
+    "solver": solver_bot
+}
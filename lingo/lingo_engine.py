@@ -0,0 +1,297 @@
+from time import perf_counter
+from .game_context import get_teams_data, get_active_game_context
+from .lingo_utils import get_next_team_ID, initialize_teams_data, set_winning_team, set_losing_team, get_winning_team_ID, get_losing_team_ID
+from .lingo_settings.lingo_settings_utils import get_starting_team_ID
+from .settings_snapshot import get_settings_snapshot, get_wordle_settings_snapshot
+from .settings_loader import reload_changed_settings
+from .wordle.wordle_utils import add_single_initial_rounds_info_for_team, add_guess_to_current_round_for_team, is_valid_wordle_guess, get_current_wordle_round_word_to_guess_for_team, get_current_wordle_round_guesses_by_team, get_current_wordle_round_guesses_color_for_team, has_team_won_wordle_game, has_team_lost_wordle_game, amount_of_wordle_rounds_won_by_team, amount_of_wordle_rounds_lost_in_a_row_by_team
+from .lingo_metrics import observe_histogram
+from .bingo.bingo_utils import draw_bingo_ball_from_pit_for_team, apply_grabbed_bingo_ball_for_team, get_bingo_grab_result_for_team, get_bingo_board_total_filled_lines_amount_for_team
+
+# The engine drives a Lingo game from code, without asking for input or printing anything.
+# It follows the same rules as `start_game`, `play_wordle_round_for_team` and `play_bingo_round_for_team`:
+# * A team guesses the Wordle word. When they guess it correctly, they get to grab balls within the "bingo" phase.
+# * After the Wordle round is lost, or after the bingo turn has ended, the next team gets their turn.
+# * The game is "finished" as soon as a team has won or lost the Wordle or Bingo game.
+#! Do note that the engine plays the game of the active game context. To play many games at once, use a game context per game (see `use_game_context`)
+
+
+###
+### GETTERS
+###
+
+
+def get_engine_state() -> dict:
+    """
+        Returns the engine state of the game within the active game context.
+        If the engine hasn't been used within the active game context yet, we add the initial engine state to it.
+    """
+
+    game_context = get_active_game_context()
+    if "engineState" not in game_context:
+        game_context["engineState"] = {
+            "phase": "finished",
+            "currentTeamID": 0,
+            "attemptNumber": 0,
+            "grabsAmount": 0,
+            "turnsAmount": 0,
+            "phaseStartedAt": 0
+        }
+
+    engine_state = game_context["engineState"]
+    return engine_state
+
+def get_game_phase() -> str:
+    """
+        Returns the phase of the current game, which is either "wordle", "bingo" or "finished".
+    """
+
+    engine_state = get_engine_state()
+    game_phase = engine_state["phase"]
+    return game_phase
+
+def is_game_finished() -> bool:
+    """
+        Returns whether the current game has finished, because a team has won or lost.
+    """
+
+    engine_state = get_engine_state()
+    is_finished = engine_state["phase"] == "finished"
+    return is_finished
+
+def get_current_team_ID() -> int:
+    """
+        Returns the ID of the team whose turn it is.
+    """
+
+    engine_state = get_engine_state()
+    current_team_ID = engine_state["currentTeamID"]
+    return current_team_ID
+
+def get_game_state_snapshot() -> dict:
+    """
+        Returns a snapshot of the current game state.
+        !Do note that the snapshot is a copy, so changing it does not change the game itself.
+        !The word to guess of the current Wordle round is not part of the snapshot.
+    """
+
+    engine_state = get_engine_state()
+    current_team_ID = engine_state["currentTeamID"]
+    teams_data = get_teams_data()
+
+    teams_snapshot = []
+    for team_ID, team_data in enumerate(teams_data):
+        teams_snapshot.append({
+            "roundsWon": amount_of_wordle_rounds_won_by_team(team_ID),
+            "roundsLostInARow": amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID),
+            "ballsGrabbed": dict(team_data["balls"]["grabbed"]),
+            "filledLinesAmount": get_bingo_board_total_filled_lines_amount_for_team(team_ID),
+            "hasWon": team_data["hasWon"],
+            "hasLost": team_data["hasLost"]
+        })
+
+    current_round_snapshot = None
+    if len(teams_data) > 0 and len(teams_data[current_team_ID]["roundsInfo"]) > 0:
+        guesses = []
+        for guess in get_current_wordle_round_guesses_by_team(current_team_ID):
+            guesses.append(''.join(guess))
+
+        guesses_color = []
+        for guess_colors in get_current_wordle_round_guesses_color_for_team(current_team_ID):
+            guesses_color.append(list(guess_colors))
+
+        current_round_snapshot = {
+            "guesses": guesses,
+            "guessesColor": guesses_color
+        }
+
+    game_state_snapshot = {
+        "phase": engine_state["phase"],
+        "currentTeamID": current_team_ID,
+        "attemptNumber": engine_state["attemptNumber"],
+        "grabsAmount": engine_state["grabsAmount"],
+        "turnsAmount": engine_state["turnsAmount"],
+        "winningTeamID": get_winning_team_ID() if len(teams_data) > 0 else None,
+        "losingTeamID": get_losing_team_ID() if len(teams_data) > 0 else None,
+        "currentRound": current_round_snapshot,
+        "teams": teams_snapshot,
+        "settingsVersion": get_settings_snapshot()["version"]
+    }
+    return game_state_snapshot
+
+
+###
+### SETTERS
+###
+
+
+def new_game() -> dict:
+    """
+        Start a new Lingo game, and return the snapshot of its initial state.
+        The team which starts the game is the starting team ID set within the Lingo settings.
+        Settings files which have changed since the previous game are reloaded first, so the game runs under the latest settings.
+        !Do note that when the changed settings are invalid, a ValueError is raised and the previous settings are kept for the next game.
+    """
+
+    reload_changed_settings()
+
+    engine_state = get_engine_state()
+    initialize_teams_data()
+
+    engine_state["currentTeamID"] = get_starting_team_ID()
+    engine_state["turnsAmount"] = 0
+    start_wordle_round_for_current_team()
+
+    return get_game_state_snapshot()
+
+def start_wordle_round_for_current_team() -> None:
+    """
+        Start a new Wordle round for the team whose turn it is.
+    """
+
+    engine_state = get_engine_state()
+    engine_state["phase"] = "wordle"
+    engine_state["attemptNumber"] = 0
+    engine_state["grabsAmount"] = 0
+    engine_state["turnsAmount"] += 1
+    engine_state["phaseStartedAt"] = perf_counter()
+    add_single_initial_rounds_info_for_team(engine_state["currentTeamID"])
+
+def end_turn_of_current_team() -> None:
+    """
+        End the turn of the current team, and start a new Wordle round for the next team.
+    """
+
+    engine_state = get_engine_state()
+    engine_state["currentTeamID"] = get_next_team_ID(engine_state["currentTeamID"])
+    start_wordle_round_for_current_team()
+
+def record_duration_of_current_phase() -> None:
+    """
+        Record how long the Wordle round or bingo turn of the current team has taken within the round duration metric.
+        !Do note that this must be done before the phase changes.
+    """
+
+    engine_state = get_engine_state()
+    observe_histogram("lingo_round_duration_seconds", perf_counter() - engine_state["phaseStartedAt"], (engine_state["phase"],))
+
+def finish_game() -> None:
+    """
+        Mark the current game as finished.
+    """
+
+    engine_state = get_engine_state()
+    engine_state["phase"] = "finished"
+
+def submit_guess(guess: str) -> dict:
+    """
+        Submit a Wordle guess for the team whose turn it is.
+        If the guess isn't valid, the game state doesn't change and we return the validation message.
+        Else, we return the colors of the guess, and whether the guess has finished the Wordle round or the game.
+    """
+
+    engine_state = get_engine_state()
+    validate_game_phase("wordle")
+
+    team_ID = engine_state["currentTeamID"]
+    guess = guess.strip().lower()
+    guess_validation = is_valid_wordle_guess(guess, team_ID)
+    if not guess_validation["isValid"]:
+        return {
+            "isValid": False,
+            "message": guess_validation["message"],
+            "colors": [],
+            "isCorrect": False,
+            "roundFinished": False,
+            "gameFinished": False
+        }
+
+    attempt_number = engine_state["attemptNumber"]
+    add_guess_to_current_round_for_team(team_ID, guess, attempt_number)
+    guess_colors = list(get_current_wordle_round_guesses_color_for_team(team_ID)[attempt_number])
+
+    is_correct = (guess == get_current_wordle_round_word_to_guess_for_team(team_ID))
+    round_finished = is_correct or attempt_number == get_wordle_settings_snapshot()["maxGuessAttempts"] - 1
+    if round_finished:
+        record_duration_of_current_phase()
+
+    if is_correct:
+        # If the team has won the Wordle game, the game is finished.
+        # Else, the team gets to grab balls within the bingo phase
+        if has_team_won_wordle_game(team_ID):
+            set_winning_team(team_ID)
+            finish_game()
+        else:
+            engine_state["phase"] = "bingo"
+            engine_state["grabsAmount"] = 0
+            engine_state["phaseStartedAt"] = perf_counter()
+    elif round_finished:
+        # If the team has lost the Wordle game, the game is finished.
+        # Else, the next team gets their turn
+        if has_team_lost_wordle_game(team_ID):
+            set_losing_team(team_ID)
+            finish_game()
+        else:
+            end_turn_of_current_team()
+    else:
+        engine_state["attemptNumber"] += 1
+
+    return {
+        "isValid": True,
+        "message": "",
+        "colors": guess_colors,
+        "isCorrect": is_correct,
+        "roundFinished": round_finished,
+        "gameFinished": is_game_finished()
+    }
+
+def grab_ball() -> dict:
+    """
+        Grab a single ball from the bingo ball pit for the team whose turn it is.
+        We return the grabbed ball, the lines it has completed, and whether it has finished the bingo turn or the game.
+    """
+
+    validate_game_phase("bingo")
+
+    engine_state = get_engine_state()
+    team_ID = engine_state["currentTeamID"]
+    grabbed_ball = draw_bingo_ball_from_pit_for_team(team_ID)
+    completed_lines = apply_grabbed_bingo_ball_for_team(team_ID, grabbed_ball)
+    engine_state["grabsAmount"] += 1
+
+    grab_result = get_bingo_grab_result_for_team(team_ID, grabbed_ball, engine_state["grabsAmount"])
+    if grab_result != "continue":
+        record_duration_of_current_phase()
+
+    if grab_result == "won":
+        set_winning_team(team_ID)
+        finish_game()
+    elif grab_result == "lost":
+        set_losing_team(team_ID)
+        finish_game()
+    elif grab_result == "turnEnded":
+        end_turn_of_current_team()
+
+    return {
+        "ball": grabbed_ball,
+        "completedLines": completed_lines,
+        "turnFinished": grab_result != "continue",
+        "gameFinished": is_game_finished()
+    }
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_game_phase(expected_phase: str) -> None:
+    """
+        Validate that the current game is within the expected phase.
+        If it isn't, we raise a RuntimeError.
+    """
+
+    engine_state = get_engine_state()
+    current_phase = engine_state["phase"]
+    if current_phase != expected_phase:
+        raise RuntimeError(f"This action can only be done within the '{expected_phase}' phase, but the game is within the '{current_phase}' phase.")
@@ -0,0 +1,5 @@
+class GameExhaustedError(IndexError):
+    """
+        Raised when the game can not continue, since every Wordle word has been used or a bingo ball pit has run empty.
+        !Do note that this is an IndexError, so code which catches an IndexError for these cases keeps working.
+    """
@@ -0,0 +1,359 @@
+import os
+import sys
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import wraps
+from time import perf_counter, time
+from .lingo_settings.lingo_settings_utils import get_metrics_settings
+
+# The metrics file can be overwritten with this environment variable, without changing the Lingo settings.
+# When it is set, the metrics are written even when they are disabled within the Lingo settings
+METRICS_FILE_ENVIRONMENT_VARIABLE = "LINGO_METRICS_FILE"
+
+# The available metric types, which are written in the Prometheus text format:
+# * "counter" only goes up, e.g. the amount of guesses.
+# * "gauge" can go up and down, e.g. the amount of games in progress.
+# * "histogram" counts the observed values within buckets, e.g. how long rounds take.
+METRIC_TYPES = ("counter", "gauge", "histogram")
+
+# The upper bounds in seconds of the buckets of the round duration histogram.
+# A headless round takes well below a millisecond, while a round played by people takes up to minutes
+ROUND_DURATION_BUCKETS = (0.001, 0.01, 0.1, 1, 5, 15, 30, 60, 120, 300)
+
+# The metrics registry holds each metric by its name, together with its type, help text and the names of its labels.
+# The values of a metric are kept by their label values (e.g. ("green",) for the color label), where a histogram value holds:
+# * "buckets", the amount of observed values per bucket (not cumulative), where the last bucket holds the values above the highest bound.
+# * "sum" and "count", the sum and amount of all observed values.
+_metrics = {}
+
+# The state of the metrics writer, which writes the metrics file periodically from a background thread.
+# The file path which has been set from code has priority over the environment variable and the Lingo settings
+_metrics_writer = {
+    "filePath": None,
+    "thread": None,
+    "stopEvent": None
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_metric(name: str) -> dict:
+    """
+        Returns the registered metric with the specified name.
+        If there is no such metric, we raise a ValueError.
+    """
+
+    validate_metric_name(name)
+    metric = _metrics[name]
+    return metric
+
+def get_metric_value(name: str, label_values: tuple = ()):
+    """
+        Returns the value of the metric for the provided label values, e.g. `get_metric_value("lingo_bingo_balls_drawn_total", ("green",))`.
+        For a histogram, we return a dictionary with its buckets, sum and count.
+        If nothing has been recorded for the label values yet, we return None.
+    """
+
+    metric_value = get_metric(name)["values"].get(label_values)
+    return metric_value
+
+def get_metrics_file_path() -> str:
+    """
+        Returns the path of the file the metrics are written to.
+        The file set from code has priority over the environment variable, which has priority over the Lingo settings.
+    """
+
+    metrics_file_path = _metrics_writer["filePath"]
+    if metrics_file_path is None:
+        metrics_file_path = os.environ.get(METRICS_FILE_ENVIRONMENT_VARIABLE, get_metrics_settings()["file_path"])
+    return metrics_file_path
+
+def is_metrics_writer_running() -> bool:
+    """
+        Returns whether the thread of the metrics writer has been started and is still running.
+    """
+
+    metrics_writer_thread = _metrics_writer["thread"]
+    is_running = metrics_writer_thread is not None and metrics_writer_thread.is_alive()
+    return is_running
+
+def should_write_metrics() -> bool:
+    """
+        Returns whether the metrics file should be written, which is the case when it is enabled within the Lingo settings, or when the metrics file environment variable is set.
+    """
+
+    should_write = get_metrics_settings()["enabled"] or METRICS_FILE_ENVIRONMENT_VARIABLE in os.environ
+    return should_write
+
+def get_stringified_label_values(label_names: tuple, label_values: tuple) -> str:
+    """
+        Returns the labels of a single value in the Prometheus text format, e.g. `{color="green"}`.
+    """
+
+    if len(label_names) == 0:
+        return ""
+
+    stringified_labels = []
+    for label_name, label_value in zip(label_names, label_values):
+        escaped_label_value = str(label_value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        stringified_labels.append(f"{label_name}=\"{escaped_label_value}\"")
+    return "{" + ",".join(stringified_labels) + "}"
+
+def get_stringified_metrics() -> str:
+    """
+        Returns all metrics in the Prometheus text format, which is read by the textfile collector of the node exporter.
+        !Do note that the values are copied before they are written, since the metrics writer runs within another thread than the game.
+    """
+
+    stringified_lines = []
+    for name, metric in _metrics.items():
+        stringified_lines.append(f"# HELP {name} {metric['help']}\n")
+        stringified_lines.append(f"# TYPE {name} {metric['type']}\n")
+
+        label_names = metric["labelNames"]
+        for label_values, value in sorted(dict(metric["values"]).items()):
+            if metric["type"] != "histogram":
+                stringified_lines.append(f"{name}{get_stringified_label_values(label_names, label_values)} {value}\n")
+                continue
+
+            # The buckets of a histogram are cumulative, and are labeled with their upper bound
+            bucket_counts = list(value["buckets"])
+            cumulative_count = 0
+            for bucket_bound, bucket_count in zip(metric["buckets"] + ("+Inf",), bucket_counts):
+                cumulative_count += bucket_count
+                bucket_labels = get_stringified_label_values(label_names + ("le",), label_values + (bucket_bound,))
+                stringified_lines.append(f"{name}_bucket{bucket_labels} {cumulative_count}\n")
+
+            stringified_labels = get_stringified_label_values(label_names, label_values)
+            stringified_lines.append(f"{name}_sum{stringified_labels} {value['sum']}\n")
+            stringified_lines.append(f"{name}_count{stringified_labels} {cumulative_count}\n")
+
+    stringified_metrics = "".join(stringified_lines)
+    return stringified_metrics
+
+
+###
+### SETTERS
+###
+
+
+def register_metric(name: str, metric_type: str, help_text: str, label_names: tuple = (), buckets: tuple = ()) -> None:
+    """
+        Add a metric to the metrics registry.
+        The buckets are the upper bounds of the buckets of a histogram, from low to high.
+        If the metric type is unknown, or a metric with the same name has already been registered, we raise a ValueError.
+    """
+
+    validate_metric_type(metric_type)
+    if name in _metrics:
+        raise ValueError(f"The metric '{name}' has already been registered.")
+
+    _metrics[name] = {
+        "type": metric_type,
+        "help": help_text,
+        "labelNames": label_names,
+        "buckets": buckets,
+        "values": {}
+    }
+
+def increase_counter(name: str, label_values: tuple = (), amount: float = 1) -> None:
+    """
+        Increase the counter for the provided label values by the provided amount.
+    """
+
+    counter_values = _metrics[name]["values"]
+    counter_values[label_values] = counter_values.get(label_values, 0) + amount
+
+def set_gauge(name: str, value: float, label_values: tuple = ()) -> None:
+    """
+        Set the gauge for the provided label values to the provided value.
+    """
+
+    _metrics[name]["values"][label_values] = value
+
+def increase_gauge(name: str, label_values: tuple = (), amount: float = 1) -> None:
+    """
+        Increase the gauge for the provided label values by the provided amount, which can be negative to decrease it.
+    """
+
+    gauge_values = _metrics[name]["values"]
+    gauge_values[label_values] = gauge_values.get(label_values, 0) + amount
+
+def observe_histogram(name: str, value: float, label_values: tuple = ()) -> None:
+    """
+        Count the observed value within the first bucket of the histogram whose upper bound is at least the value.
+    """
+
+    histogram = _metrics[name]
+    histogram_value = histogram["values"].get(label_values)
+    if histogram_value is None:
+        histogram_value = {
+            "buckets": [0] * (len(histogram["buckets"]) + 1),
+            "sum": 0,
+            "count": 0
+        }
+        histogram["values"][label_values] = histogram_value
+
+    histogram_value["buckets"][bisect_left(histogram["buckets"], value)] += 1
+    histogram_value["sum"] += value
+    histogram_value["count"] += 1
+
+def reset_metrics() -> None:
+    """
+        Remove the values of all metrics, e.g. to start counting from zero within the tests.
+    """
+
+    for metric in _metrics.values():
+        metric["values"].clear()
+
+def set_metrics_file_path(file_path: str | None) -> None:
+    """
+        Sets the file the metrics are written to from code.
+        Passing None falls back to the environment variable and the Lingo settings again.
+    """
+
+    _metrics_writer["filePath"] = file_path
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_metric_type(metric_type: str) -> None:
+    """
+        Validate that the metric type is one of the available metric types.
+        If it isn't, we raise a ValueError.
+    """
+
+    if metric_type not in METRIC_TYPES:
+        raise ValueError(f"Invalid metric type '{metric_type}'. Please use one of the following metric types: {', '.join(METRIC_TYPES)}.")
+
+def validate_metric_name(name: str) -> None:
+    """
+        Validate that a metric with the specified name has been registered.
+        If it hasn't, we raise a ValueError.
+    """
+
+    if name not in _metrics:
+        raise ValueError(f"Invalid metric '{name}'. Please use one of the following metrics: {', '.join(_metrics)}.")
+
+
+###
+### UTILITIES
+###
+
+
+def timed_round(minigame: str) -> Callable[[Callable], Callable]:
+    """
+        Decorator which records how long each call of the decorated round function takes within the round duration histogram of the provided minigame.
+    """
+
+    def decorate(function: Callable) -> Callable:
+        @wraps(function)
+        def timed_function(*args, **kwargs):
+            start_time = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe_histogram("lingo_round_duration_seconds", perf_counter() - start_time, (minigame,))
+
+        return timed_function
+
+    return decorate
+
+def write_metrics_file() -> None:
+    """
+        Write all metrics to the metrics file.
+        The metrics are written to a temporary file next to the metrics file first, which then replaces the metrics file at once,
+        so the textfile collector never reads a half written file.
+    """
+
+    set_gauge("lingo_metrics_written_timestamp_seconds", time())
+
+    metrics_file_path = get_metrics_file_path()
+    temporary_file_path = f"{metrics_file_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file_path, "w", encoding="utf-8") as temporary_file:
+            temporary_file.write(get_stringified_metrics())
+        os.replace(temporary_file_path, metrics_file_path)
+    except OSError:
+        # Don't leave a temporary file behind when it could not replace the metrics file
+        if os.path.exists(temporary_file_path):
+            os.remove(temporary_file_path)
+        raise
+
+def try_write_metrics_file() -> bool:
+    """
+        Write all metrics to the metrics file, like `write_metrics_file`.
+        If the metrics file can not be written (e.g. its directory doesn't exist or isn't writable), we write the error to the standard error instead of raising it.
+        We return whether the metrics file has been written.
+        !Do note that this is used by the metrics writer, so a single failed write doesn't stop the metrics writer or the application.
+    """
+
+    try:
+        write_metrics_file()
+    except OSError as error:
+        sys.stderr.write(f"Could not write the metrics file '{get_metrics_file_path()}': {error}\n")
+        sys.stderr.flush()
+        return False
+
+    return True
+
+def start_metrics_writer(write_interval: float | None = None) -> None:
+    """
+        Start writing the metrics file every `write_interval` seconds from a background thread, until the metrics writer is stopped or the application exits.
+        When no interval is provided, the interval of the Lingo settings is used.
+        !Do note that starting the metrics writer while it is already running does nothing.
+    """
+
+    # Imported here, so the game doesn't have to import them when the metrics file is never written
+    import atexit
+    import threading
+
+    if _metrics_writer["thread"] is not None:
+        return
+
+    if write_interval is None:
+        write_interval = get_metrics_settings()["write_interval"]
+
+    stop_event = threading.Event()
+
+    def write_metrics_periodically() -> None:
+        while not stop_event.wait(write_interval):
+            try_write_metrics_file()
+
+    metrics_writer_thread = threading.Thread(target=write_metrics_periodically, name="lingo-metrics-writer", daemon=True)
+    _metrics_writer["thread"] = metrics_writer_thread
+    _metrics_writer["stopEvent"] = stop_event
+    metrics_writer_thread.start()
+
+    atexit.register(stop_metrics_writer)
+
+def stop_metrics_writer() -> None:
+    """
+        Stop the metrics writer, and write the metrics file a last time so nothing which happened since the last write is lost.
+        If that last write fails, the error is written to the standard error, since this also runs when the application exits.
+    """
+
+    if _metrics_writer["thread"] is None:
+        return
+
+    _metrics_writer["stopEvent"].set()
+    _metrics_writer["thread"].join()
+    _metrics_writer["thread"] = None
+    _metrics_writer["stopEvent"] = None
+    try_write_metrics_file()
+
+
+register_metric("lingo_games_won_total", "counter", "The amount of games which have been won, by the team which has won.", ("team",))
+register_metric("lingo_games_lost_total", "counter", "The amount of games which have been lost, by the team which has lost.", ("team",))
+register_metric("lingo_games_in_progress", "gauge", "The amount of interactive games which are being played.")
+register_metric("lingo_wordle_guesses_total", "counter", "The amount of valid Wordle guesses which have been submitted.")
+register_metric("lingo_wordle_invalid_guesses_total", "counter", "The amount of Wordle guesses which have been rejected, by the reason they were rejected.", ("reason",))
+register_metric("lingo_bingo_balls_drawn_total", "counter", "The amount of balls which have been drawn from the bingo ball pits, by the color of the ball.", ("color",))
+register_metric("lingo_round_duration_seconds", "histogram", "How long each Wordle and Bingo round has taken.", ("minigame",), ROUND_DURATION_BUCKETS)
+register_metric("lingo_metrics_written_timestamp_seconds", "gauge", "When the metrics file has last been written, as a Unix timestamp.")
@@ -0,0 +1,205 @@
+import atexit
+import os
+import sys
+from .lingo_settings.lingo_settings_utils import get_output_settings
+from .lingo_profiling import profiled
+
+# The available output sinks:
+# * "terminal" writes the output to the terminal (standard output).
+# * "file" writes the output to the output file, e.g. to keep the logs of many games.
+# * "null" throws the output away, which is meant for automated play and load tests.
+# * "capture" keeps the output in memory, so it can be checked within tests (see `get_captured_output`).
+#! Do note that the output is buffered and only written once per turn (see `flush_output`), instead of once per message
+OUTPUT_SINKS = ("terminal", "file", "null", "capture")
+
+# The output sink and file can be overwritten with these environment variables, without changing the Lingo settings
+OUTPUT_SINK_ENVIRONMENT_VARIABLE = "LINGO_OUTPUT_SINK"
+OUTPUT_FILE_ENVIRONMENT_VARIABLE = "LINGO_OUTPUT_FILE"
+
+# When the buffered output grows beyond this amount of characters, it is flushed right away, so long turns never hold too much output in memory
+MAX_BUFFERED_OUTPUT_LENGTH = 64 * 1024
+
+# The output sink and file which have been set from code. When a value is None, we fall back to the environment variables and the Lingo settings.
+# The buffer holds the output which hasn't been flushed yet, and its total length.
+# The opened output file is kept open between flushes, and the captured output holds everything which was flushed to the "capture" sink
+_output = {
+    "sink": None,
+    "filePath": None,
+    "buffer": [],
+    "bufferLength": 0,
+    "file": None,
+    "openedFilePath": None,
+    "captured": []
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_output_sink() -> str:
+    """
+        Returns the current output sink.
+        The sink set from code has priority over the environment variable, which has priority over the Lingo settings.
+    """
+
+    output_sink = _output["sink"]
+    if output_sink is None:
+        output_sink = os.environ.get(OUTPUT_SINK_ENVIRONMENT_VARIABLE, get_output_settings()["sink"])
+
+    validate_output_sink(output_sink)
+    return output_sink
+
+def get_output_file_path() -> str:
+    """
+        Returns the path of the file the output is written to when the output sink is "file".
+        The file set from code has priority over the environment variable, which has priority over the Lingo settings.
+    """
+
+    output_file_path = _output["filePath"]
+    if output_file_path is None:
+        output_file_path = os.environ.get(OUTPUT_FILE_ENVIRONMENT_VARIABLE, get_output_settings()["file_path"])
+    return output_file_path
+
+def get_captured_output() -> str:
+    """
+        Returns all output which has been flushed to the "capture" sink.
+    """
+
+    captured_output = "".join(_output["captured"])
+    return captured_output
+
+
+###
+### SETTERS
+###
+
+
+def set_output_sink(sink: str | None, file_path: str | None = None) -> None:
+    """
+        Sets the output sink and file from code.
+        Passing None falls back to the environment variables and the Lingo settings again.
+        !Do note that the output which has been buffered so far is flushed to the previous sink first, and the previous output file is closed.
+    """
+
+    if sink is not None:
+        validate_output_sink(sink)
+
+    close_output_file()
+    _output["sink"] = sink
+    _output["filePath"] = file_path
+
+def clear_captured_output() -> None:
+    """
+        Removes all output which has been flushed to the "capture" sink.
+    """
+
+    _output["captured"].clear()
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_output_sink(output_sink: str) -> None:
+    """
+        Validate that the output sink is one of the available output sinks.
+        If it isn't, we raise a ValueError.
+    """
+
+    if output_sink not in OUTPUT_SINKS:
+        raise ValueError(f"Invalid output sink '{output_sink}'. Please use one of the following output sinks: {', '.join(OUTPUT_SINKS)}.")
+
+
+###
+### UTILITIES
+###
+
+
+def write_output(text: str) -> None:
+    """
+        Add the text to the buffered output, which is written to the output sink on the next flush.
+    """
+
+    _output["buffer"].append(text)
+    _output["bufferLength"] += len(text)
+
+    if _output["bufferLength"] >= MAX_BUFFERED_OUTPUT_LENGTH:
+        flush_output()
+
+def flush_output() -> None:
+    """
+        Write all buffered output to the output sink at once.
+        This is done at the end of each turn, before asking for input, and before pausing the game.
+    """
+
+    if len(_output["buffer"]) == 0:
+        return
+
+    buffered_output = "".join(_output["buffer"])
+    _output["buffer"].clear()
+    _output["bufferLength"] = 0
+
+    output_sink = get_output_sink()
+    if output_sink == "terminal":
+        sys.stdout.write(buffered_output)
+        sys.stdout.flush()
+    elif output_sink == "file":
+        output_file = get_opened_output_file()
+        output_file.write(buffered_output)
+        output_file.flush()
+    elif output_sink == "capture":
+        _output["captured"].append(buffered_output)
+
+def get_opened_output_file():
+    """
+        Returns the opened output file, which is opened in append mode on the first flush.
+        When the output file path has changed, the previous output file is closed first.
+    """
+
+    output_file_path = get_output_file_path()
+    if _output["file"] is not None and _output["openedFilePath"] != output_file_path:
+        close_output_file()
+
+    if _output["file"] is None:
+        _output["file"] = open(output_file_path, "a", encoding="utf-8")
+        _output["openedFilePath"] = output_file_path
+
+    return _output["file"]
+
+def close_output_file() -> None:
+    """
+        Flush the buffered output, and close the output file if it has been opened.
+    """
+
+    flush_output()
+    if _output["file"] is None:
+        return
+
+    _output["file"].close()
+    _output["file"] = None
+    _output["openedFilePath"] = None
+
+def get_colored_text(text: str, color: str) -> str:
+    """
+        Return the text with the terminal codes of the specified color around it.
+        !Do note that termcolor is only imported the first time a text is colored, so tools which never write any output (e.g. the simulators) start faster.
+    """
+
+    from termcolor import colored
+    colored_text = colored(text, color)
+    return colored_text
+
+@profiled()
+def ask_input(prompt: str) -> str:
+    """
+        Ask the user for input, after the buffered output has been flushed so the user can see everything that happened before the question.
+    """
+
+    flush_output()
+    return input(prompt)
+
+# Make sure no buffered output is lost when the application exits
+atexit.register(close_output_file)
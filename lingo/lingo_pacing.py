@@ -0,0 +1,129 @@
+import os
+from collections.abc import Callable
+from time import sleep
+from .lingo_settings.lingo_settings_utils import get_pacing_settings
+from .lingo_output import flush_output
+from .lingo_profiling import profiled
+
+# The available pacing modes:
+# * "real" pauses for the full duration, which keeps the dramatic pauses during interactive play.
+# * "scaled" pauses for the duration multiplied by the pacing scale.
+# * "none" never pauses, which is meant for automated play, replays and load tests.
+PACING_MODES = ("real", "scaled", "none")
+
+# The pacing mode and scale can be overwritten with these environment variables, without changing the Lingo settings
+PACING_MODE_ENVIRONMENT_VARIABLE = "LINGO_PACING_MODE"
+PACING_SCALE_ENVIRONMENT_VARIABLE = "LINGO_PACING_SCALE"
+
+# The pacing which has been set from code. When a value is None, we fall back to the environment variables and the Lingo settings.
+# The sleep function can be replaced (e.g. with a fake clock) to test the pacing without actually pausing
+_pacing = {
+    "mode": None,
+    "scale": None,
+    "sleep": sleep
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_pacing_mode() -> str:
+    """
+        Returns the current pacing mode.
+        The mode set from code has priority over the environment variable, which has priority over the Lingo settings.
+    """
+
+    pacing_mode = _pacing["mode"]
+    if pacing_mode is None:
+        pacing_mode = os.environ.get(PACING_MODE_ENVIRONMENT_VARIABLE, get_pacing_settings()["mode"])
+
+    validate_pacing_mode(pacing_mode)
+    return pacing_mode
+
+def get_pacing_scale() -> float:
+    """
+        Returns the current pacing scale, which is only used when the pacing mode is "scaled".
+        The scale set from code has priority over the environment variable, which has priority over the Lingo settings.
+    """
+
+    pacing_scale = _pacing["scale"]
+    if pacing_scale is None:
+        pacing_scale = float(os.environ.get(PACING_SCALE_ENVIRONMENT_VARIABLE, get_pacing_settings()["scale"]))
+    return pacing_scale
+
+def get_pause_duration(seconds: float) -> float:
+    """
+        Returns how many seconds a pause of the specified duration actually lasts with the current pacing.
+    """
+
+    pacing_mode = get_pacing_mode()
+    if pacing_mode == "none":
+        return 0
+
+    if pacing_mode == "scaled":
+        return seconds * get_pacing_scale()
+
+    return seconds
+
+
+###
+### SETTERS
+###
+
+
+def set_pacing(mode: str | None, scale: float | None = None) -> None:
+    """
+        Sets the pacing mode and scale from code.
+        Passing None falls back to the environment variables and the Lingo settings again.
+    """
+
+    if mode is not None:
+        validate_pacing_mode(mode)
+
+    _pacing["mode"] = mode
+    _pacing["scale"] = scale
+
+def set_pacing_sleep_function(sleep_function: Callable[[float], None]) -> None:
+    """
+        Sets the function which is used to pause, e.g. a fake clock within tests.
+    """
+
+    _pacing["sleep"] = sleep_function
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_pacing_mode(pacing_mode: str) -> None:
+    """
+        Validate that the pacing mode is one of the available pacing modes.
+        If it isn't, we raise a ValueError.
+    """
+
+    if pacing_mode not in PACING_MODES:
+        raise ValueError(f"Invalid pacing mode '{pacing_mode}'. Please use one of the following pacing modes: {', '.join(PACING_MODES)}.")
+
+
+###
+### UTILITIES
+###
+
+
+@profiled()
+def pause(seconds: float) -> None:
+    """
+        Pause the game for the specified amount of seconds, based on the current pacing.
+        When the pacing mode is "none", we do not pause at all.
+        !Do note that the buffered output is flushed before pausing, so everything that happened before the pause can be seen during the pause.
+    """
+
+    pause_duration = get_pause_duration(seconds)
+    if pause_duration <= 0:
+        return
+
+    flush_output()
+    _pacing["sleep"](pause_duration)
@@ -0,0 +1,212 @@
+import os
+import sys
+from collections.abc import Callable
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from random import Random
+from time import perf_counter
+from .lingo_statistics import get_percentile
+
+# Set this environment variable to 1 to measure how long the profiled parts of the game take (e.g. `LINGO_PROFILE=1 python main.py`).
+# The profile is written to the standard error at the end of each game, and whenever the process receives SIGUSR1 (e.g. `kill -USR1 <pid>`)
+PROFILING_ENVIRONMENT_VARIABLE = "LINGO_PROFILE"
+
+# Whether profiling is enabled is only read once, when this module is imported.
+#! Do note that when profiling is disabled, `profiled` returns the functions unchanged, so the profiled functions are exactly as fast as without profiling
+PROFILING_ENABLED = os.environ.get(PROFILING_ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+# The percentiles which are shown for each profiled part of the game
+PROFILE_PERCENTILES = (50, 95, 99)
+
+# The maximum amount of durations which is kept for each profiled part of the game, to calculate its percentiles.
+# Once a part has been called more often, a random sample of its durations is kept (reservoir sampling), so a long running process doesn't keep growing
+PROFILE_SAMPLES_LIMIT = 10_000
+
+# The state of the profile:
+# * "entries" holds the amount of calls, the total and maximum duration in seconds, and a sample of the durations of each profiled part of the game, by the name of that part.
+# * "random" picks which durations are kept once the sample is full. It is separate from the global random number generator, so profiling never changes the seeded games of the simulator.
+_profile = {
+    "entries": {},
+    "random": Random()
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_profiled_function(function: Callable, name: str | None = None) -> Callable:
+    """
+        Returns a function which calls the provided function, and records how long each call took under the provided name.
+        When no name is provided, the name of the function is used.
+        !Do note that this always records the calls, use `profiled` to only do so when profiling is enabled.
+    """
+
+    profile_name = function.__qualname__ if name is None else name
+
+    @wraps(function)
+    def profiled_function(*args, **kwargs):
+        start_time = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            add_profile_duration(profile_name, perf_counter() - start_time)
+
+    return profiled_function
+
+def get_profile_summary() -> list[dict]:
+    """
+        Returns the amount of calls, and the total, average, percentile and maximum durations in milliseconds of each profiled part of the game.
+        The parts which took the longest in total come first.
+        !Do note that the percentiles are calculated from the sampled durations (see `PROFILE_SAMPLES_LIMIT`), so they are estimates once a part has been called more often.
+    """
+
+    profile_summary = []
+    for profile_name, entry in _profile["entries"].items():
+        durations_ms = [duration * 1000 for duration in entry["samples"]]
+        total_ms = entry["totalSeconds"] * 1000
+        profile_entry = {
+            "name": profile_name,
+            "calls": entry["calls"],
+            "sampledCalls": len(durations_ms),
+            "totalMs": total_ms,
+            "averageMs": total_ms / entry["calls"],
+            "maxMs": entry["maxSeconds"] * 1000
+        }
+        for percentile in PROFILE_PERCENTILES:
+            profile_entry[f"p{percentile}Ms"] = get_percentile(durations_ms, percentile)
+        profile_summary.append(profile_entry)
+
+    profile_summary.sort(key=lambda profile_entry: profile_entry["totalMs"], reverse=True)
+    return profile_summary
+
+def get_stringified_profile_summary() -> str:
+    """
+        Returns the profile summary as a table, with a single row for each profiled part of the game.
+    """
+
+    percentile_headers = "".join(f"{f'p{percentile} (ms)':>10}" for percentile in PROFILE_PERCENTILES)
+    stringified_rows = [f"\n{'profiled':<50}{'calls':>8}{'total (ms)':>12}{'avg (ms)':>10}{percentile_headers}{'max (ms)':>10}\n"]
+    for profile_entry in get_profile_summary():
+        percentile_columns = "".join(f"{profile_entry[f'p{percentile}Ms']:>10.3f}" for percentile in PROFILE_PERCENTILES)
+        stringified_rows.append(f"{profile_entry['name']:<50}{profile_entry['calls']:>8}{profile_entry['totalMs']:>12.1f}{profile_entry['averageMs']:>10.3f}{percentile_columns}{profile_entry['maxMs']:>10.3f}\n")
+
+    stringified_profile_summary = "".join(stringified_rows)
+    return stringified_profile_summary
+
+
+###
+### SETTERS
+###
+
+
+def add_profile_duration(profile_name: str, duration: float) -> None:
+    """
+        Record the duration in seconds of a single call of the profiled part of the game.
+        Once the sample of the part is full, the duration replaces a random sampled duration, so every call has the same chance of being sampled.
+    """
+
+    entry = _profile["entries"].get(profile_name)
+    if entry is None:
+        entry = _profile["entries"][profile_name] = {
+            "calls": 0,
+            "totalSeconds": 0.0,
+            "maxSeconds": 0.0,
+            "samples": []
+        }
+
+    entry["calls"] += 1
+    entry["totalSeconds"] += duration
+    entry["maxSeconds"] = max(entry["maxSeconds"], duration)
+
+    samples = entry["samples"]
+    if len(samples) < PROFILE_SAMPLES_LIMIT:
+        samples.append(duration)
+        return
+
+    sample_index = _profile["random"].randrange(entry["calls"])
+    if sample_index < PROFILE_SAMPLES_LIMIT:
+        samples[sample_index] = duration
+
+def reset_profile() -> None:
+    """
+        Remove all recorded durations, e.g. to only profile the next game.
+    """
+
+    _profile["entries"].clear()
+
+
+###
+### UTILITIES
+###
+
+
+def profiled(name: str | None = None) -> Callable[[Callable], Callable]:
+    """
+        Decorator which records how long each call of the decorated function takes, when profiling is enabled.
+        When profiling is disabled, the decorated function is returned unchanged.
+        E.g. `@profiled()` above a function, or `@profiled("wordle.scoring")` to record the calls under another name.
+    """
+
+    def decorate(function: Callable) -> Callable:
+        if not PROFILING_ENABLED:
+            return function
+
+        return get_profiled_function(function, name)
+
+    return decorate
+
+def profile_section(name: str):
+    """
+        Context manager which records how long the code within the `with` block takes, when profiling is enabled.
+        When profiling is disabled, it does nothing.
+    """
+
+    if not PROFILING_ENABLED:
+        return nullcontext()
+
+    return record_profile_section(name)
+
+@contextmanager
+def record_profile_section(name: str):
+    """
+        Context manager which always records how long the code within the `with` block takes, use `profile_section` to only do so when profiling is enabled.
+    """
+
+    start_time = perf_counter()
+    try:
+        yield
+    finally:
+        add_profile_duration(name, perf_counter() - start_time)
+
+def dump_profile() -> None:
+    """
+        Write the profile summary to the standard error, so it is never mixed up with the output of the game itself.
+        When profiling is disabled, or nothing has been profiled yet, we do not write anything.
+    """
+
+    if not PROFILING_ENABLED or len(_profile["entries"]) == 0:
+        return
+
+    sys.stderr.write(get_stringified_profile_summary())
+    sys.stderr.flush()
+
+def install_profile_dump_signal_handler() -> None:
+    """
+        Write the profile summary whenever the process receives SIGUSR1, so a running game can be profiled without stopping it.
+        !Do note that SIGUSR1 doesn't exist on Windows, and signal handlers can only be installed from the main thread, in which case we do nothing.
+    """
+
+    import signal
+
+    if not hasattr(signal, "SIGUSR1"):
+        return
+
+    try:
+        signal.signal(signal.SIGUSR1, lambda signal_number, frame: dump_profile())
+    except ValueError:
+        pass
+
+if PROFILING_ENABLED:
+    install_profile_dump_signal_handler()
@@ -1,10 +1,10 @@
 import os
-from json import load
 
-# Let us read and use the Lingo settings
+# The Lingo settings, which are only read from the settings file the first time they are used (see `get_lingo_settings`).
+#! Do note that the settings can be reloaded between games when the settings file changes (see `reload_changed_settings`), which replaces this dictionary as a whole
 currentDir = os.path.dirname(os.path.realpath(__file__))
-with open(os.path.join(currentDir, 'lingo_settings.json'), 'r') as lingo_settings_file:
-    lingo_settings = load(lingo_settings_file)
+LINGO_SETTINGS_FILE_PATH = os.path.join(currentDir, 'lingo_settings.json')
+lingo_settings = None
 
 
 ###
@@ -12,12 +12,24 @@ with open(os.path.join(currentDir, 'lingo_settings.json'), 'r') as lingo_setting
 ###
 
 
+def get_lingo_settings() -> dict:
+    """
+        Returns the Lingo settings, which are read from the settings file the first time they are used.
+    """
+
+    if lingo_settings is None:
+        # Imported here, since the settings loader imports this module itself
+        from ..settings_loader import load_settings
+        load_settings("lingo")
+
+    return lingo_settings
+
 def get_amount_of_teams() -> int:
     """
         Returns the amount of teams playing the game.
     """
 
-    amount_of_teams = lingo_settings['teams_amount']
+    amount_of_teams = get_lingo_settings()['teams_amount']
     return amount_of_teams
 
 def get_starting_team_ID() -> int:
@@ -25,5 +37,29 @@ def get_starting_team_ID() -> int:
         Returns the starting team ID.
     """
 
-    starting_team_ID = lingo_settings['starting_team_ID']
-    return starting_team_ID
\ No newline at end of file
+    starting_team_ID = get_lingo_settings()['starting_team_ID']
+    return starting_team_ID
+
+def get_pacing_settings() -> dict:
+    """
+        Returns the pacing settings, which decide how long the dramatic pauses within the game last.
+    """
+
+    pacing_settings = get_lingo_settings()['pacing']
+    return pacing_settings
+
+def get_output_settings() -> dict:
+    """
+        Returns the output settings, which decide where the messages and boards of the game are written to.
+    """
+
+    output_settings = get_lingo_settings()['output']
+    return output_settings
+
+def get_metrics_settings() -> dict:
+    """
+        Returns the metrics settings, which decide whether, where and how often the metrics file is written.
+    """
+
+    metrics_settings = get_lingo_settings()['metrics']
+    return metrics_settings
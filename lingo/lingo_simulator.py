@@ -0,0 +1,221 @@
+import csv
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from collections.abc import Iterator
+from typing import TextIO
+from .game_context import create_game_context, use_game_context
+from .lingo_bots import get_bot
+from .lingo_exceptions import GameExhaustedError
+from .lingo_statistics import get_percentile
+from .lingo_engine import new_game, submit_guess, grab_ball, get_game_phase, get_current_team_ID, get_engine_state
+from .lingo_utils import get_winning_team_ID, get_losing_team_ID
+from .settings_snapshot import get_settings_snapshot
+from .wordle.wordle_utils import get_current_wordle_round_word_to_guess_for_team
+
+# The amount of games which is simulated within a single task of a worker process.
+# The results of a task are written to the output file as soon as the task has finished
+GAMES_PER_CHUNK = 200
+
+# The fields of each game result, in the order they are written to a CSV file
+GAME_RESULT_FIELDS = ["game", "result", "winningTeamID", "losingTeamID", "turns", "guesses", "invalidGuesses", "grabs", "durationMs", "settingsVersion"]
+
+# The available output formats, by the file extension of the output file
+OUTPUT_FORMATS = ("jsonl", "csv")
+
+# The amount of invalid guesses in a row after which the team of the bot forfeits the game.
+# An invalid guess doesn't change the state of the game, so a bot which keeps making invalid guesses would otherwise never finish the game
+MAXIMUM_INVALID_GUESSES_IN_A_ROW = 20
+
+
+###
+### GETTERS
+###
+
+
+def get_bot_view_for_current_round(guesses: list[str], guesses_color: list[list[str]]) -> dict:
+    """
+        Returns what a player can see of the current Wordle round, which is passed to the bot of the current team.
+    """
+
+    word_to_guess = get_current_wordle_round_word_to_guess_for_team(get_current_team_ID())
+    bot_view = {
+        "wordLength": len(word_to_guess),
+        "firstLetter": word_to_guess[0],
+        "guesses": guesses,
+        "guessesColor": guesses_color
+    }
+    return bot_view
+
+def get_output_format(output_path: str) -> str:
+    """
+        Returns the output format of the output file, based on its file extension.
+        If the extension isn't one of the output formats, we raise a ValueError.
+    """
+
+    output_format = output_path.rsplit(".", 1)[-1].lower()
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output file '{output_path}'. Please use one of the following file extensions: {', '.join(OUTPUT_FORMATS)}.")
+
+    return output_format
+
+
+###
+### SIMULATION
+###
+
+
+def play_simulated_game(bot_names: list[str]) -> dict:
+    """
+        Play a whole Lingo game with the headless engine, where each team is played by a bot.
+        Team 1 is played by the first bot, team 2 by the second bot and so on. When there are fewer bots than teams, the bots are reused.
+        We return the result of the game ("won", "lost", "undecided" when the words or balls ran out, or "forfeited" when a bot kept making invalid guesses), and how long it took.
+        When a game is forfeited, the team of that bot is returned as the losing team.
+        !Do note that this must be called while a game context is used.
+    """
+
+    bots = []
+    for bot_name in bot_names:
+        bots.append(get_bot(bot_name))
+
+    start_time = perf_counter()
+    guesses_amount = 0
+    invalid_guesses_amount = 0
+    grabs_amount = 0
+    invalid_guesses_in_a_row = 0
+    forfeiting_team_ID = None
+    result = "undecided"
+
+    try:
+        new_game()
+        guesses = []
+        guesses_color = []
+        while get_game_phase() != "finished":
+            if get_game_phase() == "bingo":
+                grab_ball()
+                grabs_amount += 1
+                continue
+
+            bot = bots[get_current_team_ID() % len(bots)]
+            guess = bot(get_bot_view_for_current_round(guesses, guesses_color))
+            guess_result = submit_guess(guess)
+            if not guess_result["isValid"]:
+                invalid_guesses_amount += 1
+                invalid_guesses_in_a_row += 1
+                if invalid_guesses_in_a_row >= MAXIMUM_INVALID_GUESSES_IN_A_ROW:
+                    forfeiting_team_ID = get_current_team_ID()
+                    break
+
+                continue
+
+            invalid_guesses_in_a_row = 0
+            guesses_amount += 1
+            guesses.append(guess)
+            guesses_color.append(guess_result["colors"])
+            if guess_result["roundFinished"]:
+                guesses = []
+                guesses_color = []
+
+        if forfeiting_team_ID is not None:
+            result = "forfeited"
+        elif get_winning_team_ID() is not None:
+            result = "won"
+        elif get_losing_team_ID() is not None:
+            result = "lost"
+    except GameExhaustedError:
+        # The game can not continue when every word has been used, or when a bingo ball pit has run empty
+        result = "undecided"
+
+    losing_team_ID = None
+    if result == "lost":
+        losing_team_ID = get_losing_team_ID()
+    elif result == "forfeited":
+        losing_team_ID = forfeiting_team_ID
+
+    game_result = {
+        "result": result,
+        "winningTeamID": get_winning_team_ID() if result == "won" else None,
+        "losingTeamID": losing_team_ID,
+        "turns": get_engine_state()["turnsAmount"],
+        "guesses": guesses_amount,
+        "invalidGuesses": invalid_guesses_amount,
+        "grabs": grabs_amount,
+        "durationMs": (perf_counter() - start_time) * 1000,
+        "settingsVersion": get_settings_snapshot()["version"]
+    }
+    return game_result
+
+def simulate_games(bot_names: list[str], first_game_number: int, games_amount: int, seed: int) -> list[dict]:
+    """
+        Simulate the provided amount of Lingo games, and return the result of each game.
+        The random number generator is seeded with the provided seed, so the results can be reproduced.
+        !Do note that this is the task which is run within each worker process.
+    """
+
+    random.seed(seed)
+
+    game_results = []
+    for game_number in range(first_game_number, first_game_number + games_amount):
+        with use_game_context(create_game_context()):
+            game_result = {"game": game_number}
+            game_result.update(play_simulated_game(bot_names))
+
+        game_results.append(game_result)
+
+    return game_results
+
+def simulate_games_in_parallel(bot_names: list[str], games_amount: int, workers_amount: int = None, seed: int = 0) -> Iterator[list[dict]]:
+    """
+        Simulate the provided amount of Lingo games, spread over a pool of worker processes.
+        We yield the game results of each chunk of games as soon as it is available, in the order of the games.
+    """
+
+    with ProcessPoolExecutor(max_workers=workers_amount) as executor:
+        futures = []
+        for first_game_number in range(0, games_amount, GAMES_PER_CHUNK):
+            chunk_games_amount = min(GAMES_PER_CHUNK, games_amount - first_game_number)
+            chunk_seed = seed * 1_000_003 + first_game_number
+            futures.append(executor.submit(simulate_games, bot_names, first_game_number, chunk_games_amount, chunk_seed))
+
+        for future in futures:
+            yield future.result()
+
+
+###
+### OUTPUT
+###
+
+
+def write_game_results(output_file: TextIO, output_format: str, game_results: list[dict], write_header: bool = False) -> None:
+    """
+        Write the provided game results to the output file, as JSON lines or as CSV rows.
+    """
+
+    if output_format == "jsonl":
+        for game_result in game_results:
+            output_file.write(json.dumps(game_result) + "\n")
+        return
+
+    csv_writer = csv.DictWriter(output_file, fieldnames=GAME_RESULT_FIELDS)
+    if write_header:
+        csv_writer.writeheader()
+    csv_writer.writerows(game_results)
+
+def get_simulation_summary(results_amount: dict, turns: list[int], durations: list[float], elapsed_time: float) -> dict:
+    """
+        Returns the throughput of the simulation, and the median and 99th percentile of the game lengths.
+        The results amount holds how many games were won, lost or undecided, and the turns and durations hold the length of each game.
+    """
+
+    games_amount = len(turns)
+    simulation_summary = {
+        "games": games_amount,
+        "gamesPerSecond": games_amount / elapsed_time if elapsed_time > 0 else 0,
+        "results": dict(results_amount),
+        "turnsP50": get_percentile(turns, 50),
+        "turnsP99": get_percentile(turns, 99),
+        "durationMsP50": get_percentile(durations, 50),
+        "durationMsP99": get_percentile(durations, 99)
+    }
+    return simulation_summary
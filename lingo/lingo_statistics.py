@@ -0,0 +1,20 @@
+from math import ceil
+
+
+###
+### GETTERS
+###
+
+
+def get_percentile(values: list[float], percentile: float) -> float:
+    """
+        Returns the specified percentile (0 - 100) of the values, using the nearest-rank method.
+        If there are no values, we return 0.
+    """
+
+    if len(values) == 0:
+        return 0
+
+    sorted_values = sorted(values)
+    rank = min(max(ceil(percentile / 100 * len(sorted_values)), 1), len(sorted_values))
+    return sorted_values[rank - 1]
@@ -1,7 +1,31 @@
-from test_lib import test
+import json
+import os
+import re
+import subprocess
+import sys
+from contextlib import redirect_stderr
+from io import StringIO
+from tempfile import TemporaryDirectory
+from time import sleep
+from test_lib import test, FAST_MODE_ENVIRONMENT_VARIABLE
+from parallel_tests import NESTED_TEST_RUN_ENVIRONMENT_VARIABLE, PARALLEL_TESTS_CHECK_ENVIRONMENT_VARIABLE
 from .teams_data import teams_data
 from .lingo_utils import get_next_team_ID, has_team_won_lingo_game, has_team_lost_lingo_game, get_winning_team_ID, get_losing_team_ID, initialize_teams_data, remove_teams_data, set_winning_team, set_losing_team, get_amount_of_teams
-from .lingo_settings.lingo_settings_utils import get_starting_team_ID
+from .lingo_settings.lingo_settings_utils import get_starting_team_ID, get_pacing_settings
+from .lingo_engine import new_game, submit_guess, grab_ball, get_game_state_snapshot, get_game_phase, get_current_team_ID, is_game_finished
+from .wordle.wordle_utils import get_current_wordle_round_word_to_guess_for_team
+from .game_context import create_game_context, use_game_context, get_teams_data, get_default_game_context, get_active_game_context
+from .lingo_bots import get_candidate_words, get_bot, BOTS
+from .lingo_simulator import simulate_games, play_simulated_game, MAXIMUM_INVALID_GUESSES_IN_A_ROW
+from .lingo_statistics import get_percentile
+from .lingo_output import set_output_sink, flush_output, get_captured_output, clear_captured_output, close_output_file
+from .lingo_utils import print_message
+from .settings_snapshot import get_settings_snapshot
+from .wordle.wordle_settings.wordle_settings_utils import get_wordle_settings, get_max_wordle_guess_attempts
+from .settings_loader import reload_changed_settings, set_settings_file_path, get_settings_file_path, get_settings_version
+from .lingo_pacing import pause, set_pacing, set_pacing_sleep_function, get_pacing_mode, PACING_MODE_ENVIRONMENT_VARIABLE
+from .lingo_metrics import get_metric_value, get_stringified_metrics, reset_metrics, set_metrics_file_path, write_metrics_file, start_metrics_writer, stop_metrics_writer, is_metrics_writer_running
+from .lingo_profiling import profiled, get_profiled_function, record_profile_section, get_profile_summary, add_profile_duration, reset_profile, PROFILING_ENABLED, PROFILE_SAMPLES_LIMIT
 
 def test_get_next_team_ID() -> None:
     """
@@ -290,4 +314,754 @@ def test_get_starting_team_ID() -> None:
         expected,
         result,
     )
-test_get_starting_team_ID()
\ No newline at end of file
+test_get_starting_team_ID()
+
+def test_pause() -> None:
+    """
+        Test whether pausing the game is based on the current pacing mode.
+    """
+
+    # Replace the sleep function with a fake clock, so the test doesn't actually pause
+    paused_durations = []
+    set_pacing_sleep_function(paused_durations.append)
+
+    set_pacing("real")
+    pause(1)
+    test(
+        "When the pacing mode is 'real', pausing for 1 second should pause for the full second.",
+        [1],
+        paused_durations,
+    )
+
+    paused_durations.clear()
+    set_pacing("scaled", 0.25)
+    pause(1)
+    test(
+        "When the pacing mode is 'scaled' with a scale of 0.25, pausing for 1 second should pause for 0.25 seconds.",
+        [0.25],
+        paused_durations,
+    )
+
+    paused_durations.clear()
+    set_pacing("none")
+    pause(1)
+    test(
+        "When the pacing mode is 'none', pausing should not pause at all.",
+        [],
+        paused_durations,
+    )
+
+    exception_has_occurred = False
+    try:
+        set_pacing("fast")
+    except ValueError:
+        exception_has_occurred = True
+    test(
+        "Setting an invalid pacing mode should raise a ValueError.",
+        True,
+        exception_has_occurred,
+    )
+
+    # Reset the pacing to reset the state for other tests
+    set_pacing(None)
+    set_pacing_sleep_function(sleep)
+test_pause()
+
+def test_get_pacing_mode() -> None:
+    """
+        Test whether the pacing mode falls back to the Lingo settings when it hasn't been set from code or the environment variable.
+    """
+
+    if PACING_MODE_ENVIRONMENT_VARIABLE in os.environ:
+        return
+
+    expected = get_pacing_settings()["mode"]
+    test(
+        f"The pacing mode should be '{expected}' by default.",
+        expected,
+        get_pacing_mode(),
+    )
+test_get_pacing_mode()
+
+def test_headless_game_engine() -> None:
+    """
+        Test whether a whole Lingo game can be played from code by using the headless game engine.
+    """
+
+    snapshot = new_game()
+    test(
+        "A new game should start within the 'wordle' phase.",
+        "wordle",
+        snapshot["phase"],
+    )
+    test(
+        "A new game should start with the starting team ID set within the Lingo settings.",
+        get_starting_team_ID(),
+        snapshot["currentTeamID"],
+    )
+
+    # Test whether an invalid guess does not change the game state
+    guess_result = submit_guess("zzzzz")
+    test(
+        "Submitting an invalid guess should not be accepted.",
+        False,
+        guess_result["isValid"],
+    )
+    test(
+        "After submitting an invalid guess, the attempt number should not have changed.",
+        0,
+        get_game_state_snapshot()["attemptNumber"],
+    )
+
+    # Test whether grabbing a ball within the 'wordle' phase raises an error
+    exception_has_occurred = False
+    try:
+        grab_ball()
+    except RuntimeError:
+        exception_has_occurred = True
+    test(
+        "Grabbing a ball within the 'wordle' phase should raise a RuntimeError.",
+        True,
+        exception_has_occurred,
+    )
+
+    # Test whether guessing the word correctly lets the team grab balls
+    team_ID = get_current_team_ID()
+    word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+    guess_result = submit_guess(word_to_guess)
+    test(
+        "Guessing the word correctly should finish the Wordle round.",
+        True,
+        guess_result["roundFinished"],
+    )
+    test(
+        "After guessing the word correctly, the game should be within the 'bingo' phase.",
+        "bingo",
+        get_game_phase(),
+    )
+
+    # Play the rest of the game by always guessing the word correctly, until a team has won or lost
+    while not is_game_finished():
+        if get_game_phase() == "bingo":
+            grab_ball()
+            continue
+
+        word_to_guess = get_current_wordle_round_word_to_guess_for_team(get_current_team_ID())
+        submit_guess(word_to_guess)
+
+    snapshot = get_game_state_snapshot()
+    test(
+        "When the game has finished, either a team should have won or a team should have lost.",
+        True,
+        snapshot["winningTeamID"] is not None or snapshot["losingTeamID"] is not None,
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_headless_game_engine()
+
+def test_use_game_context() -> None:
+    """
+        Test whether games within different game contexts do not share their state.
+    """
+
+    first_game_context = create_game_context()
+    second_game_context = create_game_context()
+
+    with use_game_context(first_game_context):
+        new_game()
+        first_game_word_to_guess = get_current_wordle_round_word_to_guess_for_team(get_current_team_ID())
+        submit_guess(first_game_word_to_guess)
+
+    with use_game_context(second_game_context):
+        new_game()
+        test(
+            "A new game within the second game context should start within the 'wordle' phase, even though the game within the first game context is within the 'bingo' phase.",
+            "wordle",
+            get_game_phase(),
+        )
+
+    with use_game_context(first_game_context):
+        test(
+            "The game within the first game context should still be within the 'bingo' phase.",
+            "bingo",
+            get_game_phase(),
+        )
+
+    test(
+        "Games within other game contexts should not add any data to the global teams data.",
+        0,
+        len(teams_data),
+    )
+
+    test(
+        "After leaving the `with` block of a game context, the default game context should be used again.",
+        True,
+        get_active_game_context() is get_default_game_context(),
+    )
+
+    test(
+        "The default game context should use the global teams data list.",
+        True,
+        get_teams_data() is teams_data,
+    )
+test_use_game_context()
+
+def test_bots() -> None:
+    """
+        Test whether the bots only make valid guesses, and whether the candidate words of the filtering bot always hold the word to guess.
+    """
+
+    game_context = create_game_context()
+    with use_game_context(game_context):
+        new_game()
+        team_ID = get_current_team_ID()
+        word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+        bot_view = {
+            "wordLength": len(word_to_guess),
+            "firstLetter": word_to_guess[0],
+            "guesses": [],
+            "guessesColor": []
+        }
+
+        for bot_name in BOTS:
+            guess = get_bot(bot_name)(bot_view)
+            test(
+                f"The '{bot_name}' bot should guess a word which starts with the first letter '{word_to_guess[0]}'.",
+                word_to_guess[0],
+                guess[0],
+            )
+
+        guess = get_bot("filtering")(bot_view)
+        guess_result = submit_guess(guess)
+        bot_view["guesses"].append(guess)
+        bot_view["guessesColor"].append(guess_result["colors"])
+        test(
+            "After a guess, the candidate words of the filtering bot should still hold the word to guess.",
+            True,
+            word_to_guess in get_candidate_words(bot_view),
+        )
+test_bots()
+
+def test_simulate_games() -> None:
+    """
+        Test whether simulating whole Lingo games with bots works correctly.
+    """
+
+    game_results = simulate_games(["filtering", "random"], 0, 20, 42)
+    test(
+        "Simulating 20 games should return the result of 20 games.",
+        20,
+        len(game_results),
+    )
+
+    all_games_finished = True
+    for game_result in game_results:
+        if game_result["result"] not in ("won", "lost", "undecided"):
+            all_games_finished = False
+    test(
+        "Every simulated game should be won, lost or undecided.",
+        True,
+        all_games_finished,
+    )
+
+    repeated_game_results = simulate_games(["filtering", "random"], 0, 20, 42)
+    test(
+        "Simulating games with the same seed should give the same game lengths.",
+        [game_result["turns"] for game_result in game_results],
+        [game_result["turns"] for game_result in repeated_game_results],
+    )
+
+    test(
+        "Simulating games should not add any data to the global teams data.",
+        0,
+        len(teams_data),
+    )
+
+    test(
+        "The 50th percentile of 1 to 100 should be 50.",
+        50,
+        get_percentile(list(range(1, 101)), 50),
+    )
+    test(
+        "The 99th percentile of 1 to 100 should be 99.",
+        99,
+        get_percentile(list(range(1, 101)), 99),
+    )
+test_simulate_games()
+
+def test_forfeit_simulated_game() -> None:
+    """
+        Test whether the team of a bot which keeps making invalid guesses forfeits the simulated game, instead of the game never finishing.
+    """
+
+    # This bot only guesses a word which doesn't exist
+    BOTS["invalid"] = lambda bot_view: "z" * bot_view["wordLength"]
+    try:
+        with use_game_context(create_game_context()):
+            game_result = play_simulated_game(["invalid"])
+            starting_team_ID = get_starting_team_ID()
+    finally:
+        del BOTS["invalid"]
+
+    test(
+        "A bot which only makes invalid guesses should forfeit the game.",
+        "forfeited",
+        game_result["result"],
+    )
+    test(
+        "The team of the bot which forfeited the game should be the losing team.",
+        starting_team_ID,
+        game_result["losingTeamID"],
+    )
+    test(
+        f"The game should be forfeited after {MAXIMUM_INVALID_GUESSES_IN_A_ROW} invalid guesses in a row.",
+        MAXIMUM_INVALID_GUESSES_IN_A_ROW,
+        game_result["invalidGuesses"],
+    )
+test_forfeit_simulated_game()
+
+def test_output_sinks() -> None:
+    """
+        Test whether the output is buffered until it is flushed, and is written to the selected output sink.
+    """
+
+    set_output_sink("capture")
+    clear_captured_output()
+
+    print_message("Hello")
+    print_message("World")
+    test(
+        "Before the output is flushed, nothing should have been written to the output sink.",
+        "",
+        get_captured_output(),
+    )
+
+    flush_output()
+    test(
+        "After the output is flushed, both messages should have been written to the output sink at once.",
+        True,
+        "Hello" in get_captured_output() and "World" in get_captured_output(),
+    )
+
+    set_output_sink("null")
+    clear_captured_output()
+    print_message("Nobody reads this")
+    flush_output()
+    test(
+        "When the output sink is 'null', the output should be thrown away.",
+        "",
+        get_captured_output(),
+    )
+
+    with TemporaryDirectory() as temporary_directory:
+        output_file_path = os.path.join(temporary_directory, "output.log")
+        set_output_sink("file", output_file_path)
+        print_message("Written to a file")
+        close_output_file()
+
+        with open(output_file_path, "r", encoding="utf-8") as output_file:
+            test(
+                "When the output sink is 'file', the flushed output should be written to the output file.",
+                True,
+                "Written to a file" in output_file.read(),
+            )
+
+    # Fall back to the output sink of the Lingo settings again
+    set_output_sink(None)
+test_output_sinks()
+
+def test_settings_snapshot() -> None:
+    """
+        Test whether the settings snapshot is read-only, and is only built again when a new game is initialized.
+    """
+
+    with use_game_context(create_game_context()):
+        initialize_teams_data()
+        settings_snapshot = get_settings_snapshot()
+        test(
+            "The settings snapshot should hold the maximum amount of Wordle guess attempts.",
+            get_max_wordle_guess_attempts(),
+            settings_snapshot["wordle"]["maxGuessAttempts"],
+        )
+
+        try:
+            settings_snapshot["wordle"]["maxGuessAttempts"] = 1
+            is_read_only = False
+        except TypeError:
+            is_read_only = True
+        test(
+            "The settings snapshot should be read-only.",
+            True,
+            is_read_only,
+        )
+
+        wordle_settings = get_wordle_settings()
+        default_max_attempts = wordle_settings["max_guess_attempts"]
+        wordle_settings["max_guess_attempts"] = default_max_attempts + 1
+        try:
+            test(
+                "Changed settings should not be used by a game which has already been initialized.",
+                default_max_attempts,
+                get_settings_snapshot()["wordle"]["maxGuessAttempts"],
+            )
+
+            initialize_teams_data()
+            test(
+                "Changed settings should be used once a new game has been initialized.",
+                default_max_attempts + 1,
+                get_settings_snapshot()["wordle"]["maxGuessAttempts"],
+            )
+        finally:
+            # Reset the maximum amount of attempts to reset the state for other tests
+            wordle_settings["max_guess_attempts"] = default_max_attempts
+test_settings_snapshot()
+
+def test_reload_changed_settings() -> None:
+    """
+        Test whether changed settings files are reloaded between games, and whether invalid settings files are refused.
+    """
+
+    original_wordle_settings_file_path = get_settings_file_path("wordle")
+    original_settings_version = get_settings_version()
+    with open(original_wordle_settings_file_path, "r", encoding="utf-8") as wordle_settings_file:
+        original_wordle_settings = json.load(wordle_settings_file)
+
+    with TemporaryDirectory() as temporary_directory:
+        wordle_settings_file_path = os.path.join(temporary_directory, "wordle_settings.json")
+
+        def write_wordle_settings(wordle_settings: dict, modified_time_ns: int) -> None:
+            with open(wordle_settings_file_path, "w", encoding="utf-8") as wordle_settings_file:
+                json.dump(wordle_settings, wordle_settings_file)
+            # Set the modification time explicitly, since the file could be written twice within the resolution of the file system clock
+            os.utime(wordle_settings_file_path, ns=(modified_time_ns, modified_time_ns))
+
+        try:
+            changed_wordle_settings = dict(original_wordle_settings, max_guess_attempts=original_wordle_settings["max_guess_attempts"] + 2)
+            write_wordle_settings(changed_wordle_settings, 1_000_000_000)
+            set_settings_file_path("wordle", wordle_settings_file_path)
+            test(
+                "When a settings file has changed, the settings should be reloaded.",
+                True,
+                reload_changed_settings(),
+            )
+            test(
+                "After reloading the settings, the getters should return the changed settings.",
+                original_wordle_settings["max_guess_attempts"] + 2,
+                get_max_wordle_guess_attempts(),
+            )
+            test(
+                "After reloading changed settings, the settings version should have changed.",
+                True,
+                get_settings_version() != original_settings_version,
+            )
+            test(
+                "When no settings file has changed, the settings should not be reloaded.",
+                False,
+                reload_changed_settings(force=True),
+            )
+
+            with use_game_context(create_game_context()):
+                game_state = new_game()
+                test(
+                    "A new game should record the version of the settings it runs under.",
+                    get_settings_version(),
+                    game_state["settingsVersion"],
+                )
+                test(
+                    "A new game should use the reloaded settings.",
+                    original_wordle_settings["max_guess_attempts"] + 2,
+                    get_settings_snapshot()["wordle"]["maxGuessAttempts"],
+                )
+
+            invalid_wordle_settings = dict(changed_wordle_settings)
+            del invalid_wordle_settings["max_guess_attempts"]
+            write_wordle_settings(invalid_wordle_settings, 2_000_000_000)
+            try:
+                reload_changed_settings(force=True)
+                raised_error = False
+            except ValueError:
+                raised_error = True
+            test(
+                "When a changed settings file is invalid, reloading the settings should raise a ValueError.",
+                True,
+                raised_error,
+            )
+            test(
+                "When a changed settings file is invalid, the previous settings should still be used.",
+                original_wordle_settings["max_guess_attempts"] + 2,
+                get_max_wordle_guess_attempts(),
+            )
+            test(
+                "An invalid settings file should not be read again until it changes once more.",
+                False,
+                reload_changed_settings(force=True),
+            )
+
+            os.remove(wordle_settings_file_path)
+            try:
+                reload_changed_settings(force=True)
+                raised_error = False
+            except ValueError:
+                raised_error = True
+            test(
+                "When a settings file is missing, reloading the settings should raise a ValueError.",
+                True,
+                raised_error,
+            )
+            test(
+                "When a settings file is missing, the previous settings should still be used.",
+                original_wordle_settings["max_guess_attempts"] + 2,
+                get_max_wordle_guess_attempts(),
+            )
+            test(
+                "A missing settings file should not be reported again until it changes once more.",
+                False,
+                reload_changed_settings(force=True),
+            )
+        finally:
+            # Use the original settings file again to reset the state for other tests
+            set_settings_file_path("wordle", original_wordle_settings_file_path)
+            reload_changed_settings(force=True)
+
+    test(
+        "After using the original settings file again, the original settings version should be used.",
+        original_settings_version,
+        get_settings_version(),
+    )
+test_reload_changed_settings()
+
+
+def test_profiling() -> None:
+    """
+        Test whether profiled functions and sections record their calls, and whether profiling leaves functions unchanged when it is disabled.
+    """
+
+    def add_numbers(first_number: int, second_number: int) -> int:
+        return first_number + second_number
+
+    if not PROFILING_ENABLED:
+        test(
+            "When profiling is disabled, a profiled function should be the function itself.",
+            True,
+            profiled()(add_numbers) is add_numbers,
+        )
+
+    reset_profile()
+    profiled_add_numbers = get_profiled_function(add_numbers, "test.add_numbers")
+    test(
+        "A profiled function should return the result of the function.",
+        5,
+        profiled_add_numbers(2, 3),
+    )
+    profiled_add_numbers(4, 5)
+
+    with record_profile_section("test.section"):
+        pass
+
+    profile_summary = get_profile_summary()
+    test(
+        "The profile summary should hold every profiled function and section.",
+        ["test.add_numbers", "test.section"],
+        sorted(profile_entry["name"] for profile_entry in profile_summary),
+    )
+
+    calls_by_name = {}
+    for profile_entry in profile_summary:
+        calls_by_name[profile_entry["name"]] = profile_entry["calls"]
+    test(
+        "The profile summary should count each call of a profiled function.",
+        [2, 1],
+        [calls_by_name["test.add_numbers"], calls_by_name["test.section"]],
+    )
+
+    reset_profile()
+    for call_index in range(PROFILE_SAMPLES_LIMIT + 10):
+        add_profile_duration("test.many_calls", 0.001 if call_index != 5 else 0.5)
+    profile_entry = get_profile_summary()[0]
+    test(
+        "Once a profiled part has been called more often than the samples limit, only the samples limit of durations should be kept.",
+        [PROFILE_SAMPLES_LIMIT + 10, PROFILE_SAMPLES_LIMIT],
+        [profile_entry["calls"], profile_entry["sampledCalls"]],
+    )
+    test(
+        "The maximum duration should be kept, even when it isn't within the sampled durations anymore.",
+        500.0,
+        profile_entry["maxMs"],
+    )
+
+    # Remove the recorded durations after the test to reset the state for other tests
+    reset_profile()
+    test(
+        "After resetting the profile, the profile summary should be empty.",
+        [],
+        get_profile_summary(),
+    )
+test_profiling()
+
+def test_metrics() -> None:
+    """
+        Test whether the metrics are fed by the game, and whether the metrics file is written in the Prometheus text format.
+    """
+
+    reset_metrics()
+    with use_game_context(create_game_context()):
+        new_game()
+        team_ID = get_current_team_ID()
+        submit_guess("zzzzz")
+        submit_guess("zz")
+        submit_guess(get_current_wordle_round_word_to_guess_for_team(team_ID))
+        grab_ball()
+        set_winning_team(team_ID)
+
+    test(
+        "Each rejected guess should be counted by the reason it was rejected.",
+        [1, 1],
+        [get_metric_value("lingo_wordle_invalid_guesses_total", ("unknown_word",)), get_metric_value("lingo_wordle_invalid_guesses_total", ("wrong_length",))],
+    )
+    test(
+        "Only the valid guess should be counted as a submitted guess.",
+        1,
+        get_metric_value("lingo_wordle_guesses_total"),
+    )
+    test(
+        "The grabbed ball should be counted by its color.",
+        1,
+        sum(get_metric_value("lingo_bingo_balls_drawn_total", (color,)) or 0 for color in ("green", "red", "number")),
+    )
+    test(
+        "Setting the winning team should count a won game for that team.",
+        1,
+        get_metric_value("lingo_games_won_total", (str(team_ID + 1),)),
+    )
+    test(
+        "The finished Wordle round should be observed within the round duration histogram.",
+        1,
+        get_metric_value("lingo_round_duration_seconds", ("wordle",))["count"],
+    )
+
+    stringified_metrics = get_stringified_metrics()
+    test(
+        "The metrics should be written in the Prometheus text format.",
+        True,
+        "# TYPE lingo_wordle_guesses_total counter\nlingo_wordle_guesses_total 1\n" in stringified_metrics,
+    )
+    test(
+        "The highest bucket of a histogram should hold every observed value.",
+        True,
+        'lingo_round_duration_seconds_bucket{minigame="wordle",le="+Inf"} 1\n' in stringified_metrics,
+    )
+
+    with TemporaryDirectory() as metrics_directory:
+        metrics_file_path = os.path.join(metrics_directory, "lingo_metrics.prom")
+        set_metrics_file_path(metrics_file_path)
+        try:
+            write_metrics_file()
+            with open(metrics_file_path, encoding="utf-8") as metrics_file:
+                written_metrics = metrics_file.read()
+            test(
+                "The metrics file should hold the won games.",
+                True,
+                f'lingo_games_won_total{{team="{team_ID + 1}"}} 1\n' in written_metrics,
+            )
+            test(
+                "Only the metrics file should be left behind, without its temporary file.",
+                ["lingo_metrics.prom"],
+                os.listdir(metrics_directory),
+            )
+
+            os.remove(metrics_file_path)
+            start_metrics_writer(0.01)
+            sleep(0.05)
+            stop_metrics_writer()
+            test(
+                "The metrics writer should write the metrics file periodically.",
+                True,
+                os.path.exists(metrics_file_path),
+            )
+        finally:
+            # Use the default metrics file again to reset the state for other tests
+            set_metrics_file_path(None)
+
+    reset_metrics()
+test_metrics()
+
+def test_metrics_writer_with_unwritable_file() -> None:
+    """
+        Test whether the metrics writer keeps running and reports the error when the metrics file can not be written.
+    """
+
+    with TemporaryDirectory() as metrics_directory:
+        # The directory of the metrics file doesn't exist, so every write fails
+        set_metrics_file_path(os.path.join(metrics_directory, "missing", "lingo_metrics.prom"))
+        reported_errors = StringIO()
+        try:
+            with redirect_stderr(reported_errors):
+                start_metrics_writer(0.01)
+                sleep(0.05)
+                metrics_writer_is_running = is_metrics_writer_running()
+                stop_metrics_writer()
+        finally:
+            # Stop the metrics writer and use the default metrics file again to reset the state for other tests
+            stop_metrics_writer()
+            set_metrics_file_path(None)
+
+        test(
+            "The metrics writer should keep running when the metrics file can not be written.",
+            True,
+            metrics_writer_is_running,
+        )
+        test(
+            "The metrics writer should write the error to the standard error when the metrics file can not be written.",
+            True,
+            "Could not write the metrics file" in reported_errors.getvalue(),
+        )
+        test(
+            "No temporary metrics file should be left behind when the metrics file can not be written.",
+            [],
+            os.listdir(metrics_directory),
+        )
+
+    reset_metrics()
+test_metrics_writer_with_unwritable_file()
+
+def test_parallel_tests() -> None:
+    """
+        Test whether running the test suites in parallel reports the same amount of successful and failed tests as `tests.py`, even when a single worker process runs every suite.
+        This test is only run when the `PARALLEL_TESTS_CHECK_ENVIRONMENT_VARIABLE` is set, since it runs all test suites twice more.
+        !Do note that this runs both test runners in another process, in which this test itself is skipped.
+    """
+
+    if NESTED_TEST_RUN_ENVIRONMENT_VARIABLE in os.environ or os.environ.get(PARALLEL_TESTS_CHECK_ENVIRONMENT_VARIABLE, "") in ("", "0"):
+        return
+
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    nested_test_run_environment = dict(os.environ, **{NESTED_TEST_RUN_ENVIRONMENT_VARIABLE: "1", FAST_MODE_ENVIRONMENT_VARIABLE: "1"})
+
+    def get_test_run_results(arguments: list[str]) -> dict:
+        completed_test_run = subprocess.run([sys.executable] + arguments, cwd=project_directory, env=nested_test_run_environment, capture_output=True, text=True)
+        reported_lines = re.sub(r"\x1b\[[0-9;]*m", "", completed_test_run.stdout).splitlines()
+        test_run_results = {
+            "returnCode": completed_test_run.returncode,
+            "resultsAmounts": [sum(line.startswith(f"{result}: ") for line in reported_lines) for result in ("success", "failed")]
+        }
+        return test_run_results
+
+    test_run_results = get_test_run_results(["tests.py"])
+    parallel_test_run_results = get_test_run_results(["parallel_tests.py", "--workers", "1"])
+    test(
+        "Both test runners should exit with status 0.",
+        [0, 0],
+        [test_run_results["returnCode"], parallel_test_run_results["returnCode"]],
+    )
+    test(
+        "The test runners should report successful tests.",
+        True,
+        test_run_results["resultsAmounts"][0] > 0,
+    )
+    test(
+        "Running the test suites with a single worker process should report as many successes and failures as tests.py.",
+        test_run_results["resultsAmounts"],
+        parallel_test_run_results["resultsAmounts"],
+    )
+test_parallel_tests()
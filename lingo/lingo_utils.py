@@ -1,7 +1,11 @@
-from termcolor import colored
-from .teams_data import teams_data
+from .game_context import get_teams_data
+from .lingo_output import write_output, get_colored_text
 from .lingo_settings.lingo_settings_utils import get_amount_of_teams
-from .bingo.bingo_utils import get_randomized_bingo_board_for_team
+from .settings_snapshot import refresh_settings_snapshot
+from .bingo.bingo_settings.bingo_settings_utils import get_bingo_ball_amounts
+from .bingo.bingo_utils import get_initial_bingo_board_data_for_team, get_initial_bingo_ball_pit
+from .wordle.words.words_utils import reset_word_decks
+from .lingo_metrics import increase_counter
 
 
 ###
@@ -23,22 +27,25 @@ def get_initial_team_data_for_team(team_ID: int) -> dict:
         Returns the initial data structure for the specified team.
     """
 
+    bingo_board_data = get_initial_bingo_board_data_for_team(team_ID)
+    bingo_ball_amounts = get_bingo_ball_amounts()
     initial_team_data = {
-        "bingoBoard": {
-            "board": get_randomized_bingo_board_for_team(team_ID),
-            "filledPositions": set()
-        },
+        "bingoBoard": bingo_board_data,
+        "ballPit": get_initial_bingo_ball_pit(bingo_board_data),
         "balls": {
             "grabbed": {
                 "green": 0,
                 "red": 0
             },
             "remaining": {
-                "green": 3,
-                "red": 3
+                "green": bingo_ball_amounts["green"],
+                "red": bingo_ball_amounts["red"]
             }
         },
         "roundsInfo": [],
+        "roundsWon": 0,
+        "currentLossStreak": 0,
+        "countedRoundsAmount": 0,
         "hasWon": False,
         "hasLost": False
     }
@@ -49,7 +56,7 @@ def has_team_won_lingo_game(team_ID: int) -> bool:
         Returns whether the team has won the Lingo game.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     has_won = team_data["hasWon"]
     return has_won
 
@@ -58,7 +65,7 @@ def has_team_lost_lingo_game(team_ID: int) -> bool:
         Returns whether the team has lost the Lingo game.
     """
 
-    team_data = teams_data[team_ID]
+    team_data = get_teams_data()[team_ID]
     has_lost = team_data["hasLost"]
     return has_lost
 
@@ -90,12 +97,15 @@ def get_losing_team_ID() -> int:
 
 def initialize_teams_data() -> None:
     """
-        Initializes the list that holds the data for each team.
+        Initializes the list that holds the data for each team within the active game context.
+        !Do note that the settings snapshot of the game context is built again as well, so changed settings are used from this game on.
     """
 
     # Clear any existing data first
     remove_teams_data()
+    refresh_settings_snapshot()
 
+    teams_data = get_teams_data()
     amount_of_teams = get_amount_of_teams()
     for team_ID in range(amount_of_teams):
         initial_team_data = get_initial_team_data_for_team(team_ID)
@@ -103,10 +113,11 @@ def initialize_teams_data() -> None:
 
 def remove_teams_data() -> None:
     """
-        Clears the teams_data list.
+        Clears the teams data of the active game context, and the word decks which hold the used Wordle words of the game.
     """
 
-    teams_data.clear()
+    get_teams_data().clear()
+    reset_word_decks()
 
 def set_winning_team(team_ID: int) -> None:
     """
@@ -114,7 +125,8 @@ def set_winning_team(team_ID: int) -> None:
         while also setting the losing status for the other team if it hasn't already been set.
     """
 
-    teams_data[team_ID]["hasWon"] = True
+    get_teams_data()[team_ID]["hasWon"] = True
+    increase_counter("lingo_games_won_total", (str(team_ID + 1),))
 
 def set_losing_team(team_ID: int) -> None:
     """
@@ -122,7 +134,8 @@ def set_losing_team(team_ID: int) -> None:
         while also setting the winning status for the other team if it hasn't already been set.
     """
 
-    teams_data[team_ID]["hasLost"] = True
+    get_teams_data()[team_ID]["hasLost"] = True
+    increase_counter("lingo_games_lost_total", (str(team_ID + 1),))
 
 
 ###
@@ -132,8 +145,8 @@ def set_losing_team(team_ID: int) -> None:
 
 def print_message(message: str, color: str = "white") -> None:
     """
-        Print a colored message in the terminal.
+        Print a colored message to the output sink (see `lingo_output`).
     """
 
-    colored_message = colored(message, color)
-    print(f"\n{colored_message}\n")
\ No newline at end of file
+    colored_message = get_colored_text(message, color)
+    write_output(f"\n{colored_message}\n\n")
\ No newline at end of file
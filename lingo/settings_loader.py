@@ -0,0 +1,308 @@
+import os
+from time import monotonic
+from .lingo_settings import lingo_settings_utils
+from .wordle.wordle_settings import wordle_settings_utils
+from .bingo.bingo_settings import bingo_settings_utils
+
+# The minimum amount of seconds between two checks of the settings files, so starting many games in a row (e.g. within the simulator) doesn't check the files for every game
+SETTINGS_POLL_INTERVAL = 1.0
+
+# The settings which can be loaded and reloaded, by their name.
+# Each entry holds the settings utilities module, the name of the settings dictionary within that module, the getter which loads the settings on first use, and the path of its settings file
+_settings_files = {
+    "lingo": {
+        "module": lingo_settings_utils,
+        "attribute": "lingo_settings",
+        "getter": lingo_settings_utils.get_lingo_settings,
+        "filePath": lingo_settings_utils.LINGO_SETTINGS_FILE_PATH
+    },
+    "wordle": {
+        "module": wordle_settings_utils,
+        "attribute": "wordle_settings",
+        "getter": wordle_settings_utils.get_wordle_settings,
+        "filePath": wordle_settings_utils.WORDLE_SETTINGS_FILE_PATH
+    },
+    "bingo": {
+        "module": bingo_settings_utils,
+        "attribute": "bingo_settings",
+        "getter": bingo_settings_utils.get_bingo_settings,
+        "filePath": bingo_settings_utils.BINGO_SETTINGS_FILE_PATH
+    }
+}
+
+# The state of the settings loader:
+# * "fileStates" holds the modification time and size of each settings file when it was last loaded.
+# * "fileHashes" holds the hash of the contents of each settings file when it was last loaded.
+# * "version" identifies the loaded settings, and is the hash of all settings files together (see `get_settings_version`), or None when it hasn't been calculated yet.
+# * "lastPolledAt" holds when the settings files were last checked, or None when they haven't been checked yet.
+_settings_loader = {
+    "fileStates": {},
+    "fileHashes": {},
+    "version": None,
+    "lastPolledAt": None
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_settings_version() -> str:
+    """
+        Returns the version of the loaded settings, which is a short hash of the contents of all settings files.
+        The same settings files always give the same version, so games can be compared across runs and processes.
+        !Do note that changes made to the settings dictionaries from code (e.g. within the tests or the Bingo simulator) do not change the version.
+    """
+
+    if _settings_loader["version"] is None:
+        # The version covers all settings, so the settings which haven't been used yet are loaded first
+        for settings_file in _settings_files.values():
+            settings_file["getter"]()
+        _settings_loader["version"] = get_combined_settings_hash(_settings_loader["fileHashes"])
+
+    settings_version = _settings_loader["version"]
+    return settings_version
+
+def get_settings_file_path(settings_name: str) -> str:
+    """
+        Returns the path of the settings file of the specified settings ("lingo", "wordle" or "bingo").
+    """
+
+    validate_settings_name(settings_name)
+    settings_file_path = _settings_files[settings_name]["filePath"]
+    return settings_file_path
+
+def get_settings_file_state(file_path: str) -> tuple:
+    """
+        Returns the modification time and size of the settings file, which change whenever the file is written.
+    """
+
+    file_stat = os.stat(file_path)
+    settings_file_state = (file_stat.st_mtime_ns, file_stat.st_size)
+    return settings_file_state
+
+def is_settings_loaded(settings_name: str) -> bool:
+    """
+        Returns whether the specified settings have been read from their settings file.
+    """
+
+    settings_file = _settings_files[settings_name]
+    is_loaded = getattr(settings_file["module"], settings_file["attribute"]) is not None
+    return is_loaded
+
+def get_changed_settings_names() -> list[str]:
+    """
+        Returns the names of the loaded settings whose settings file has changed since it was last loaded.
+        !Do note that settings which haven't been loaded yet are never changed, since they are read from the latest settings file on first use.
+    """
+
+    changed_settings_names = []
+    for settings_name, settings_file in _settings_files.items():
+        if not is_settings_loaded(settings_name):
+            continue
+
+        # A settings file which can't be found (e.g. while it is being replaced) has changed as well, so it is refused when reloading
+        try:
+            settings_file_state = get_settings_file_state(settings_file["filePath"])
+        except OSError:
+            settings_file_state = None
+
+        if _settings_loader["fileStates"].get(settings_name) != settings_file_state:
+            changed_settings_names.append(settings_name)
+
+    return changed_settings_names
+
+def get_combined_settings_hash(file_hashes: dict) -> str:
+    """
+        Returns the short hash which identifies the combination of the provided settings file hashes.
+    """
+
+    from hashlib import sha256
+
+    combined_hashes = "\n".join(f"{settings_name}:{file_hashes[settings_name]}" for settings_name in sorted(file_hashes))
+    combined_settings_hash = sha256(combined_hashes.encode("utf-8")).hexdigest()[:12]
+    return combined_settings_hash
+
+
+###
+### SETTERS
+###
+
+
+def set_settings_file_path(settings_name: str, file_path: str) -> None:
+    """
+        Use another file for the specified settings ("lingo", "wordle" or "bingo"), e.g. to keep the settings of a host outside of the package.
+        !Do note that the settings are only read from the new file on the next reload (see `reload_changed_settings`).
+    """
+
+    validate_settings_name(settings_name)
+    _settings_files[settings_name]["filePath"] = file_path
+    _settings_loader["fileStates"].pop(settings_name, None)
+    _settings_loader["lastPolledAt"] = None
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_settings_name(settings_name: str) -> None:
+    """
+        Validate that the settings name is one of the settings which can be reloaded.
+        If it isn't, we raise a ValueError.
+    """
+
+    if settings_name not in _settings_files:
+        raise ValueError(f"Invalid settings '{settings_name}'. Please use one of the following settings: {', '.join(_settings_files)}.")
+
+def validate_settings_structure(settings_name: str, new_settings, current_settings, key_path: str = "") -> None:
+    """
+        Validate that the new settings hold the same keys, with the same types of values, as the settings which are currently used.
+        Integers and floats can be used for each other, but booleans can not be used for numbers.
+        If they don't, we raise a ValueError which names the settings file and the key.
+    """
+
+    location = f"'{key_path}' of the {settings_name} settings" if key_path else f"the {settings_name} settings"
+
+    if isinstance(current_settings, dict):
+        if not isinstance(new_settings, dict):
+            raise ValueError(f"Invalid settings: {location} should be an object.")
+
+        missing_keys = current_settings.keys() - new_settings.keys()
+        if len(missing_keys) > 0:
+            raise ValueError(f"Invalid settings: {location} are missing the following keys: {', '.join(sorted(missing_keys))}.")
+
+        unknown_keys = new_settings.keys() - current_settings.keys()
+        if len(unknown_keys) > 0:
+            raise ValueError(f"Invalid settings: {location} hold the following unknown keys: {', '.join(sorted(unknown_keys))}.")
+
+        for key, current_value in current_settings.items():
+            validate_settings_structure(settings_name, new_settings[key], current_value, f"{key_path}.{key}" if key_path else key)
+        return
+
+    if type(current_settings) in (int, float):
+        if type(new_settings) not in (int, float):
+            raise ValueError(f"Invalid settings: {location} should be a number.")
+        return
+
+    if type(new_settings) is not type(current_settings):
+        raise ValueError(f"Invalid settings: {location} should be of the type '{type(current_settings).__name__}'.")
+
+def validate_settings_values(new_settings_by_name: dict) -> None:
+    """
+        Validate the values of the new settings which the rules of the game depend on.
+        If any value is not allowed, we raise a ValueError.
+    """
+
+    lingo_settings = new_settings_by_name["lingo"]
+    if lingo_settings["teams_amount"] < 1:
+        raise ValueError("Invalid settings: 'teams_amount' of the lingo settings should be at least 1.")
+    if not 0 <= lingo_settings["starting_team_ID"] < lingo_settings["teams_amount"]:
+        raise ValueError("Invalid settings: 'starting_team_ID' of the lingo settings should be the ID of one of the teams.")
+
+    if new_settings_by_name["wordle"]["max_guess_attempts"] < 1:
+        raise ValueError("Invalid settings: 'max_guess_attempts' of the wordle settings should be at least 1.")
+
+    if new_settings_by_name["bingo"]["board_size"] < 1:
+        raise ValueError("Invalid settings: 'board_size' of the bingo settings should be at least 1.")
+    if new_settings_by_name["bingo"]["maximum_grabs_per_round"] < 1:
+        raise ValueError("Invalid settings: 'maximum_grabs_per_round' of the bingo settings should be at least 1.")
+
+
+###
+### UTILITIES
+###
+
+
+def read_settings_file(settings_name: str) -> tuple:
+    """
+        Read the settings file of the specified settings.
+        We return the parsed settings, and the hash of the contents of the file.
+        If the file does not hold valid JSON, we raise a ValueError.
+    """
+
+    # Imported here, so the settings files are only parsed and hashed once the settings are used
+    from hashlib import sha256
+    from json import loads, JSONDecodeError
+
+    settings_file_path = get_settings_file_path(settings_name)
+    with open(settings_file_path, "rb") as settings_file:
+        settings_file_contents = settings_file.read()
+
+    try:
+        settings = loads(settings_file_contents)
+    except (JSONDecodeError, UnicodeDecodeError) as error:
+        raise ValueError(f"Invalid settings: the {settings_name} settings file '{settings_file_path}' does not hold valid JSON ({error}).")
+
+    return settings, sha256(settings_file_contents).hexdigest()
+
+def reload_changed_settings(force: bool = False) -> bool:
+    """
+        Reload the settings whose settings file has changed since it was last loaded, which must only be done between games.
+        The files are checked at most once every `SETTINGS_POLL_INTERVAL` seconds, unless forced.
+        All changed settings are validated before any of them are used, after which each settings dictionary is replaced as a whole,
+        so the getters never see a mix of the previous and the new settings.
+        We return whether any settings have been reloaded.
+        If any changed settings are invalid, or a settings file can not be read, the previous settings are kept and we raise a ValueError.
+        !Do note that an invalid or missing settings file is not read again until it changes once more.
+    """
+
+    now = monotonic()
+    last_polled_at = _settings_loader["lastPolledAt"]
+    if not force and last_polled_at is not None and now - last_polled_at < SETTINGS_POLL_INTERVAL:
+        return False
+    _settings_loader["lastPolledAt"] = now
+
+    changed_settings_names = get_changed_settings_names()
+    if len(changed_settings_names) == 0:
+        return False
+
+    new_settings_by_name = {}
+    new_file_states = {}
+    new_file_hashes = {}
+    for settings_name, settings_file in _settings_files.items():
+        new_settings_by_name[settings_name] = settings_file["getter"]()
+
+    try:
+        for settings_name in changed_settings_names:
+            settings_file = _settings_files[settings_name]
+            try:
+                new_file_states[settings_name] = get_settings_file_state(settings_file["filePath"])
+                new_settings, new_file_hashes[settings_name] = read_settings_file(settings_name)
+            except OSError as error:
+                # Remember the missing file as well, so it is only reported again once it changes
+                new_file_states.setdefault(settings_name, None)
+                raise ValueError(f"Invalid settings: the {settings_name} settings file '{settings_file['filePath']}' can not be read ({error}).")
+            validate_settings_structure(settings_name, new_settings, getattr(settings_file["module"], settings_file["attribute"]))
+            new_settings_by_name[settings_name] = new_settings
+
+        validate_settings_values(new_settings_by_name)
+    finally:
+        # Remember the files which have been read, so an invalid file is not read again until it changes once more
+        _settings_loader["fileStates"].update(new_file_states)
+
+    # Nothing has been used so far, so we can now swap each changed settings dictionary at once
+    for settings_name in changed_settings_names:
+        settings_file = _settings_files[settings_name]
+        setattr(settings_file["module"], settings_file["attribute"], new_settings_by_name[settings_name])
+
+    _settings_loader["fileHashes"].update(new_file_hashes)
+    _settings_loader["version"] = None
+    return True
+
+def load_settings(settings_name: str) -> None:
+    """
+        Read the settings of the specified settings file for the first time, and remember the state and hash of the file.
+        This is done by the getter of the settings (e.g. `get_wordle_settings`) the first time the settings are used.
+        If the file does not hold valid JSON, we raise a ValueError.
+    """
+
+    settings_file = _settings_files[settings_name]
+    settings_file_state = get_settings_file_state(settings_file["filePath"])
+    settings, settings_file_hash = read_settings_file(settings_name)
+
+    _settings_loader["fileStates"][settings_name] = settings_file_state
+    _settings_loader["fileHashes"][settings_name] = settings_file_hash
+    _settings_loader["version"] = None
+    setattr(settings_file["module"], settings_file["attribute"], settings)
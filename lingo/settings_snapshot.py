@@ -0,0 +1,138 @@
+from types import MappingProxyType
+from .game_context import get_active_game_context
+from .settings_loader import get_settings_version
+from .lingo_settings.lingo_settings_utils import get_amount_of_teams, get_starting_team_ID
+from .wordle.words.words_utils import get_words_lengths
+from .wordle.wordle_settings.wordle_settings_utils import get_max_wordle_guess_attempts, get_empty_column_placeholder_for_wordle_board, get_available_letter_position_colors, get_wordle_win_conditions, get_wordle_lose_conditions, should_validate_wordle_round_counters
+from .bingo.bingo_settings.bingo_settings_utils import get_bingo_board_size, get_bingo_number_colors, get_maximum_grabs_per_round, get_bingo_ball_amounts, get_bingo_win_conditions, get_bingo_lose_conditions
+
+# A settings snapshot holds the Lingo, Wordle and Bingo settings of a single game, together with the values which are derived from them:
+# * "version" holds the version of the settings files the snapshot was built from (see `get_settings_version`).
+# * "lingo" holds the amount of teams and the starting team ID.
+# * "wordle" holds the Wordle settings, the feedback colors as a tuple (incorrect, misplaced, correct) with the letter feedback of each of those colors, and a placeholder row for each word length.
+# * "bingo" holds the Bingo settings, and the bitmasks of every line on the bingo board (see `get_bingo_line_masks`).
+# The snapshot is read-only, and is kept within the active game context, so the hot paths of a game never have to go through the settings dictionaries.
+#! Do note that the snapshot is built again each time the teams data is initialized, so changed settings are used from the next game on
+
+
+###
+### GETTERS
+###
+
+
+def get_settings_snapshot() -> MappingProxyType:
+    """
+        Returns the settings snapshot of the active game context.
+        If the game context doesn't hold a settings snapshot yet, we build it first.
+    """
+
+    game_context = get_active_game_context()
+    settings_snapshot = game_context.get("settingsSnapshot")
+    if settings_snapshot is None:
+        settings_snapshot = refresh_settings_snapshot()
+
+    return settings_snapshot
+
+def get_wordle_settings_snapshot() -> MappingProxyType:
+    """
+        Returns the Wordle part of the settings snapshot of the active game context.
+    """
+
+    wordle_settings_snapshot = get_active_game_context().get("wordleSettingsSnapshot")
+    if wordle_settings_snapshot is None:
+        wordle_settings_snapshot = refresh_settings_snapshot()["wordle"]
+
+    return wordle_settings_snapshot
+
+def get_bingo_settings_snapshot() -> MappingProxyType:
+    """
+        Returns the Bingo part of the settings snapshot of the active game context.
+    """
+
+    bingo_settings_snapshot = get_active_game_context().get("bingoSettingsSnapshot")
+    if bingo_settings_snapshot is None:
+        bingo_settings_snapshot = refresh_settings_snapshot()["bingo"]
+
+    return bingo_settings_snapshot
+
+def build_settings_snapshot() -> MappingProxyType:
+    """
+        Returns a new, read-only settings snapshot of the current settings.
+    """
+
+    # Imported here, since the Bingo utilities read the settings snapshot themselves
+    from .bingo.bingo_utils import get_bingo_line_masks
+
+    lingo_settings_snapshot = {
+        "teamsAmount": get_amount_of_teams(),
+        "startingTeamID": get_starting_team_ID()
+    }
+
+    letter_colors = get_available_letter_position_colors()
+    letter_placeholder = get_empty_column_placeholder_for_wordle_board()
+    feedback_colors = (letter_colors["incorrect"], letter_colors["misplaced"], letter_colors["correct"])
+    letter_feedback_by_color = {}
+    for letter_feedback, feedback_color in enumerate(feedback_colors):
+        letter_feedback_by_color[feedback_color] = letter_feedback
+
+    placeholder_rows = {}
+    for word_length in get_words_lengths():
+        placeholder_rows[word_length] = (letter_placeholder,) * word_length
+
+    wordle_settings_snapshot = {
+        "maxGuessAttempts": get_max_wordle_guess_attempts(),
+        "letterPlaceholder": letter_placeholder,
+        "placeholderRows": MappingProxyType(placeholder_rows),
+        "letterColors": MappingProxyType(dict(letter_colors)),
+        "correctColor": letter_colors["correct"],
+        "defaultColor": letter_colors["default"],
+        "feedbackColors": feedback_colors,
+        "letterFeedbackByColor": MappingProxyType(letter_feedback_by_color),
+        "roundsWonToWin": get_wordle_win_conditions()["rounds_won"],
+        "roundsLostInARowToLose": get_wordle_lose_conditions()["rounds_lost_in_a_row"],
+        "validateRoundCounters": should_validate_wordle_round_counters()
+    }
+
+    bingo_board_size = get_bingo_board_size()
+    number_colors = get_bingo_number_colors()
+    line_masks = {}
+    for direction, direction_line_masks in get_bingo_line_masks(bingo_board_size).items():
+        line_masks[direction] = tuple(direction_line_masks)
+
+    bingo_settings_snapshot = {
+        "boardSize": bingo_board_size,
+        "numberColors": (number_colors.get("marked"), number_colors.get("unmarked")),
+        "maximumGrabsPerRound": get_maximum_grabs_per_round(),
+        "ballAmounts": MappingProxyType(dict(get_bingo_ball_amounts())),
+        "linesToWin": get_bingo_win_conditions()["lines_needed"],
+        "greenBallsToWin": get_bingo_win_conditions()["green_balls_grabbed"],
+        "redBallsToLose": get_bingo_lose_conditions()["red_balls_grabbed"],
+        "lineMasks": MappingProxyType(line_masks)
+    }
+
+    settings_snapshot = MappingProxyType({
+        "version": get_settings_version(),
+        "lingo": MappingProxyType(lingo_settings_snapshot),
+        "wordle": MappingProxyType(wordle_settings_snapshot),
+        "bingo": MappingProxyType(bingo_settings_snapshot)
+    })
+    return settings_snapshot
+
+
+###
+### SETTERS
+###
+
+
+def refresh_settings_snapshot() -> MappingProxyType:
+    """
+        Build a new settings snapshot of the current settings, and keep it within the active game context.
+        We return the new settings snapshot.
+    """
+
+    settings_snapshot = build_settings_snapshot()
+    game_context = get_active_game_context()
+    game_context["settingsSnapshot"] = settings_snapshot
+    game_context["wordleSettingsSnapshot"] = settings_snapshot["wordle"]
+    game_context["bingoSettingsSnapshot"] = settings_snapshot["bingo"]
+    return settings_snapshot
@@ -1,6 +1,9 @@
 from .wordle_settings.wordle_settings_utils import get_max_wordle_guess_attempts, get_wordle_win_conditions, get_wordle_lose_conditions
 from ..lingo_utils import print_message, set_losing_team, set_winning_team
+from ..lingo_output import ask_input
 from .wordle_utils import *
+from ..lingo_profiling import profiled
+from ..lingo_metrics import timed_round
 
 def ask_wordle_word_guess(attempt_number: int, team_ID: int) -> str:
     """
@@ -10,7 +13,7 @@ def ask_wordle_word_guess(attempt_number: int, team_ID: int) -> str:
     """
 
     while True:
-        guess = input(f"Enter your 5-letter for attempt number {attempt_number + 1}: ").strip().lower()
+        guess = ask_input(f"Enter your 5-letter for attempt number {attempt_number + 1}: ").strip().lower()
         guess_validation = is_valid_wordle_guess(guess, team_ID)
 
         if guess_validation["isValid"]:
@@ -20,6 +23,8 @@ def ask_wordle_word_guess(attempt_number: int, team_ID: int) -> str:
         message_color = "red"
         print_message(message, message_color)
 
+@profiled()
+@timed_round("wordle")
 def play_wordle_round_for_team(team_ID: int) -> bool:
     """
         Play a single Wordle round for the specified team.
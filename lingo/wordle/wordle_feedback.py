@@ -0,0 +1,457 @@
+import os
+from array import array
+from ..settings_snapshot import get_wordle_settings_snapshot
+
+# NumPy is optional. When it is not installed, the feedback pattern tables are stored within an array('B') instead.
+# It is only imported the first time it is needed (see `get_numpy`), since importing NumPy takes longer than importing the whole game
+_numpy = {
+    "module": None,
+    "isImported": False
+}
+
+# The feedback of a single letter is encoded as a base-3 digit.
+# The feedback of a whole guess is the sum of each letter's digit multiplied by 3 to the power of the letter's position
+INCORRECT_LETTER_FEEDBACK = 0
+MISPLACED_LETTER_FEEDBACK = 1
+CORRECT_LETTER_FEEDBACK = 2
+
+# Since each feedback pattern is stored as a single unsigned byte (0 - 255), the words can hold at most 5 letters (3 ** 5 = 243 patterns)
+MAX_FEEDBACK_PATTERN_WORD_LENGTH = 5
+
+# The maximum amount of feedback patterns which are scored at once by `get_feedback_patterns_for_guesses`.
+# Every pattern needs a few bytes of intermediate results per letter, so this keeps the memory use of scoring big words lists limited
+MAX_FEEDBACK_PATTERNS_PER_CHUNK = 1_000_000
+
+# The default directory where the feedback pattern tables are cached on disk.
+# This can be overwritten with the LINGO_CACHE_DIR environment variable
+DEFAULT_FEEDBACK_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.realpath(__file__)), "feedback_cache")
+
+# The currently loaded feedback pattern table.
+# When a table is loaded, `get_guess_letters_color_based_on_word_to_guess` decodes the colors from it instead of scoring the guess again
+_feedback_pattern_table = {
+    "table": None,
+    "wordIndexes": {}
+}
+
+
+###
+### GETTERS
+###
+
+
+def get_numpy():
+    """
+        Return the NumPy module, which is imported the first time this is called.
+        When NumPy is not installed, we return None.
+    """
+
+    if not _numpy["isImported"]:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        _numpy["module"] = numpy
+        _numpy["isImported"] = True
+
+    return _numpy["module"]
+
+def get_feedback_pattern(guess: str, word_to_guess: str) -> int:
+    """
+        Return the feedback pattern of the guess compared to the word to guess, encoded as a base-3 integer.
+        !Do note that this uses the same two-pass algorithm as `get_guess_letters_color_based_on_word_to_guess`,
+        !so duplicate letters are only marked as misplaced as many times as they occur in the word to guess.
+    """
+
+    letters_feedback = [None] * len(guess)
+    word_to_guess_letters = list(word_to_guess)
+
+    # We first check for any correct positioned letters
+    for index, letter in enumerate(guess):
+        if letter == word_to_guess_letters[index]:
+            letters_feedback[index] = CORRECT_LETTER_FEEDBACK
+            word_to_guess_letters[index] = ""
+
+    # After we found all correct positioned letters, we check for misplaced and incorrect letters
+    for index, letter in enumerate(guess):
+        if letters_feedback[index] is not None:
+            continue
+
+        if letter in word_to_guess_letters:
+            letters_feedback[index] = MISPLACED_LETTER_FEEDBACK
+            word_to_guess_letters[word_to_guess_letters.index(letter)] = ""
+            continue
+
+        letters_feedback[index] = INCORRECT_LETTER_FEEDBACK
+
+    return encode_letters_feedback(letters_feedback)
+
+def get_words_letters(words: list[str]):
+    """
+        Return the letters of the provided words as a NumPy uint8 matrix (word index x letter position), which is used to score many words at once.
+        When NumPy is not installed, we return None.
+        !Do note that all words must have the same length.
+    """
+
+    numpy = get_numpy()
+    if numpy is None:
+        return None
+
+    validate_words_have_same_length(words)
+
+    words_bytes = "".join(words).encode("ascii")
+    word_length = len(words[0]) if len(words) > 0 else 0
+    return numpy.frombuffer(words_bytes, dtype=numpy.uint8).reshape(len(words), word_length)
+
+def get_feedback_patterns_for_guess(guess: str, words: list[str], words_letters=None):
+    """
+        Return the feedback pattern of the guess compared to each of the provided words.
+        When NumPy is installed, all words are scored at once on their letters matrix (see `get_words_letters`), and a NumPy array is returned.
+        Else, each word is scored with `get_feedback_pattern`, and a list is returned.
+    """
+
+    numpy = get_numpy()
+    if numpy is None:
+        feedback_patterns = []
+        for word_to_guess in words:
+            feedback_patterns.append(get_feedback_pattern(guess, word_to_guess))
+        return feedback_patterns
+
+    if words_letters is None:
+        words_letters = get_words_letters(words)
+
+    guess_letters = numpy.frombuffer(guess.encode("ascii"), dtype=numpy.uint8).reshape(1, len(guess))
+    return get_feedback_pattern_matrix(guess_letters, words_letters)[0]
+
+def get_feedback_patterns_for_guesses(guesses: list[str], words: list[str]):
+    """
+        Return the feedback pattern of every guess compared to every word (guess index x word index).
+        When NumPy is installed, the guesses are scored in chunks on their letters matrices, and a NumPy matrix is returned.
+        Else, each pair is scored with `get_feedback_pattern`, and a list of lists is returned.
+    """
+
+    numpy = get_numpy()
+    if numpy is None:
+        feedback_patterns = []
+        for guess in guesses:
+            feedback_patterns.append(get_feedback_patterns_for_guess(guess, words))
+        return feedback_patterns
+
+    validate_words_have_same_length(guesses + words)
+
+    guesses_letters = get_words_letters(guesses)
+    words_letters = get_words_letters(words)
+    word_length = guesses_letters.shape[1]
+
+    # Score a limited amount of guesses at once, so the intermediate matrices stay small even for big words lists
+    feedback_patterns = numpy.empty((len(guesses), len(words)), dtype=get_feedback_patterns_dtype(word_length))
+    guesses_per_chunk = max(1, MAX_FEEDBACK_PATTERNS_PER_CHUNK // max(1, len(words)))
+    for first_guess_index in range(0, len(guesses), guesses_per_chunk):
+        last_guess_index = first_guess_index + guesses_per_chunk
+        feedback_patterns[first_guess_index:last_guess_index] = get_feedback_pattern_matrix(guesses_letters[first_guess_index:last_guess_index], words_letters)
+
+    return feedback_patterns
+
+def get_feedback_patterns_for_pairs(guesses: list[str], words: list[str]):
+    """
+        Return the feedback pattern of each guess compared to the word on the same index, e.g. to score the guesses of many played rounds at once.
+        When NumPy is installed, all pairs are scored at once on their letters matrices, and a NumPy array is returned.
+        Else, each pair is scored with `get_feedback_pattern`, and a list is returned.
+    """
+
+    numpy = get_numpy()
+    if len(guesses) != len(words):
+        raise ValueError(f"Every guess needs a word to be compared with, but there are {len(guesses)} guesses and {len(words)} words.")
+
+    if numpy is None:
+        feedback_patterns = []
+        for guess, word_to_guess in zip(guesses, words):
+            feedback_patterns.append(get_feedback_pattern(guess, word_to_guess))
+        return feedback_patterns
+
+    validate_words_have_same_length(guesses + words)
+    return get_paired_feedback_patterns(get_words_letters(guesses), get_words_letters(words))
+
+def get_feedback_pattern_matrix(guesses_letters, words_letters):
+    """
+        Return the feedback pattern of every guess compared to every word, as a NumPy matrix (guess index x word index).
+        Both the guesses and the words are passed as their letters matrix (see `get_words_letters`), and all of them must have the same length.
+        !Do note that this needs NumPy, and uses memory for every guess and word at once, so big lists should be scored in chunks of guesses.
+    """
+
+    numpy = get_numpy()
+    return get_feedback_patterns_of_letters(guesses_letters[:, numpy.newaxis, :], words_letters[numpy.newaxis, :, :])
+
+def get_paired_feedback_patterns(guesses_letters, words_letters):
+    """
+        Return the feedback pattern of each guess compared to the word on the same index, as a NumPy array.
+        Both the guesses and the words are passed as their letters matrix (see `get_words_letters`), and all of them must have the same length.
+        !Do note that this needs NumPy.
+    """
+
+    return get_feedback_patterns_of_letters(guesses_letters, words_letters)
+
+def get_feedback_patterns_of_letters(guesses_letters, words_letters):
+    """
+        Return the feedback patterns of the guesses compared to the words, where both are NumPy uint8 arrays whose last axis is the letter position.
+        The other axes are broadcast against each other, so the guesses can be compared with the words pair by pair, or every guess with every word.
+        !Do note that this uses the same two-pass rule as `get_feedback_pattern`, so the patterns are exactly the same.
+    """
+
+    numpy = get_numpy()
+    word_length = guesses_letters.shape[-1]
+    patterns_shape = numpy.broadcast_shapes(guesses_letters.shape[:-1], words_letters.shape[:-1])
+
+    # For each letter position, compare the letter of every guess with the letter of the word on the same position.
+    # The unmatched letters are the letters of each word which are not on their correct position, which are the letters a misplaced letter can match with.
+    # We replace the correct letters with 0, since no guessed letter is 0
+    correct_letters = []
+    unmatched_letters = []
+    for index in range(word_length):
+        correct_letters_on_position = guesses_letters[..., index] == words_letters[..., index]
+        correct_letters.append(correct_letters_on_position)
+        unmatched_letters.append(numpy.where(correct_letters_on_position, 0, words_letters[..., index]))
+
+    feedback_patterns = numpy.zeros(patterns_shape, dtype=get_feedback_patterns_dtype(word_length))
+    misplaced_letters = []
+    for index in range(word_length):
+        letter = guesses_letters[..., index]
+
+        # A letter is misplaced when the word to guess still holds an unmatched copy of it.
+        # Every earlier misplaced copy of the same letter within the guess has already used up one of those copies
+        available_letters_amount = numpy.zeros(patterns_shape, dtype=numpy.int8)
+        for unmatched_letters_on_position in unmatched_letters:
+            available_letters_amount += unmatched_letters_on_position == letter
+        for previous_index in range(index):
+            same_letters = guesses_letters[..., previous_index] == letter
+            available_letters_amount -= misplaced_letters[previous_index] & same_letters
+
+        misplaced_letters_on_position = ~correct_letters[index] & (available_letters_amount > 0)
+        misplaced_letters.append(misplaced_letters_on_position)
+
+        feedback_patterns += correct_letters[index] * feedback_patterns.dtype.type(CORRECT_LETTER_FEEDBACK * 3 ** index)
+        feedback_patterns += misplaced_letters_on_position * feedback_patterns.dtype.type(MISPLACED_LETTER_FEEDBACK * 3 ** index)
+
+    return feedback_patterns
+
+def get_feedback_patterns_dtype(word_length: int):
+    """
+        Return the smallest NumPy integer type which can hold every feedback pattern of words with the specified length.
+    """
+
+    numpy = get_numpy()
+    if word_length <= MAX_FEEDBACK_PATTERN_WORD_LENGTH:
+        return numpy.uint8
+
+    return numpy.int64
+
+def encode_letters_feedback(letters_feedback: list[int]) -> int:
+    """
+        Return the base-3 feedback pattern for the provided feedback of each letter.
+    """
+
+    feedback_pattern = 0
+    for letter_feedback in reversed(letters_feedback):
+        feedback_pattern = feedback_pattern * 3 + letter_feedback
+    return feedback_pattern
+
+def decode_feedback_pattern(feedback_pattern: int, word_length: int) -> list[str]:
+    """
+        Return a list of colors for each letter, based on the provided feedback pattern.
+    """
+
+    # The feedback colors are ordered by their letter feedback (incorrect, misplaced, correct)
+    feedback_colors = get_wordle_settings_snapshot()["feedbackColors"]
+
+    guess_colors = []
+    for _ in range(word_length):
+        guess_colors.append(feedback_colors[feedback_pattern % 3])
+        feedback_pattern //= 3
+    return guess_colors
+
+def encode_feedback_colors(guess_colors: list[str]) -> int:
+    """
+        Return the feedback pattern for the provided colors of each letter, which is the reverse of `decode_feedback_pattern`.
+    """
+
+    letter_feedback_by_color = get_wordle_settings_snapshot()["letterFeedbackByColor"]
+
+    letters_feedback = []
+    for guess_color in guess_colors:
+        letters_feedback.append(letter_feedback_by_color[guess_color])
+    return encode_letters_feedback(letters_feedback)
+
+def get_words_list_hash(words: list[str]) -> str:
+    """
+        Return a hash which identifies the provided words list, including the order of the words.
+        !Do note that hashlib is only imported once a words list is hashed, since the hash is only needed for the feedback pattern tables.
+    """
+
+    from hashlib import sha256
+    words_list_hash = sha256("\n".join(words).encode("utf-8")).hexdigest()
+    return words_list_hash
+
+def get_feedback_cache_directory() -> str:
+    """
+        Return the directory where the feedback pattern tables are cached on disk.
+    """
+
+    feedback_cache_directory = os.environ.get("LINGO_CACHE_DIR", DEFAULT_FEEDBACK_CACHE_DIRECTORY)
+    return feedback_cache_directory
+
+def get_feedback_pattern_table_path(words: list[str], cache_directory: str = None) -> str:
+    """
+        Return the path of the cached feedback pattern table for the provided words list.
+    """
+
+    if cache_directory is None:
+        cache_directory = get_feedback_cache_directory()
+
+    file_name = f"feedback_table_{get_words_list_hash(words)}.bin"
+    return os.path.join(cache_directory, file_name)
+
+def build_feedback_pattern_table(words: list[str]):
+    """
+        Return the feedback pattern of every guess against every word to guess within the provided words list.
+        The table is a NumPy uint8 matrix (guess index x word to guess index) when NumPy is installed,
+        otherwise it is a flat array('B') where the pattern is at `guess index * amount of words + word to guess index`.
+    """
+
+    numpy = get_numpy()
+    validate_feedback_pattern_words(words)
+
+    if numpy is not None:
+        return get_feedback_patterns_for_guesses(words, words)
+
+    table = array("B")
+    for guess in words:
+        for word_to_guess in words:
+            table.append(get_feedback_pattern(guess, word_to_guess))
+
+    return table
+
+def convert_feedback_pattern_table(table: array, words_amount: int):
+    """
+        Return the flat feedback pattern table as a NumPy matrix when NumPy is installed, else return it unchanged.
+    """
+
+    numpy = get_numpy()
+    if numpy is None:
+        return table
+
+    return numpy.frombuffer(table, dtype=numpy.uint8).reshape(words_amount, words_amount)
+
+def load_feedback_pattern_table(words: list[str], cache_directory: str = None):
+    """
+        Return the feedback pattern table for the provided words list.
+        If the table has been cached on disk before, we load it from there. Else, we build the table and cache it on disk.
+    """
+
+    table_path = get_feedback_pattern_table_path(words, cache_directory)
+    words_amount = len(words)
+
+    if os.path.exists(table_path):
+        table = array("B")
+        with open(table_path, "rb") as table_file:
+            table.frombytes(table_file.read())
+
+        # If the cached table doesn't have the expected size (e.g. the file was only partly written), we rebuild it
+        if len(table) == words_amount * words_amount:
+            return convert_feedback_pattern_table(table, words_amount)
+
+    table = build_feedback_pattern_table(words)
+
+    # Write the table to a temporary file first, so other processes never read a partly written table
+    os.makedirs(os.path.dirname(table_path), exist_ok=True)
+    temporary_table_path = f"{table_path}.{os.getpid()}.tmp"
+    with open(temporary_table_path, "wb") as table_file:
+        table_file.write(bytes(table))
+    os.replace(temporary_table_path, table_path)
+
+    return table
+
+def get_feedback_pattern_from_table(guess: str, word_to_guess: str) -> int | None:
+    """
+        Return the feedback pattern of the guess compared to the word to guess from the loaded feedback pattern table.
+        If no table has been loaded, or one of the words isn't within the table's words list, we return None.
+    """
+
+    table = _feedback_pattern_table["table"]
+    if table is None:
+        return None
+
+    word_indexes = _feedback_pattern_table["wordIndexes"]
+    guess_index = word_indexes.get(guess)
+    word_to_guess_index = word_indexes.get(word_to_guess)
+    if guess_index is None or word_to_guess_index is None:
+        return None
+
+    if get_numpy() is None:
+        return table[guess_index * len(word_indexes) + word_to_guess_index]
+    return int(table[guess_index, word_to_guess_index])
+
+def is_feedback_pattern_table_loaded() -> bool:
+    """
+        Return whether a feedback pattern table has been loaded.
+    """
+
+    return _feedback_pattern_table["table"] is not None
+
+
+###
+### SETTERS
+###
+
+
+def enable_feedback_pattern_table(words: list[str], cache_directory: str = None) -> None:
+    """
+        Load the feedback pattern table for the provided words list,
+        so the Wordle guesses are scored by looking up their pattern within the table.
+    """
+
+    word_indexes = {}
+    for index, word in enumerate(words):
+        word_indexes[word] = index
+
+    _feedback_pattern_table["table"] = load_feedback_pattern_table(words, cache_directory)
+    _feedback_pattern_table["wordIndexes"] = word_indexes
+
+def disable_feedback_pattern_table() -> None:
+    """
+        Unload the feedback pattern table, so the Wordle guesses are scored letter by letter again.
+    """
+
+    _feedback_pattern_table["table"] = None
+    _feedback_pattern_table["wordIndexes"] = {}
+
+
+###
+### VALIDATORS
+###
+
+
+def validate_words_have_same_length(words: list[str]) -> None:
+    """
+        Validate that all words have the same length, so their letters fit within a single letters matrix.
+        If they don't, we raise a ValueError.
+    """
+
+    word_lengths = set(len(word) for word in words)
+    if len(word_lengths) > 1:
+        raise ValueError(f"All words must have the same length to be scored at once, but they have the lengths {sorted(word_lengths)}.")
+
+def validate_feedback_pattern_words(words: list[str]) -> None:
+    """
+        Validate that the words list can be stored within a feedback pattern table.
+        All words must be unique, have the same length, and hold at most 5 letters.
+    """
+
+    if len(set(words)) != len(words):
+        raise ValueError("The words list of a feedback pattern table can not contain duplicate words.")
+
+    word_lengths = set(len(word) for word in words)
+    if len(word_lengths) > 1:
+        raise ValueError("All words within a feedback pattern table must have the same length.")
+
+    if word_lengths and max(word_lengths) > MAX_FEEDBACK_PATTERN_WORD_LENGTH:
+        raise ValueError(f"The words within a feedback pattern table can hold at most {MAX_FEEDBACK_PATTERN_WORD_LENGTH} letters.")
@@ -1,10 +1,10 @@
 import os
-from json import load
 
-# Let us read and use the Wordle settings
+# The Wordle settings, which are only read from the settings file the first time they are used (see `get_wordle_settings`).
+#! Do note that the settings can be reloaded between games when the settings file changes (see `reload_changed_settings`), which replaces this dictionary as a whole
 currentDir = os.path.dirname(os.path.realpath(__file__))
-with open(os.path.join(currentDir, "wordle_settings.json"), "r") as wordle_settings_file:
-    wordle_settings = load(wordle_settings_file)
+WORDLE_SETTINGS_FILE_PATH = os.path.join(currentDir, "wordle_settings.json")
+wordle_settings = None
 
 
 ###
@@ -12,12 +12,24 @@ with open(os.path.join(currentDir, "wordle_settings.json"), "r") as wordle_setti
 ###
 
 
+def get_wordle_settings() -> dict:
+    """
+        Return the Wordle settings, which are read from the settings file the first time they are used.
+    """
+
+    if wordle_settings is None:
+        # Imported here, since the settings loader imports this module itself
+        from ...settings_loader import load_settings
+        load_settings("wordle")
+
+    return wordle_settings
+
 def get_empty_column_placeholder_for_wordle_board() -> str:
     """
         Return the letter placeholder used for empty letters on the Wordle board.
     """
 
-    letter_placeholder = wordle_settings["empty_column_placeholder"]
+    letter_placeholder = get_wordle_settings()["empty_column_placeholder"]
     return letter_placeholder
 
 def get_max_wordle_guess_attempts() -> int:
@@ -25,7 +37,7 @@ def get_max_wordle_guess_attempts() -> int:
         Return the maximum attempts allowed for guessing the Wordle word.
     """
 
-    max_attempts = wordle_settings["max_guess_attempts"]
+    max_attempts = get_wordle_settings()["max_guess_attempts"]
     return max_attempts
 
 def get_available_letter_position_colors() -> dict:
@@ -33,7 +45,7 @@ def get_available_letter_position_colors() -> dict:
         Return the available letter position colors.
     """
 
-    available_letter_position_colors = wordle_settings["letter_color_for_guess"]
+    available_letter_position_colors = get_wordle_settings()["letter_color_for_guess"]
     return available_letter_position_colors
 
 def get_wordle_win_conditions() -> dict:
@@ -41,7 +53,7 @@ def get_wordle_win_conditions() -> dict:
         Return the win conditions for the Wordle game.
     """
 
-    win_conditions = wordle_settings["win_conditions"]
+    win_conditions = get_wordle_settings()["win_conditions"]
     return win_conditions
 
 def get_wordle_lose_conditions() -> dict:
@@ -49,5 +61,14 @@ def get_wordle_lose_conditions() -> dict:
         Return the lose conditions for the Wordle game.
     """
 
-    lose_conditions = wordle_settings["lose_conditions"]
-    return lose_conditions
\ No newline at end of file
+    lose_conditions = get_wordle_settings()["lose_conditions"]
+    return lose_conditions
+
+def should_validate_wordle_round_counters() -> bool:
+    """
+        Return whether the Wordle round counters should be validated against the rounds of the team each time they are read.
+        !Do note that this makes reading the round counters as slow as going through every round, so it should only be enabled while debugging.
+    """
+
+    validate_round_counters = get_wordle_settings()["validate_round_counters"]
+    return validate_round_counters
\ No newline at end of file
@@ -0,0 +1,184 @@
+from collections import Counter
+from math import log2
+from random import Random
+from .words.words_utils import get_words_of_length
+from .wordle_feedback import get_numpy, get_words_letters, get_feedback_patterns_for_guess, get_feedback_pattern_matrix, encode_feedback_colors
+from .wordle_settings.wordle_settings_utils import get_empty_column_placeholder_for_wordle_board
+from .wordle_utils import get_current_wordle_round_for_team
+
+# The maximum amount of guesses which are ranked for a single suggestion.
+# When there are more candidate words, a fixed sample of them is ranked, which keeps each suggestion within a few milliseconds on big words lists
+MAX_RANKED_GUESSES = 300
+
+# The solver state holds what is known about the word to guess of a single Wordle round:
+# * "candidates" holds the words which could still be the word to guess.
+# * "candidatesLetters" holds the letters of the candidates as a NumPy matrix (see `get_words_letters`), or None when NumPy is not installed.
+# * "guesses" holds the guesses which have been applied to the solver state.
+#! Do note that the candidates always start with the first letter of the word to guess, since `add_single_initial_rounds_info_for_team` reveals it
+
+
+###
+### GETTERS
+###
+
+
+def create_solver_state(word_length: int, first_letter: str, words: list[str] = None) -> dict:
+    """
+        Returns a new solver state for a Wordle round where the word to guess has the specified length and first letter.
+        By default, the candidates are taken from the words list of the specified length.
+    """
+
+    if words is None:
+        words = get_words_of_length(word_length)
+
+    candidates = []
+    for word in words:
+        if len(word) == word_length and word[0] == first_letter:
+            candidates.append(word)
+
+    solver_state = {
+        "candidates": candidates,
+        "candidatesLetters": get_words_letters(candidates) if len(candidates) > 0 else None,
+        "guesses": []
+    }
+    return solver_state
+
+def create_solver_state_for_current_round_of_team(team_ID: int, words: list[str] = None) -> dict:
+    """
+        Returns a solver state which holds everything the specified team can see of their current Wordle round:
+        the revealed first letter, and the colors of each guess they have made.
+    """
+
+    current_wordle_round = get_current_wordle_round_for_team(team_ID)
+    word_length = len(current_wordle_round["wordToGuess"])
+    first_letter = current_wordle_round["guesses"][0][0]
+    solver_state = create_solver_state(word_length, first_letter, words)
+
+    # The rows of the round also hold the revealed first letter, and the correct letters which are shown on the row of the next attempt.
+    # Those rows always hold a placeholder or are shorter than the word, so only the complete rows are actual guesses
+    letter_placeholder = get_empty_column_placeholder_for_wordle_board()
+    for guess_letters, guess_colors in zip(current_wordle_round["guesses"], current_wordle_round["guessesColor"]):
+        if len(guess_letters) != word_length or letter_placeholder in guess_letters:
+            continue
+
+        apply_guess_to_solver_state(solver_state, "".join(guess_letters), guess_colors)
+
+    return solver_state
+
+def get_guess_information(solver_state: dict, guess: str) -> float:
+    """
+        Returns the expected information (in bits) the colors of the guess give about the word to guess.
+        This is the entropy of the feedback patterns of the guess over all candidates: the more evenly the guess splits the candidates, the more it tells us.
+    """
+
+    numpy = get_numpy()
+    candidates = solver_state["candidates"]
+    candidates_amount = len(candidates)
+    if candidates_amount == 0:
+        return 0.0
+
+    feedback_patterns = get_feedback_patterns_for_guess(guess, candidates, solver_state["candidatesLetters"])
+    if numpy is not None:
+        patterns_amounts = numpy.bincount(feedback_patterns)
+        probabilities = patterns_amounts[patterns_amounts > 0] / candidates_amount
+        return float(-(probabilities * numpy.log2(probabilities)).sum())
+
+    guess_information = 0.0
+    for pattern_amount in Counter(feedback_patterns).values():
+        probability = pattern_amount / candidates_amount
+        guess_information -= probability * log2(probability)
+    return guess_information
+
+def get_ranked_guesses(solver_state: dict, limit: int = 5) -> list[tuple[str, float]]:
+    """
+        Returns the best next guesses with their expected information (in bits), from most to least informative.
+        Only candidates are ranked, so every suggestion could also be the word to guess.
+        When there are more than `MAX_RANKED_GUESSES` candidates, a fixed sample of them is ranked.
+    """
+
+    numpy = get_numpy()
+    candidates = solver_state["candidates"]
+    if len(candidates) <= 2:
+        # With two or fewer candidates, guessing any of them is just as informative as the other, and might be correct
+        ranked_guesses = []
+        for candidate in candidates[:limit]:
+            ranked_guesses.append((candidate, get_guess_information(solver_state, candidate)))
+        return ranked_guesses
+
+    guesses = candidates
+    if len(guesses) > MAX_RANKED_GUESSES:
+        # The sample is seeded on the candidates amount, so the same solver state always gets the same suggestions
+        guesses = Random(len(guesses)).sample(guesses, MAX_RANKED_GUESSES)
+
+    ranked_guesses = []
+    if numpy is None:
+        for guess in guesses:
+            ranked_guesses.append((guess, get_guess_information(solver_state, guess)))
+    else:
+        # Score all guesses against all candidates at once, and count how often each feedback pattern occurs for every guess
+        feedback_patterns = get_feedback_pattern_matrix(get_words_letters(guesses), solver_state["candidatesLetters"])
+        patterns_amount = int(feedback_patterns.max()) + 1
+        guesses_patterns_amounts = numpy.zeros((len(guesses), patterns_amount), dtype=numpy.int64)
+        numpy.add.at(guesses_patterns_amounts, (numpy.arange(len(guesses))[:, numpy.newaxis], feedback_patterns), 1)
+
+        probabilities = guesses_patterns_amounts / len(candidates)
+        nonzero_probabilities = numpy.where(probabilities > 0, probabilities, 1)
+        guesses_information = -(probabilities * numpy.log2(nonzero_probabilities)).sum(axis=1)
+        for guess, guess_information in zip(guesses, guesses_information):
+            ranked_guesses.append((guess, float(guess_information)))
+
+    ranked_guesses.sort(key=lambda ranked_guess: (-ranked_guess[1], ranked_guess[0]))
+    return ranked_guesses[:limit]
+
+def get_suggested_guess(solver_state: dict) -> str:
+    """
+        Returns the most informative next guess, or None when there are no candidates left.
+    """
+
+    ranked_guesses = get_ranked_guesses(solver_state, 1)
+    if len(ranked_guesses) == 0:
+        return None
+
+    return ranked_guesses[0][0]
+
+def get_suggested_guess_for_current_round_of_team(team_ID: int) -> str:
+    """
+        Returns the most informative next guess for the current Wordle round of the specified team, which can be shown as a hint.
+    """
+
+    solver_state = create_solver_state_for_current_round_of_team(team_ID)
+    suggested_guess = get_suggested_guess(solver_state)
+    return suggested_guess
+
+
+###
+### SETTERS
+###
+
+
+def apply_guess_to_solver_state(solver_state: dict, guess: str, guess_colors: list[str]) -> None:
+    """
+        Remove every candidate which would not have given the same colors for the guess.
+    """
+
+    numpy = get_numpy()
+    solver_state["guesses"].append(guess)
+
+    candidates = solver_state["candidates"]
+    if len(candidates) == 0:
+        return
+
+    feedback_pattern = encode_feedback_colors(guess_colors)
+    feedback_patterns = get_feedback_patterns_for_guess(guess, candidates, solver_state["candidatesLetters"])
+
+    if numpy is None:
+        remaining_candidates = []
+        for candidate, candidate_pattern in zip(candidates, feedback_patterns):
+            if candidate_pattern == feedback_pattern:
+                remaining_candidates.append(candidate)
+        solver_state["candidates"] = remaining_candidates
+        return
+
+    remaining_indexes = numpy.flatnonzero(feedback_patterns == feedback_pattern)
+    solver_state["candidates"] = [candidates[index] for index in remaining_indexes]
+    solver_state["candidatesLetters"] = solver_state["candidatesLetters"][remaining_indexes]
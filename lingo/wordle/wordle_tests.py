@@ -1,10 +1,16 @@
+import os
 from random import choice
+from tempfile import TemporaryDirectory
 from test_lib import test
 from ..teams_data import teams_data
 from ..lingo_utils import initialize_teams_data, remove_teams_data
 from ..lingo_settings.lingo_settings_utils import get_starting_team_ID
 from ..lingo_constants import GAP_BETWEEN_BOARD_COLUMNS
 from ..wordle.wordle_utils import *
+from ..wordle.words import five_letter_words
+from ..wordle.wordle_settings.wordle_settings_utils import get_max_wordle_guess_attempts, get_empty_column_placeholder_for_wordle_board, get_available_letter_position_colors, get_wordle_lose_conditions, get_wordle_win_conditions
+from ..wordle.wordle_solver import create_solver_state_for_current_round_of_team, get_suggested_guess
+from ..wordle.wordle_feedback import get_feedback_pattern, get_feedback_patterns_for_guess, get_feedback_patterns_for_guesses, get_feedback_patterns_for_pairs, encode_letters_feedback, encode_feedback_colors, load_feedback_pattern_table, get_feedback_pattern_table_path, enable_feedback_pattern_table, disable_feedback_pattern_table, is_feedback_pattern_table_loaded, CORRECT_LETTER_FEEDBACK, MISPLACED_LETTER_FEEDBACK, INCORRECT_LETTER_FEEDBACK
 
 def test_get_current_wordle_round_for_team() -> None:
     """
@@ -705,4 +711,327 @@ def test_get_wordle_lose_conditions() -> None:
             expected_value,
             result_lose_conditions[key],
         )
-test_get_wordle_lose_conditions()
\ No newline at end of file
+test_get_wordle_lose_conditions()
+
+def test_get_feedback_pattern() -> None:
+    """
+        Test whether the function which encodes the feedback of a guess as a base-3 integer works correctly.
+    """
+
+    # The first letter is correct, the second and the last two letters are misplaced, and the third letter is incorrect
+    word_to_guess = "crane"
+    guess = "cater"
+    expected = encode_letters_feedback([
+        CORRECT_LETTER_FEEDBACK,
+        MISPLACED_LETTER_FEEDBACK,
+        INCORRECT_LETTER_FEEDBACK,
+        MISPLACED_LETTER_FEEDBACK,
+        MISPLACED_LETTER_FEEDBACK
+    ])
+    test(
+        f"The feedback pattern for the word '{word_to_guess}' and guess '{guess}' should be {expected}.",
+        expected,
+        get_feedback_pattern(guess, word_to_guess),
+    )
+
+    # Test whether decoding the feedback pattern results in the same colors as scoring the guess letter by letter
+    words = five_letter_words.words[:30]
+    decoded_colors_match = True
+    for guess in words:
+        for word_to_guess in words:
+            decoded_colors = decode_feedback_pattern(get_feedback_pattern(guess, word_to_guess), len(guess))
+            if decoded_colors != get_guess_letters_color_based_on_word_to_guess(guess, word_to_guess):
+                decoded_colors_match = False
+    test(
+        "Decoding the feedback pattern of each guess should result in the same colors as scoring the guess letter by letter.",
+        True,
+        decoded_colors_match,
+    )
+
+    # Test whether encoding the colors of a guess results in the same feedback pattern
+    guess_colors = get_guess_letters_color_based_on_word_to_guess(guess, word_to_guess)
+    test(
+        f"Encoding the colors of the guess '{guess}' for the word '{word_to_guess}' should result in its feedback pattern.",
+        get_feedback_pattern(guess, word_to_guess),
+        encode_feedback_colors(guess_colors),
+    )
+test_get_feedback_pattern()
+
+def test_load_feedback_pattern_table() -> None:
+    """
+        Test whether the feedback pattern table is cached on disk, and is used to score the guesses when it is enabled.
+    """
+
+    words = five_letter_words.words[:30]
+
+    with TemporaryDirectory() as cache_directory:
+        table = load_feedback_pattern_table(words, cache_directory)
+        test(
+            "After loading the feedback pattern table, it should be cached on disk.",
+            True,
+            os.path.exists(get_feedback_pattern_table_path(words, cache_directory)),
+        )
+
+        # Loading the table again should read it from the disk cache, and result in the same patterns
+        test(
+            "Loading the cached feedback pattern table should result in the same patterns.",
+            bytes(table),
+            bytes(load_feedback_pattern_table(words, cache_directory)),
+        )
+
+        enable_feedback_pattern_table(words, cache_directory)
+        test(
+            "After enabling the feedback pattern table, it should be loaded.",
+            True,
+            is_feedback_pattern_table_loaded(),
+        )
+
+        # Test whether the guesses are scored the same when the table is enabled
+        wordle_letter_colors = get_available_letter_position_colors()
+        guess = words[1]
+        word_to_guess = words[0]
+        expected = decode_feedback_pattern(get_feedback_pattern(guess, word_to_guess), len(guess))
+        test(
+            f"When the feedback pattern table is enabled, the colors for the word '{word_to_guess}' and guess '{guess}' should be decoded from the table.",
+            expected,
+            get_guess_letters_color_based_on_word_to_guess(guess, word_to_guess),
+        )
+
+        # Words which are not within the table's words list are still scored letter by letter
+        expected = [wordle_letter_colors["correct"]] * 5
+        test(
+            "When the feedback pattern table is enabled, words which are not within the table should still be scored letter by letter.",
+            expected,
+            get_guess_letters_color_based_on_word_to_guess("12345", "12345"),
+        )
+
+        disable_feedback_pattern_table()
+        test(
+            "After disabling the feedback pattern table, it should not be loaded anymore.",
+            False,
+            is_feedback_pattern_table_loaded(),
+        )
+test_load_feedback_pattern_table()
+
+def test_wordle_round_counters() -> None:
+    """
+        Test whether the round counters which are updated while adding guesses match the values found by going through every round.
+    """
+
+    team_ID = get_starting_team_ID()
+
+    # First we initialize the teams data to ensure we have the rounds to work with
+    initialize_teams_data()
+
+    # Simulate the team winning 2 rounds, and then losing 2 rounds in a row by using all attempts
+    max_attempts = get_max_wordle_guess_attempts()
+    rounds_results = [True, True, False, False]
+    for has_won_round in rounds_results:
+        add_single_initial_rounds_info_for_team(team_ID)
+        word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+        if has_won_round:
+            add_guess_to_current_round_for_team(team_ID, word_to_guess, 0)
+            continue
+
+        incorrect_guess = word_to_guess[::-1]  # Just reverse the word to ensure it is incorrect, even if it isn't a valid word
+        for attempt_number in range(max_attempts):
+            add_guess_to_current_round_for_team(team_ID, incorrect_guess, attempt_number)
+
+    test(
+        "After the last round has finished, it should already be added to the round counters of the team.",
+        True,
+        is_current_wordle_round_counted_for_team(team_ID),
+    )
+
+    test(
+        "The rounds won counter should match the amount of rounds won found by going through every round.",
+        amount_of_wordle_rounds_won_by_team_with_full_scan(team_ID),
+        amount_of_wordle_rounds_won_by_team(team_ID),
+    )
+
+    test(
+        "The rounds lost in a row counter should match the amount of rounds lost in a row found by going through every round.",
+        amount_of_wordle_rounds_lost_in_a_row_by_team_with_full_scan(team_ID),
+        amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID),
+    )
+
+    # Winning another round should reset the rounds lost in a row counter
+    add_single_initial_rounds_info_for_team(team_ID)
+    add_guess_to_current_round_for_team(team_ID, get_current_wordle_round_word_to_guess_for_team(team_ID), 0)
+    test(
+        "After winning a round, the team should have lost 0 rounds in a row.",
+        0,
+        amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID),
+    )
+    test(
+        "After winning a third round, the team should have won 3 rounds.",
+        3,
+        amount_of_wordle_rounds_won_by_team(team_ID),
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_wordle_round_counters()
+
+def test_validate_wordle_round_counter() -> None:
+    """
+        Test whether validating a round counter raises an error when it doesn't match the value found by going through every round.
+    """
+
+    team_ID = get_starting_team_ID()
+
+    exception_has_occurred = False
+    try:
+        validate_wordle_round_counter(team_ID, "rounds won", 2, 3)
+    except RuntimeError:
+        exception_has_occurred = True
+    test(
+        "Validating a round counter which doesn't match the value found by going through every round should raise a RuntimeError.",
+        True,
+        exception_has_occurred,
+    )
+test_validate_wordle_round_counter()
+
+def test_get_feedback_patterns_for_guess() -> None:
+    """
+        Test whether scoring a guess against many words at once results in the same feedback patterns as scoring each word separately.
+    """
+
+    # The words hold duplicate letters, so the misplaced letters must only be counted as many times as they occur in the word to guess
+    words = ["level", "eerie", "geese", "lever", "sleep", "seven", "ledge", "peels"]
+    patterns_match = True
+    for guess in words:
+        feedback_patterns = get_feedback_patterns_for_guess(guess, words)
+        for word_to_guess, feedback_pattern in zip(words, feedback_patterns):
+            if feedback_pattern != get_feedback_pattern(guess, word_to_guess):
+                patterns_match = False
+    test(
+        "Scoring a guess against many words at once should result in the same feedback patterns as scoring each word separately.",
+        True,
+        patterns_match,
+    )
+test_get_feedback_patterns_for_guess()
+
+def test_wordle_solver() -> None:
+    """
+        Test whether the Wordle solver keeps the word to guess within its candidates, and suggests one of its candidates.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    add_single_initial_rounds_info_for_team(team_ID)
+    word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+
+    solver_state = create_solver_state_for_current_round_of_team(team_ID)
+    all_candidates_start_with_first_letter = True
+    for candidate in solver_state["candidates"]:
+        if candidate[0] != word_to_guess[0]:
+            all_candidates_start_with_first_letter = False
+    test(
+        f"Every candidate of the solver should start with the revealed first letter '{word_to_guess[0]}'.",
+        True,
+        all_candidates_start_with_first_letter,
+    )
+
+    suggested_guess = get_suggested_guess(solver_state)
+    test(
+        "The suggested guess of the solver should be one of its candidates.",
+        True,
+        suggested_guess in solver_state["candidates"],
+    )
+
+    add_guess_to_current_round_for_team(team_ID, suggested_guess, 0)
+    solver_state = create_solver_state_for_current_round_of_team(team_ID)
+    test(
+        f"After guessing '{suggested_guess}', the solver should only have applied that guess.",
+        [suggested_guess],
+        solver_state["guesses"],
+    )
+    test(
+        f"After guessing '{suggested_guess}', the word to guess should still be one of the candidates of the solver.",
+        True,
+        word_to_guess in solver_state["candidates"],
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_wordle_solver()
+
+def test_get_feedback_patterns_for_guesses_and_pairs() -> None:
+    """
+        Test whether scoring many guesses against many words at once results in the same feedback patterns as scoring each pair separately.
+    """
+
+    # The words hold duplicate letters, so the misplaced letters must only be counted as many times as they occur in the word to guess
+    words = ["level", "eerie", "geese", "lever", "sleep", "seven", "ledge", "peels"]
+    guesses = ["eerie", "sleep", "peels"]
+
+    feedback_patterns = get_feedback_patterns_for_guesses(guesses, words)
+    patterns_match = True
+    for guess_index, guess in enumerate(guesses):
+        for word_index, word_to_guess in enumerate(words):
+            if feedback_patterns[guess_index][word_index] != get_feedback_pattern(guess, word_to_guess):
+                patterns_match = False
+    test(
+        "Scoring every guess against every word at once should result in the same feedback patterns as scoring each pair separately.",
+        True,
+        patterns_match,
+    )
+
+    paired_words = ["geese", "level", "sleep"]
+    test(
+        "Scoring each guess against the word on the same index should result in the same feedback patterns as scoring each pair separately.",
+        [get_feedback_pattern(guess, word_to_guess) for guess, word_to_guess in zip(guesses, paired_words)],
+        [int(feedback_pattern) for feedback_pattern in get_feedback_patterns_for_pairs(guesses, paired_words)],
+    )
+
+    try:
+        get_feedback_patterns_for_pairs(guesses, words)
+        raised_error = False
+    except ValueError:
+        raised_error = True
+    test(
+        "Scoring guesses against a different amount of words pair by pair should raise a ValueError.",
+        True,
+        raised_error,
+    )
+test_get_feedback_patterns_for_guesses_and_pairs()
+
+def test_get_stringified_current_wordle_round_board_for_team() -> None:
+    """
+        Test whether the stringified Wordle board only reuses the rendered rows which haven't changed.
+    """
+
+    # First we initialize the teams data to ensure there is data to check
+    initialize_teams_data()
+
+    team_ID = get_starting_team_ID()
+    add_single_initial_rounds_info_for_team(team_ID)
+    word_to_guess = get_current_wordle_round_word_to_guess_for_team(team_ID)
+    get_stringified_current_wordle_round_board_for_team(team_ID)
+
+    # Guess a word which is not the word to guess, so the first row and the row of the next attempt change
+    guess = choice([word for word in five_letter_words.words if word != word_to_guess])
+    add_guess_to_current_round_for_team(team_ID, guess, 0)
+    stringified_board = get_stringified_current_wordle_round_board_for_team(team_ID)
+
+    # Render the board again without any cached rows, which should result in the exact same board
+    get_wordle_board_render_cache_for_team(team_ID)["rowKeys"].clear()
+    get_wordle_board_render_cache_for_team(team_ID)["rows"].clear()
+    test(
+        f"After guessing '{guess}', the stringified board with reused rows should be the same as the board rendered from scratch.",
+        get_stringified_current_wordle_round_board_for_team(team_ID),
+        stringified_board,
+    )
+
+    test(
+        f"After guessing '{guess}', the stringified board should hold the colored letters of the guess.",
+        True,
+        "".join(get_rendered_wordle_cell(letter, color) for letter, color in zip(guess, get_current_wordle_round_guesses_color_for_team(team_ID)[0])) in stringified_board,
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_get_stringified_current_wordle_round_board_for_team()
@@ -1,9 +1,18 @@
-from termcolor import colored
+from types import MappingProxyType
 from lingo.wordle.words.words_utils import get_random_word
-from ..teams_data import teams_data
-from .words import five_letter_words
+from ..game_context import get_teams_data, get_active_game_context
+from .words.words_index import is_known_word
+from .wordle_feedback import get_feedback_pattern_from_table, decode_feedback_pattern
 from ..lingo_constants import GAP_BETWEEN_BOARD_COLUMNS
-from .wordle_settings.wordle_settings_utils import get_max_wordle_guess_attempts, get_empty_column_placeholder_for_wordle_board, get_available_letter_position_colors, get_wordle_lose_conditions, get_wordle_win_conditions
+from ..lingo_output import get_colored_text
+from ..settings_snapshot import get_wordle_settings_snapshot
+from ..lingo_profiling import profiled
+from ..lingo_metrics import increase_counter
+
+# The rendered cells of the Wordle board, keyed by their letter and color.
+# Coloring a letter is the same for every board, so each cell only has to be colored once
+_rendered_wordle_cells = {}
+
 
 ###
 ### GETTERS
@@ -15,7 +24,7 @@ def get_current_wordle_round_for_team(team_ID: int) -> dict:
         Return the current Wordle round information for the specified team.
     """
 
-    teamData = teams_data[team_ID]
+    teamData = get_teams_data()[team_ID]
     wordle_rounds = teamData["roundsInfo"]
     
     if len(wordle_rounds) == 0:
@@ -57,30 +66,115 @@ def has_team_guessed_word_correctly_in_current_wordle_round(team_ID: int) -> boo
     has_guessed_correctly = (last_guess == word_to_guess)
     return has_guessed_correctly
 
-def amount_of_wordle_rounds_won_by_team(team_ID: int) -> int:
+def is_wordle_round_won(round_info: dict) -> bool:
+    """
+        Return whether the last guess of the provided Wordle round is the word to guess.
+    """
+
+    word_to_guess = round_info["wordToGuess"]
+    last_guess = ''.join(round_info["guesses"][-1])
+
+    is_won = (last_guess == word_to_guess)
+    return is_won
+
+def is_current_wordle_round_counted_for_team(team_ID: int) -> bool:
+    """
+        Return whether the result of the current Wordle round has already been added to the round counters of the specified team.
+    """
+
+    teamData = get_teams_data()[team_ID]
+    is_counted = teamData["countedRoundsAmount"] == len(teamData["roundsInfo"])
+    return is_counted
+
+def has_current_wordle_round_finished_for_team(team_ID: int) -> bool:
+    """
+        Return whether the current Wordle round of the specified team has finished,
+        which is the case when the word has been guessed correctly or all attempts have been used.
+    """
+
+    current_wordle_round_guesses = get_current_wordle_round_guesses_by_team(team_ID)
+    if len(current_wordle_round_guesses) >= get_wordle_settings_snapshot()["maxGuessAttempts"]:
+        return True
+
+    has_finished = has_team_guessed_word_correctly_in_current_wordle_round(team_ID)
+    return has_finished
+
+def amount_of_wordle_rounds_won_by_team(team_ID: int, wordle_settings_snapshot: MappingProxyType | None = None) -> int:
     """
         Return the amount of rounds won within the Wordle game by the specific team.
+        When no Wordle settings snapshot is provided, the snapshot of the active game context is used.
+        !Do note that this reads the round counters of the team, instead of going through every round.
+    """
+
+    if wordle_settings_snapshot is None:
+        wordle_settings_snapshot = get_wordle_settings_snapshot()
+
+    count_finished_wordle_rounds_for_team(team_ID)
+
+    teamData = get_teams_data()[team_ID]
+    rounds_won = teamData["roundsWon"]
+
+    # If the current round hasn't been counted yet, we still count it as won when the last guess is the word to guess
+    if len(teamData["roundsInfo"]) > 0 and not is_current_wordle_round_counted_for_team(team_ID):
+        if has_team_guessed_word_correctly_in_current_wordle_round(team_ID):
+            rounds_won += 1
+
+    if wordle_settings_snapshot["validateRoundCounters"]:
+        validate_wordle_round_counter(team_ID, "rounds won", rounds_won, amount_of_wordle_rounds_won_by_team_with_full_scan(team_ID))
+
+    return rounds_won
+
+def amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID: int, wordle_settings_snapshot: MappingProxyType | None = None) -> int:
+    """
+        Return the amount of rounds lost in a row within the Wordle game by the specific team.
+        When no Wordle settings snapshot is provided, the snapshot of the active game context is used.
+        !Do note that this reads the round counters of the team, instead of going through every round.
     """
 
-    teamData = teams_data[team_ID]
+    if wordle_settings_snapshot is None:
+        wordle_settings_snapshot = get_wordle_settings_snapshot()
+
+    count_finished_wordle_rounds_for_team(team_ID)
+
+    teamData = get_teams_data()[team_ID]
+    rounds_lost_in_a_row = teamData["currentLossStreak"]
+
+    # If the current round has finished but hasn't been counted yet, we still include its result
+    if len(teamData["roundsInfo"]) > 0 and not is_current_wordle_round_counted_for_team(team_ID):
+        if has_current_wordle_round_finished_for_team(team_ID):
+            if has_team_guessed_word_correctly_in_current_wordle_round(team_ID):
+                rounds_lost_in_a_row = 0
+            else:
+                rounds_lost_in_a_row += 1
+
+    if wordle_settings_snapshot["validateRoundCounters"]:
+        validate_wordle_round_counter(team_ID, "rounds lost in a row", rounds_lost_in_a_row, amount_of_wordle_rounds_lost_in_a_row_by_team_with_full_scan(team_ID))
+
+    return rounds_lost_in_a_row
+
+def amount_of_wordle_rounds_won_by_team_with_full_scan(team_ID: int) -> int:
+    """
+        Return the amount of rounds won within the Wordle game by the specific team, by going through every round.
+        !Do note that this is only used to validate the round counters of the team.
+    """
+
+    teamData = get_teams_data()[team_ID]
     roundsInfo = teamData["roundsInfo"]
     
     rounds_won = 0
     for round_info in roundsInfo:
-        word_to_guess = round_info["wordToGuess"]
-        last_guess = ''.join(round_info["guesses"][-1])
-
-        if last_guess == word_to_guess:
+        if is_wordle_round_won(round_info):
             rounds_won += 1
     
     return rounds_won
 
-def amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID: int) -> int:
+def amount_of_wordle_rounds_lost_in_a_row_by_team_with_full_scan(team_ID: int) -> int:
     """
-        Return the amount of rounds lost in a row within the Wordle game by the specific team.
+        Return the amount of rounds lost in a row within the Wordle game by the specific team, by going through every round.
+        !Do note that this is only used to validate the round counters of the team.
     """
 
-    teamData = teams_data[team_ID]
+    teamData = get_teams_data()[team_ID]
     roundsInfo = teamData["roundsInfo"]
     rounds_played_amount = len(roundsInfo)
     rounds_lost_in_a_row = 0
@@ -90,17 +184,11 @@ def amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID: int) -> int:
         return rounds_lost_in_a_row
     
     # If the current round hasn't been finished yet, we decrease the rounds played amount by 1
-    current_wordle_round_guesses = get_current_wordle_round_guesses_by_team(team_ID)
-    if len(current_wordle_round_guesses) < get_max_wordle_guess_attempts() and not has_team_guessed_word_correctly_in_current_wordle_round(team_ID):
+    if not has_current_wordle_round_finished_for_team(team_ID):
         rounds_played_amount -= 1
 
     for round_index in range(rounds_played_amount - 1, -1, -1):
-        round_info = roundsInfo[round_index]
-        word_to_guess = round_info["wordToGuess"]
-
-        last_guess = ''.join(round_info["guesses"][-1])
-
-        if last_guess == word_to_guess:
+        if is_wordle_round_won(roundsInfo[round_index]):
             break
 
         rounds_lost_in_a_row += 1
@@ -135,17 +223,23 @@ def get_letter_color_for_current_round_last_guessed_word_by_team(team_ID: int, p
     current_wordle_round_guesses_color = get_current_wordle_round_guesses_color_for_team(team_ID)
 
     if row >= len(current_wordle_round_guesses_color) or col >= len(current_wordle_round_guesses_color[row]):
-        wordle_letter_colors = get_available_letter_position_colors()
-        default_color = wordle_letter_colors['default']
+        default_color = get_wordle_settings_snapshot()["defaultColor"]
         return default_color
     return current_wordle_round_guesses_color[row][col]
 
+@profiled()
 def get_guess_letters_color_based_on_word_to_guess(guess: str, word_to_guess: str) -> list:
     """
         Return a list of colors for each letter in the guess based on its correctness compared to the word to guess.
+        !Do note that when a feedback pattern table has been loaded which holds both words, the colors are decoded from that table instead.
     """
+
+    feedback_pattern = get_feedback_pattern_from_table(guess, word_to_guess)
+    if feedback_pattern is not None:
+        guess_colors = decode_feedback_pattern(feedback_pattern, len(guess))
+        return guess_colors
     
-    wordle_guess_colors = get_available_letter_position_colors()
+    incorrect_color, misplaced_color, correct_color = get_wordle_settings_snapshot()["feedbackColors"]
     
     # Create a list with None values to hold the colors for each letter in the guess
     guess_colors = [None] * len(guess)
@@ -158,7 +252,7 @@ def get_guess_letters_color_based_on_word_to_guess(guess: str, word_to_guess: st
     # If a letter is on the correct position, we set its color to the correct position color and remove the letter from the word_to_guess_letters list
     for index, letter in enumerate(guess):
         if letter == word_to_guess_letters[index]:
-            guess_colors[index] = wordle_guess_colors["correct"]
+            guess_colors[index] = correct_color
             word_to_guess_letters[index] = ""
     
     # After we found all correct positioned letters, we check for misplaced and incorrect letters
@@ -172,13 +266,13 @@ def get_guess_letters_color_based_on_word_to_guess(guess: str, word_to_guess: st
         
         # If the letter is still in the list of letters in the word to guess, it means it is misplaced
         if letter in word_to_guess_letters:
-            guess_colors[index] = wordle_guess_colors["misplaced"]
+            guess_colors[index] = misplaced_color
             letter_index = word_to_guess_letters.index(letter)
             word_to_guess_letters[letter_index] = ""
             continue
         
         # If the letter is not in the word to guess, we set its color to the incorrect color
-        guess_colors[index] = wordle_guess_colors["incorrect"]
+        guess_colors[index] = incorrect_color
     
     return guess_colors
 
@@ -195,7 +289,8 @@ def get_current_wordle_round_board_for_team(team_ID: int) -> list:
     wordle_board = []
     wordle_round_guesses = get_current_wordle_round_guesses_by_team(team_ID)
     guesses_amount = len(wordle_round_guesses)
-    letter_placeholder = get_empty_column_placeholder_for_wordle_board()
+    wordle_settings_snapshot = get_wordle_settings_snapshot()
+    letter_placeholder = wordle_settings_snapshot["letterPlaceholder"]
 
     # Add each guess made so far to the board
     if guesses_amount:
@@ -210,62 +305,131 @@ def get_current_wordle_round_board_for_team(team_ID: int) -> list:
             wordle_board.append(list(guess))
 
     # If the amount of guesses made is less than the maximum attempts, we fill the remaining rows with placeholders.
-    missing_guesses_amount = get_max_wordle_guess_attempts() - guesses_amount
+    # The placeholder rows are taken from the settings snapshot, and only built here for words of an unknown length
+    missing_guesses_amount = wordle_settings_snapshot["maxGuessAttempts"] - guesses_amount
+    placeholder_row = wordle_settings_snapshot["placeholderRows"].get(word_to_guess_length)
+    if placeholder_row is None:
+        placeholder_row = (letter_placeholder,) * word_to_guess_length
     for _ in range(missing_guesses_amount):
-        placeholder_guess = []
-        for _ in range(word_to_guess_length):
-            placeholder_guess.append(letter_placeholder)
-        wordle_board.append(placeholder_guess)
+        wordle_board.append(list(placeholder_row))
 
     return wordle_board
 
+def get_rendered_wordle_cell(letter: str, letter_color: str) -> str:
+    """
+        Return a single cell of the Wordle board, which is the colored letter with the gap between the columns on both sides.
+        Each cell is only colored once per letter and color, after which the rendered cell is reused.
+    """
+
+    cell_key = (letter, letter_color)
+    rendered_cell = _rendered_wordle_cells.get(cell_key)
+    if rendered_cell is None:
+        column_gap = " " * GAP_BETWEEN_BOARD_COLUMNS
+        rendered_cell = f"{column_gap}{get_colored_text(letter, letter_color)}{column_gap}"
+        _rendered_wordle_cells[cell_key] = rendered_cell
+
+    return rendered_cell
+
+def get_wordle_board_render_cache_for_team(team_ID: int) -> dict:
+    """
+        Return the rows of the Wordle board which were rendered for the specified team the last time their board was stringified.
+        Each row is stored with the letters and colors it was rendered from, so rows which haven't changed since the previous attempt are reused.
+        !Do note that the render cache is kept within the active game context, so every game has its own render cache
+    """
+
+    wordle_board_render_caches = get_active_game_context().setdefault("wordleBoardRenders", {})
+    if team_ID not in wordle_board_render_caches:
+        wordle_board_render_caches[team_ID] = {
+            "rowKeys": [],
+            "rows": []
+        }
+
+    wordle_board_render_cache = wordle_board_render_caches[team_ID]
+    return wordle_board_render_cache
+
+@profiled()
 def get_stringified_current_wordle_round_board_for_team(team_ID: int) -> str:
     """
         Return a stringified version of the Wordle board for display purposes.
+        !Do note that only the rows which have changed since the board was stringified the last time are rendered again.
     """
 
     board_width = get_current_wordle_round_board_width_for_team(team_ID)
 
     # Add the title to show above the board
     title = "WORDLE BOARD"
-    stringified_board = f"\n{title.center(board_width)}\n\n"
+    stringified_board_parts = [f"\n{title.center(board_width)}\n\n"]
 
-    # Stringify each letter in the board with its corresponding color
     wordle_board = get_current_wordle_round_board_for_team(team_ID)
+    guesses_color = get_current_wordle_round_guesses_color_for_team(team_ID)
+    default_color = get_wordle_settings_snapshot()["defaultColor"]
+    wordle_board_render_cache = get_wordle_board_render_cache_for_team(team_ID)
+    row_keys = wordle_board_render_cache["rowKeys"]
+    rendered_rows = wordle_board_render_cache["rows"]
+
+    # Stringify each letter in the board with its corresponding color.
+    # Letters without a color (e.g. the placeholders of the empty rows) use the default color
     for row_index, row in enumerate(wordle_board):
-        for col_index, letter in enumerate(row):
-            letter_position_within_guess = (row_index, col_index)
-            letter_color = get_letter_color_for_current_round_last_guessed_word_by_team(team_ID, letter_position_within_guess)
-            stringified_board += f"{" " * GAP_BETWEEN_BOARD_COLUMNS}{colored(letter, letter_color)}{" " * GAP_BETWEEN_BOARD_COLUMNS}"
+        row_colors = guesses_color[row_index] if row_index < len(guesses_color) else []
+        row_key = (tuple(row), tuple(row_colors))
 
-        stringified_board += "\n\n"
-    
+        if row_index < len(row_keys) and row_keys[row_index] == row_key:
+            stringified_board_parts.append(rendered_rows[row_index])
+            continue
+
+        rendered_cells = []
+        for col_index, letter in enumerate(row):
+            letter_color = row_colors[col_index] if col_index < len(row_colors) else default_color
+            rendered_cells.append(get_rendered_wordle_cell(letter, letter_color))
+        rendered_row = "".join(rendered_cells) + "\n\n"
+
+        if row_index < len(row_keys):
+            row_keys[row_index] = row_key
+            rendered_rows[row_index] = rendered_row
+        else:
+            row_keys.append(row_key)
+            rendered_rows.append(rendered_row)
+        stringified_board_parts.append(rendered_row)
+
+    # Forget the rows which are not part of the board anymore (e.g. when the maximum amount of attempts has been lowered)
+    del row_keys[len(wordle_board):]
+    del rendered_rows[len(wordle_board):]
+
+    stringified_board = "".join(stringified_board_parts)
     return stringified_board
 
-def has_team_lost_wordle_game(team_ID: int) -> bool:
+def has_team_lost_wordle_game(team_ID: int, wordle_settings_snapshot: MappingProxyType | None = None) -> bool:
     """
         Returns whether the specified team has lost the Wordle game.
+        When no Wordle settings snapshot is provided, the snapshot of the active game context is used.
     """
     
-    wordle_lose_conditions = get_wordle_lose_conditions()
+    if wordle_settings_snapshot is None:
+        wordle_settings_snapshot = get_wordle_settings_snapshot()
+
+    rounds_lost_in_a_row_to_lose = wordle_settings_snapshot["roundsLostInARowToLose"]
 
-    rounds_lost_in_a_row = amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID)
+    rounds_lost_in_a_row = amount_of_wordle_rounds_lost_in_a_row_by_team(team_ID, wordle_settings_snapshot)
 
-    if rounds_lost_in_a_row >= wordle_lose_conditions["rounds_lost_in_a_row"]:
+    if rounds_lost_in_a_row >= rounds_lost_in_a_row_to_lose:
         return True
     
     return False
 
-def has_team_won_wordle_game(team_ID: int) -> bool:
+def has_team_won_wordle_game(team_ID: int, wordle_settings_snapshot: MappingProxyType | None = None) -> bool:
     """
         Returns whether the specified team has won the Wordle game.
+        When no Wordle settings snapshot is provided, the snapshot of the active game context is used.
     """
     
-    wordle_win_conditions = get_wordle_win_conditions()
+    if wordle_settings_snapshot is None:
+        wordle_settings_snapshot = get_wordle_settings_snapshot()
+
+    rounds_won_to_win = wordle_settings_snapshot["roundsWonToWin"]
 
     # If the team has won 10 or more rounds, they win the game
-    rounds_won = amount_of_wordle_rounds_won_by_team(team_ID)
-    if rounds_won >= wordle_win_conditions["rounds_won"]:
+    rounds_won = amount_of_wordle_rounds_won_by_team(team_ID, wordle_settings_snapshot)
+    if rounds_won >= rounds_won_to_win:
         return True
     
     return False
@@ -275,11 +439,13 @@ def has_team_won_or_lost_wordle_game(team_ID: int) -> bool:
         Return whether the specified team has won or lost the Wordle game.
     """
     
-    team_has_lost = has_team_lost_wordle_game(team_ID)
+    # This is checked after every guess, so the settings snapshot is only read once and passed on
+    wordle_settings_snapshot = get_wordle_settings_snapshot()
+    team_has_lost = has_team_lost_wordle_game(team_ID, wordle_settings_snapshot)
     if team_has_lost:
         return True
 
-    team_has_won = has_team_won_wordle_game(team_ID)
+    team_has_won = has_team_won_wordle_game(team_ID, wordle_settings_snapshot)
     if team_has_won:
         return True
 
@@ -293,15 +459,15 @@ def has_team_won_or_lost_wordle_game(team_ID: int) -> bool:
 
 def add_single_initial_rounds_info_for_team(team_ID: int) -> None:
     """
-        Add the initial round info for the specified team within the global teams_data structure.
+        Add the initial round info for the specified team within the teams data of the active game context.
         !Do note that we will always add the first letter of the word to guess, and its corresponding color (correct position color) as the initial guess.
         !This is done to give the player a starting point for their guesses.
     """
 
-    wordle_guess_colors = get_available_letter_position_colors() 
+    correct_position_color = get_wordle_settings_snapshot()["correctColor"]
     word_to_guess = get_random_word()
 
-    teamData = teams_data[team_ID]
+    teamData = get_teams_data()[team_ID]
     initial_rounds_info = {
         "wordToGuess": word_to_guess,
         "guesses": [
@@ -311,7 +477,7 @@ def add_single_initial_rounds_info_for_team(team_ID: int) -> None:
         ],
         "guessesColor": [
             [
-                wordle_guess_colors["correct"]
+                correct_position_color
             ]
         ]
     }
@@ -323,6 +489,8 @@ def add_guess_to_current_round_for_team(team_ID: int, guess: str, attempt_number
         !Do note that this function also adds the guessesColor based on the correctness of the guess.
     """
 
+    increase_counter("lingo_wordle_guesses_total")
+
     current_wordle_round = get_current_wordle_round_for_team(team_ID)
     current_wordle_round_guesses = current_wordle_round["guesses"]
 
@@ -345,12 +513,17 @@ def add_guess_to_current_round_for_team(team_ID: int, guess: str, attempt_number
     else:
         current_wordle_round["guessesColor"][attempt_number] = guess_colors
 
-    # If the word is guessed correctly, we do not need to add the letters and colors to the next attempt row
+    # If the word is guessed correctly, the round has finished.
+    # We add the result to the round counters, and do not need to add the letters and colors to the next attempt row
     if guess == word_to_guess:
+        count_current_wordle_round_for_team(team_ID)
         return
     
-    # If this was the last attempt, we do not need to add the letters and colors to the next attempt row
-    if attempt_number == get_max_wordle_guess_attempts() - 1:
+    # If this was the last attempt, the round has finished.
+    # We add the result to the round counters, and do not need to add the letters and colors to the next attempt row
+    wordle_settings_snapshot = get_wordle_settings_snapshot()
+    if attempt_number == wordle_settings_snapshot["maxGuessAttempts"] - 1:
+        count_current_wordle_round_for_team(team_ID)
         return
     
     # Go through each letter in the guess and add the letter within the `next_attempt_row_guess` list if it's correct, else we add the placeholder letter
@@ -358,10 +531,9 @@ def add_guess_to_current_round_for_team(team_ID: int, guess: str, attempt_number
     next_attempt_row_guess = []
     next_attempt_row_colors = []
 
-    wordle_guess_colors = get_available_letter_position_colors()
-    correct_position_color = wordle_guess_colors["correct"]
-    default_letter_color = wordle_guess_colors["default"]
-    letter_placeholder = get_empty_column_placeholder_for_wordle_board()
+    correct_position_color = wordle_settings_snapshot["correctColor"]
+    default_letter_color = wordle_settings_snapshot["defaultColor"]
+    letter_placeholder = wordle_settings_snapshot["letterPlaceholder"]
     
     one_or_more_correct_letters_found = False
     for i, guess_color in enumerate(guess_colors):
@@ -382,6 +554,47 @@ def add_guess_to_current_round_for_team(team_ID: int, guess: str, attempt_number
         current_wordle_round["guessesColor"].append(next_attempt_row_colors)
 
 
+def add_wordle_round_result_to_counters_for_team(team_ID: int, round_info: dict) -> None:
+    """
+        Add the result of the provided finished Wordle round to the round counters of the specified team.
+    """
+
+    teamData = get_teams_data()[team_ID]
+    if is_wordle_round_won(round_info):
+        teamData["roundsWon"] += 1
+        teamData["currentLossStreak"] = 0
+    else:
+        teamData["currentLossStreak"] += 1
+
+    teamData["countedRoundsAmount"] += 1
+
+def count_finished_wordle_rounds_for_team(team_ID: int) -> None:
+    """
+        Add the results of the Wordle rounds before the current round which haven't been counted yet to the round counters of the specified team.
+        !Do note that every round before the current round has finished, so their results can not change anymore.
+    """
+
+    teamData = get_teams_data()[team_ID]
+    roundsInfo = teamData["roundsInfo"]
+
+    for round_index in range(teamData["countedRoundsAmount"], len(roundsInfo) - 1):
+        add_wordle_round_result_to_counters_for_team(team_ID, roundsInfo[round_index])
+
+def count_current_wordle_round_for_team(team_ID: int) -> None:
+    """
+        Add the result of the finished current Wordle round to the round counters of the specified team.
+        If the current round has already been counted, we do nothing.
+    """
+
+    count_finished_wordle_rounds_for_team(team_ID)
+
+    if is_current_wordle_round_counted_for_team(team_ID):
+        return
+
+    current_wordle_round = get_current_wordle_round_for_team(team_ID)
+    add_wordle_round_result_to_counters_for_team(team_ID, current_wordle_round)
+
+
 ###
 ### VALIDATORS
 ###
@@ -394,12 +607,14 @@ def is_valid_wordle_guess(guess: str, team_ID: int) -> dict:
     word_to_guess_length = len(get_current_wordle_round_word_to_guess_for_team(team_ID))
 
     if len(guess) != word_to_guess_length:
+        increase_counter("lingo_wordle_invalid_guesses_total", ("wrong_length",))
         return {
             "isValid": False,
             "message": f"The guess must be exactly {word_to_guess_length} letters long."
         }
     
-    if guess not in five_letter_words.words:
+    if not is_known_word(guess):
+        increase_counter("lingo_wordle_invalid_guesses_total", ("unknown_word",))
         return {
             "isValid": False,
             "message": "The guess is not a valid Wordle word."
@@ -408,4 +623,13 @@ def is_valid_wordle_guess(guess: str, team_ID: int) -> dict:
     return {
         "isValid": True,
         "message": ""
-    }
\ No newline at end of file
+    }
+
+def validate_wordle_round_counter(team_ID: int, counter_name: str, counter_value: int, full_scan_value: int) -> None:
+    """
+        Validate that the round counter of the specified team matches the value found by going through every round.
+        If they don't match, we raise a RuntimeError.
+    """
+
+    if counter_value != full_scan_value:
+        raise RuntimeError(f"The Wordle {counter_name} counter of team {team_ID + 1} is {counter_value}, but going through every round results in {full_scan_value}.")
\ No newline at end of file
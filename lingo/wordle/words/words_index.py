@@ -0,0 +1,59 @@
+from .words_utils import get_words_of_length
+
+# A dictionary which holds the hashed index of each words list, keyed by the length of the words within the list.
+# Each entry holds the words list the index was built from, and the frozenset index itself.
+#! Do note that we keep a reference to the words list, so we can detect when the words list of a length has been replaced and the index must be rebuilt
+_words_index = {}
+
+
+###
+### GETTERS
+###
+
+
+def get_words_index_of_length(length: int) -> frozenset:
+    """
+        Returns the hashed index of the words list of the specified length.
+        The index is only built once per words list, and is rebuilt when the words list of the specified length has changed.
+    """
+
+    words_of_length = get_words_of_length(length)
+
+    cached_words_index = _words_index.get(length)
+    if cached_words_index is not None and cached_words_index["words"] is words_of_length and cached_words_index["size"] == len(words_of_length):
+        return cached_words_index["index"]
+
+    words_index_of_length = frozenset(words_of_length)
+    _words_index[length] = {
+        "words": words_of_length,
+        "size": len(words_of_length),
+        "index": words_index_of_length
+    }
+    return words_index_of_length
+
+
+###
+### SETTERS
+###
+
+
+def reset_words_index() -> None:
+    """
+        Removes all built word indexes, so they are rebuilt on their next use.
+    """
+
+    _words_index.clear()
+
+
+###
+### VALIDATORS
+###
+
+
+def is_known_word(word: str) -> bool:
+    """
+        Returns whether the provided word is within the words list of its length.
+    """
+
+    words_index_of_length = get_words_index_of_length(len(word))
+    return word in words_index_of_length
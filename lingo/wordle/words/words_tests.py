@@ -1,7 +1,9 @@
 from test_lib import test
 from .words_utils import *
+from .words_index import get_words_index_of_length, is_known_word, reset_words_index
 from ...lingo_utils import initialize_teams_data, remove_teams_data
 from ...teams_data import teams_data
+from ...lingo_exceptions import GameExhaustedError
 
 def test_get_random_word() -> None:
     """
@@ -130,4 +132,160 @@ def test_get_words_of_length() -> None:
         True,
         words_are_of_length,
     )
-test_get_words_of_length()
\ No newline at end of file
+test_get_words_of_length()
+
+def test_get_words_index_of_length() -> None:
+    """
+        Test whether the hashed index of a words list contains the same words as the words list, and is only built once.
+    """
+
+    length = 5
+    reset_words_index()
+    words_index_of_length = get_words_index_of_length(length)
+    test(
+        f"The words index of length {length} should contain exactly the words of the words list of length {length}.",
+        frozenset(get_words_of_length(length)),
+        words_index_of_length,
+    )
+
+    test(
+        f"Getting the words index of length {length} a second time should return the already built index.",
+        True,
+        get_words_index_of_length(length) is words_index_of_length,
+    )
+test_get_words_index_of_length()
+
+def test_is_known_word() -> None:
+    """
+        Test whether the function which checks if a word is within the words lists works correctly.
+    """
+
+    length = 5
+    known_word = get_words_of_length(length)[0]
+    test(
+        f"The word '{known_word}' should be a known word, since it is within the words list of length {length}.",
+        True,
+        is_known_word(known_word),
+    )
+
+    unknown_words = ["zzzzz", "", "appelflap"]
+    for unknown_word in unknown_words:
+        test(
+            f"The word '{unknown_word}' should not be a known word.",
+            False,
+            is_known_word(unknown_word),
+        )
+test_is_known_word()
+
+def test_draw_unused_word_of_length() -> None:
+    """
+        Test whether the function which draws an unused word hands out every word exactly once, and raises an error when all words have been used.
+    """
+
+    # Initialize the teams data, which also resets the word decks of the previous game
+    initialize_teams_data()
+
+    length = 5
+    words_of_length = get_words_of_length(length)
+    drawn_words = []
+    for _ in range(len(words_of_length)):
+        drawn_words.append(draw_unused_word_of_length(length))
+
+    test(
+        f"Drawing {len(words_of_length)} words of length {length} should hand out every word of length {length} exactly once.",
+        sorted(words_of_length),
+        sorted(drawn_words),
+    )
+
+    test(
+        f"After drawing every word of length {length}, there should be no remaining words of length {length}.",
+        0,
+        get_remaining_words_amount_of_length(length),
+    )
+
+    exception_has_occurred = False
+    try:
+        get_random_word()
+    except GameExhaustedError:
+        exception_has_occurred = True
+    test(
+        "Getting a random word after all words have been used should raise a GameExhaustedError.",
+        True,
+        exception_has_occurred,
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+
+    test(
+        f"After removing the teams data, every word of length {length} should be available again.",
+        len(words_of_length),
+        get_remaining_words_amount_of_length(length),
+    )
+    remove_teams_data()
+test_draw_unused_word_of_length()
+
+def test_get_word_deck_of_length() -> None:
+    """
+        Test whether the word deck does not contain the words which have already been used within the current game.
+    """
+
+    initialize_teams_data()
+
+    length = 5
+    used_word = get_words_of_length(length)[0]
+    team_ID = 0
+    teams_data[team_ID]["roundsInfo"].append({
+        "wordToGuess": used_word,
+    })
+
+    word_deck = get_word_deck_of_length(length)
+    test(
+        f"The word deck of length {length} should not contain the word '{used_word}', since it has already been used.",
+        False,
+        used_word in word_deck["words"],
+    )
+
+    # Remove the teams data after the test to reset the state for other tests
+    remove_teams_data()
+test_get_word_deck_of_length()
+
+def test_set_words_of_length() -> None:
+    """
+        Test whether replacing the words list of a length is used by the words index and the bots, and can be undone.
+    """
+
+    # Imported here, since the bots are not part of the words utilities
+    from ...lingo_bots import get_words_of_length_starting_with
+
+    length = 5
+    original_words = get_words_of_length(length)
+    new_words = ["abcde", "abcdf", "zyxwv"]
+    set_words_of_length(length, new_words)
+    try:
+        test(
+            f"After replacing the words list of length {length}, the new words list should be returned.",
+            new_words,
+            get_words_of_length(length),
+        )
+
+        test(
+            f"After replacing the words list of length {length}, the words of the new words list should be known words.",
+            True,
+            is_known_word("zyxwv"),
+        )
+
+        test(
+            f"After replacing the words list of length {length}, the bots should only see the words of the new words list.",
+            ["abcde", "abcdf"],
+            get_words_of_length_starting_with(length, "a"),
+        )
+    finally:
+        set_words_of_length(length, original_words)
+
+    test(
+        f"After restoring the words list of length {length}, the words of the replaced words list should not be known words anymore.",
+        False,
+        is_known_word("zyxwv"),
+    )
+test_set_words_of_length()
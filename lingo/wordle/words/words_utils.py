@@ -1,14 +1,34 @@
-from random import choice
-from ...teams_data import teams_data
+from random import choice, randrange
+from ...game_context import get_teams_data, get_active_game_context
 from ...lingo_settings.lingo_settings_utils import get_amount_of_teams
-from .five_letter_words import words as five_letter_words
+from ...lingo_profiling import profiled
+from ...lingo_exceptions import GameExhaustedError
 
-# A dictionary which holds all the words lists.
-#! Do note that the values must be a list, and not a set, as we need to be able to use choice() to get a random word within the list
-_words = {
-    5: five_letter_words,
+def load_five_letter_words() -> list[str]:
+    """
+        Returns the list of five letter words.
+    """
+
+    from .five_letter_words import words as five_letter_words
+    return five_letter_words
+
+# A dictionary which holds the function that loads the words list of each length.
+# Each words list is only imported the first time it is used, so importing the game doesn't have to load every words list
+_words_loaders = {
+    5: load_five_letter_words,
 }
-_words_lengths = list(_words.keys())
+_words_lengths = list(_words_loaders.keys())
+
+# A dictionary which holds all the words lists which have been imported so far.
+#! Do note that the values must be a list, and not a set, as we need to be able to use choice() to get a random word within the list
+_words = {}
+
+def get_words_lengths() -> list[int]:
+    """
+        Returns a list of all word lengths which have a words list.
+    """
+
+    return _words_lengths
 
 def get_words_of_length(length: int) -> list[str]:
     """
@@ -20,6 +40,10 @@ def get_words_of_length(length: int) -> list[str]:
         return []
     
     # If there are words of the specified length, return them.
+    # The words list is imported the first time it is used
+    if length not in _words:
+        _words[length] = _words_loaders[length]()
+
     words_of_length = _words[length]
     return words_of_length
 
@@ -32,19 +56,90 @@ def get_random_word_of_length(length: int) -> str:
     random_word = choice(words_of_length)
     return random_word
 
+def get_word_decks() -> dict:
+    """
+        Returns a dictionary which holds the word deck of each word length for the game of the active game context.
+        Each deck holds a copy of the words list, where the words before the `remainingAmount` index have not been used yet.
+        When a word is drawn, it is swapped with the last unused word, so drawing an unused word never has to search through the used words.
+        !Do note that the decks are built on their first draw, and must be reset at the start of each game
+    """
+
+    word_decks = get_active_game_context()["wordDecks"]
+    return word_decks
+
+def get_word_deck_of_length(length: int) -> dict:
+    """
+        Returns the word deck of the specified length for the current game.
+        If the deck hasn't been built yet, we build it without the words which have already been used within the current game.
+    """
+
+    word_decks = get_word_decks()
+    if length in word_decks:
+        return word_decks[length]
+
+    words_used_of_length = get_used_wordle_words_of_length(length)
+    deck_words = []
+    for word in get_words_of_length(length):
+        if word not in words_used_of_length:
+            deck_words.append(word)
+
+    word_deck = {
+        "words": deck_words,
+        "remainingAmount": len(deck_words)
+    }
+    word_decks[length] = word_deck
+    return word_deck
+
+def get_remaining_words_amount_of_length(length: int) -> int:
+    """
+        Returns the amount of words of the specified length which have not been used within the current game yet.
+    """
+
+    word_deck = get_word_deck_of_length(length)
+    remaining_words_amount = word_deck["remainingAmount"]
+    return remaining_words_amount
+
+def draw_unused_word_of_length(length: int) -> str:
+    """
+        Returns a random word of the specified length which has not been used within the current game yet, and marks it as used.
+        If all words of the specified length have been used, we raise a GameExhaustedError.
+    """
+
+    word_deck = get_word_deck_of_length(length)
+    deck_words = word_deck["words"]
+    remaining_amount = word_deck["remainingAmount"]
+
+    if remaining_amount == 0:
+        raise GameExhaustedError(f"All words of length {length} have already been used within the current game.")
+
+    # Swap the drawn word with the last unused word, so all unused words stay before the `remainingAmount` index
+    random_index = randrange(remaining_amount)
+    last_unused_index = remaining_amount - 1
+    drawn_word = deck_words[random_index]
+    deck_words[random_index] = deck_words[last_unused_index]
+    deck_words[last_unused_index] = drawn_word
+    word_deck["remainingAmount"] = last_unused_index
+
+    return drawn_word
+
+@profiled()
 def get_random_word() -> str:
     """
-        Returns a random word of any length.
+        Returns a random word of any length, which has not been used within the current game yet.
+        If all words of every length have been used, we raise a GameExhaustedError.
     """
 
-    while True:
-        random_length = choice(_words_lengths)
-        random_word_of_length = get_random_word_of_length(random_length)
-        
-        # If the random word has not been used yet, return it.
-        words_used_of_length = get_used_wordle_words_of_length(random_length)
-        if random_word_of_length not in words_used_of_length:
-            return random_word_of_length
+    words_lengths_with_remaining_words = []
+    for length in _words_lengths:
+        if get_remaining_words_amount_of_length(length) > 0:
+            words_lengths_with_remaining_words.append(length)
+
+    if len(words_lengths_with_remaining_words) == 0:
+        raise GameExhaustedError("All Wordle words have already been used within the current game.")
+
+    random_length = choice(words_lengths_with_remaining_words)
+    random_word = draw_unused_word_of_length(random_length)
+    return random_word
 
 def get_used_wordle_words_of_length(length: int) -> set:
     """
@@ -54,6 +149,7 @@ def get_used_wordle_words_of_length(length: int) -> set:
     used_wordle_words = set()
     
     # If the teams data is empty, we return an empty set
+    teams_data = get_teams_data()
     if len(teams_data) == 0:
         return used_wordle_words
     
@@ -76,6 +172,7 @@ def get_used_wordle_words() -> set:
     used_wordle_words = set()
     
     # If the teams data is empty, we return an empty set
+    teams_data = get_teams_data()
     if len(teams_data) == 0:
         return used_wordle_words
     
@@ -87,4 +184,21 @@ def get_used_wordle_words() -> set:
             word_to_guess = round_info["wordToGuess"]
             used_wordle_words.add(word_to_guess)
     
-    return used_wordle_words
\ No newline at end of file
+    return used_wordle_words
+
+def set_words_of_length(length: int, words: list[str]) -> None:
+    """
+        Replace the words list of the specified length, e.g. to benchmark the game with a bigger words list.
+        !Do note that the words index and the bots notice the new words list by itself, but the word decks of a running game are only rebuilt within the next game.
+    """
+
+    if length not in _words_lengths:
+        _words_lengths.append(length)
+    _words[length] = words
+
+def reset_word_decks() -> None:
+    """
+        Removes the word decks of the current game, so every word can be drawn again within the next game.
+    """
+
+    get_word_decks().clear()
\ No newline at end of file
@@ -1,17 +1,24 @@
 from lingo.lingo import ask_to_play_again, start_game
 from lingo.lingo_utils import print_message
+from lingo.lingo_output import flush_output
+from lingo.lingo_metrics import should_write_metrics, start_metrics_writer
 
 def main() -> None:
     """
         Start the Lingo game application.
     """
 
+    # Write the metrics file periodically, so the games on a shared host can be followed from a dashboard
+    if should_write_metrics():
+        start_metrics_writer()
+
     want_to_keep_playing = True
     while want_to_keep_playing:
         start_game()
         want_to_keep_playing = ask_to_play_again()
     
     print_message("Thanks for playing the game!")
+    flush_output()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+import sys
+import test_lib
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from importlib import import_module
+from io import StringIO
+from time import perf_counter
+from traceback import format_exc
+
+# The test suites, which run all of their tests when they are imported (see `tests.py`)
+TEST_SUITES = [
+    "lingo.lingo_tests",
+    "lingo.wordle.wordle_tests",
+    "lingo.bingo.bingo_tests",
+    "lingo.wordle.words.words_tests"
+]
+
+# This environment variable is set for the test runs which are started from within the tests themselves (see `test_parallel_tests` in `lingo/lingo_tests.py`),
+# so those test runs don't start test runs of their own
+NESTED_TEST_RUN_ENVIRONMENT_VARIABLE = "LINGO_NESTED_TEST_RUN"
+
+# Set this environment variable to 1 to also test whether this test runner reports the same results as `tests.py` (see `test_parallel_tests` in `lingo/lingo_tests.py`).
+# That test runs all test suites twice more, so it is only done when the parallel test runs themselves are being tested
+PARALLEL_TESTS_CHECK_ENVIRONMENT_VARIABLE = "LINGO_TEST_PARALLEL_TESTS"
+
+def run_test_suite(test_suite: str) -> dict:
+    """
+        Run all tests of the test suite within this worker process, and return everything the parent process needs to report them.
+        The output of the suite is kept, so the output of suites which run at the same time doesn't get mixed up.
+        If the suite raises an exception, it is reported as a failed test.
+        !Do note that the worker processes are reused for other suites, so the results of the previous suite are removed first, otherwise they would be reported again.
+    """
+
+    test_lib.data['results'].clear()
+    test_lib.data['failures'] = 0
+    test_lib.data['timings'].clear()
+    test_lib.data['lastTestAt'] = perf_counter()
+
+    output = StringIO()
+    with redirect_stdout(output):
+        try:
+            import_module(test_suite)
+        except Exception:
+            test_lib.data['failures'] += 1
+            test_lib.add_test_result(txt='{}: ' + test_suite, vars=['failed'], color='red')
+            test_lib.add_test_result(txt='  raised:   {}', vars=[format_exc()])
+            test_lib.add_test_result(txt='')
+
+    test_suite_results = {
+        "output": output.getvalue(),
+        "results": test_lib.data['results'],
+        "failures": test_lib.data['failures'],
+        "timings": test_lib.data['timings']
+    }
+    return test_suite_results
+
+def main() -> None:
+    """
+        Run each test suite within its own worker process, and report the results of all suites at once, in the same order as `tests.py`.
+        We exit with status 1 when any test has failed.
+        E.g. `python parallel_tests.py --workers 2`
+    """
+
+    parser = ArgumentParser(description="Run the test suites in parallel.")
+    parser.add_argument("--workers", type=int, default=len(TEST_SUITES), help="The amount of worker processes.")
+    arguments = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=arguments.workers) as executor:
+        all_test_suite_results = list(executor.map(run_test_suite, TEST_SUITES))
+
+    # Nothing has been tested within this process, so the results of the suites can be merged into it as they are
+    for test_suite_results in all_test_suite_results:
+        sys.stdout.write(test_suite_results["output"])
+        test_lib.data['results'].extend(test_suite_results["results"])
+        test_lib.data['failures'] += test_suite_results["failures"]
+        test_lib.data['timings'].update(test_suite_results["timings"])
+
+    test_lib.report()
+    sys.exit(1 if test_lib.data['failures'] > 0 else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+from argparse import ArgumentParser
+from time import perf_counter
+from lingo.lingo_bots import BOTS
+from lingo.lingo_simulator import simulate_games_in_parallel, write_game_results, get_output_format, get_simulation_summary
+
+def main() -> None:
+    """
+        Simulate whole Lingo games played by bots, to validate rule changes and to measure the throughput of the game engine.
+        E.g. `python simulate.py --games 10000 --bots filtering random --output results.jsonl`
+    """
+
+    parser = ArgumentParser(description="Simulate Lingo games played by bots.")
+    parser.add_argument("--games", type=int, default=1000, help="The amount of games to simulate.")
+    parser.add_argument("--bots", nargs="+", default=["filtering"], choices=list(BOTS), help="The bot of each team. When there are fewer bots than teams, the bots are reused.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="The amount of worker processes.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random number generators.")
+    parser.add_argument("--output", default=None, help="The .jsonl or .csv file to which the result of each game is written.")
+    arguments = parser.parse_args()
+
+    output_file = None
+    output_format = None
+    if arguments.output is not None:
+        output_format = get_output_format(arguments.output)
+        output_file = open(arguments.output, "w", newline="")
+
+    results_amount = {"won": 0, "lost": 0, "undecided": 0, "forfeited": 0}
+    turns = []
+    durations = []
+
+    start_time = perf_counter()
+    try:
+        for game_results in simulate_games_in_parallel(arguments.bots, arguments.games, arguments.workers, arguments.seed):
+            if output_file is not None:
+                write_game_results(output_file, output_format, game_results, write_header=(len(turns) == 0))
+
+            for game_result in game_results:
+                results_amount[game_result["result"]] += 1
+                turns.append(game_result["turns"])
+                durations.append(game_result["durationMs"])
+    finally:
+        if output_file is not None:
+            output_file.close()
+    elapsed_time = perf_counter() - start_time
+
+    simulation_summary = get_simulation_summary(results_amount, turns, durations, elapsed_time)
+    results = simulation_summary["results"]
+    print(f"Simulated {simulation_summary['games']} games in {elapsed_time:.1f} seconds ({simulation_summary['gamesPerSecond']:.0f} games/sec).")
+    print(f"Won: {results['won']}, lost: {results['lost']}, undecided: {results['undecided']}, forfeited: {results['forfeited']}.")
+    print(f"Game length in turns: p50 {simulation_summary['turnsP50']}, p99 {simulation_summary['turnsP99']}.")
+    print(f"Game length in milliseconds: p50 {simulation_summary['durationMsP50']:.2f}, p99 {simulation_summary['durationMsP99']:.2f}.")
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,24 @@
 import sys,time
 import builtins
+import os
 import re
 from colorama import init
 from termcolor import colored
 
 MAX_REPORT_STRING = 100
 
+# Set this environment variable to 1 to replay the fed inputs at once, instead of typing them out letter by letter (see `start`)
+FAST_MODE_ENVIRONMENT_VARIABLE = 'TEST_LIB_FAST'
+TYPING_DELAY = 0.1
+SLOWEST_TESTS_IN_REPORT = 10
+
 init()
 
-data = {'results':[], 'inputs': [], 'prompts': [], 'prints': [], 'active': True}
+# 'failures' holds the amount of failed tests, and 'timings' holds the seconds spent by each test function, by the file and name of that function.
+# The time between two calls to `test` is counted towards the test function which makes the second call
+data = {'results':[], 'inputs': [], 'prompts': [], 'prints': [], 'active': True,
+        'fast': os.environ.get(FAST_MODE_ENVIRONMENT_VARIABLE, '') not in ('', '0'),
+        'failures': 0, 'timings': {}, 'lastTestAt': time.perf_counter()}
 
 def print_colorvars(txt:str='{}', vars:list=[], color:str='yellow') -> None:
     vars = map(lambda string, color=color: colored(str(string), color, attrs=['bold']) ,vars)
@@ -39,8 +49,10 @@ def dialogue_test(title: str, inputs: list = [], prompts: list =[], prints: list
   data['prompts'].clear()
   expect_prompts(*prompts)
 
-def start():
+def start(fast: bool = None):
   data['active'] = True
+  if fast is not None:
+    data['fast'] = fast
 
 def stop():
   data['active'] = False
@@ -49,10 +61,26 @@ def add_test_result(txt:str='{}', vars:list=[], color:str='yellow'):
   data['results'].append({"txt": txt, "vars": vars, "color": color })
 
 def type_text(str):
+    if data['fast']:
+        sys.stdout.write(str)
+        sys.stdout.flush()
+        return
+
     for letter in str:
         sys.stdout.write(letter)
         sys.stdout.flush()
-        time.sleep(0.1)
+        time.sleep(TYPING_DELAY)
+
+def add_test_timing():
+  # The test function is the first caller outside of this file, since the input and print checks call `test` from here
+  frame = sys._getframe(2)
+  while frame.f_back is not None and frame.f_code.co_filename == __file__:
+    frame = frame.f_back
+  test_function = os.path.basename(frame.f_code.co_filename) + ':' + frame.f_code.co_name
+
+  now = time.perf_counter()
+  data['timings'][test_function] = data['timings'].get(test_function, 0) + now - data['lastTestAt']
+  data['lastTestAt'] = now
 
 def input(prompt: str = ''):
   # global data
@@ -95,6 +123,7 @@ def str_more(s: any, max: int) -> str:
  
 
 def test(name: str, expect: any, value: any):
+  add_test_timing()
   passed = False
   type_expected = ''
   type_got = type(value)
@@ -142,6 +171,7 @@ def test(name: str, expect: any, value: any):
       add_test_result(txt = '  with:     {}', vars=[str_more(value,MAX_REPORT_STRING)], color='white')
     
   else:
+    data['failures'] += 1
     add_test_result(txt = '{}: ' + name, vars=['failed'], color='red')
     add_test_result(txt = '  expected: {} : {}', vars=[str_type(type_expected),str_more(expect,MAX_REPORT_STRING)])
     add_test_result(txt = '  got:      {} : {}', vars=[str_type(type_got),str_more(value,MAX_REPORT_STRING)])
@@ -155,3 +185,14 @@ def report():
   while len(data['results']) > 0:
     line = data['results'].pop(0)
     print_colorvars(txt=line['txt'],vars=line['vars'], color=line['color'])
+  report_timings()
+
+def report_timings():
+  if len(data['timings']) == 0:
+    return
+  builtins.print('\n******** TEST TIMINGS *********')
+  total_time = sum(data['timings'].values())
+  print_colorvars(txt='{} test functions took {} seconds', vars=[len(data['timings']), f'{total_time:.2f}'], color='yellow')
+  slowest_tests = sorted(data['timings'].items(), key=lambda timing: timing[1], reverse=True)
+  for test_function, test_time in slowest_tests[:SLOWEST_TESTS_IN_REPORT]:
+    print_colorvars(txt='  {} {}', vars=[f'{test_time:8.3f}s', test_function], color='white')